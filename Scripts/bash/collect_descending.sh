@@ -2,6 +2,8 @@
 
 # Collect data in descending order from Feb 13, 2026 backwards
 # Stops when it encounters existing markdown files
+# Missing dates are collected with one --range run per stretch of consecutive days; its range
+# preflight writes quiet days as "no activity" without per-repo API calls
 
 SCRIPTS_DIR="$(cd "$(dirname "$0")/.." && pwd)"
 OBSIDIAN_PATH="$(cd "$(dirname "$0")/../.." && pwd)"
@@ -35,30 +37,31 @@ def file_exists_for_date(target_date):
     file_path = obsidian_path / "Calendar" / str(target_date.year) / month_name / f"{day_str}.md"
     return file_path.exists()
 
-def collect_for_date(target_date):
-    """Collect data for a single date"""
+def collect_range(since_date, until_date):
+    """Collect a run of missing dates with one --range call (a range preflight writes quiet days without per-repo calls)"""
+    label = since_date.isoformat() if since_date == until_date else f"{since_date} .. {until_date}"
     try:
-        print(f"📆 Collecting data for {target_date}")
+        print(f"📆 Collecting data for {label}")
         # Change to the Scripts directory to run as module
         scripts_dir = obsidian_path / "Scripts"
         result = subprocess.run([
             "python3", "-m", "data_collectors.main",
             "--config", str(scripts_dir / "config" / "unified_data_config.json"),
-            "--date", target_date.isoformat()
+            "--range", since_date.isoformat(), until_date.isoformat()
         ], cwd=str(scripts_dir / "python"), check=False, capture_output=True, text=True)
         
         if result.returncode != 0:
             error_msg = result.stderr if result.stderr else result.stdout
-            print(f"❌ Failed {target_date}: {error_msg[:300]}")
+            print(f"❌ Failed {label}: {error_msg[:300]}")
             return False
-        print(f"✅ Completed {target_date}")
+        print(f"✅ Completed {label}")
         return True
     except Exception as e:
-        print(f"❌ Error processing {target_date}: {e}")
+        print(f"❌ Error processing {label}: {e}")
         return False
 
-# Go backwards day by day
-collected = 0
+# Go backwards day by day to find the missing dates
+missing = []
 skipped = 0
 failed = []
 
@@ -81,12 +84,7 @@ while True:
                 print(f"✅ Reached existing date range. Stopping collection.")
                 break
     else:
-        # File doesn't exist, collect data
-        success = collect_for_date(current_date)
-        if success:
-            collected += 1
-        else:
-            failed.append(current_date)
+        missing.append(current_date)
     
     # Move to previous day
     current_date -= datetime.timedelta(days=1)
@@ -97,6 +95,22 @@ while True:
         print(f"✅ Reached Jan 1, 2026. Stopping collection.")
         break
 
+# One collector run per stretch of consecutive missing dates (never over an existing entry), newest first
+runs = []
+for day in missing:
+    if runs and runs[-1][0] - datetime.timedelta(days=1) == day:
+        runs[-1][0] = day
+    else:
+        runs.append([day, day])
+
+collected = 0
+for since_date, until_date in runs:
+    days = (until_date - since_date).days + 1
+    if collect_range(since_date, until_date):
+        collected += days
+    else:
+        failed.extend(since_date + datetime.timedelta(days=i) for i in range(days))
+
 print("")
 print("=" * 50)
 print(f"📊 Summary:")
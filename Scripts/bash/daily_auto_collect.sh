@@ -33,6 +33,8 @@ if [ ! -f "$CONFIG_PATH" ]; then
     exit 1
 fi
 
+# GITHUB_PREFLIGHT=events answers today from the event feeds (a few pages instead of ~3 calls per repo),
+# but feeds are truncated and delayed and miss repos you do not watch: opt in by setting it in the environment.
 export GITHUB_PREFLIGHT="${GITHUB_PREFLIGHT:-repos}"
 
 # Get today's date
@@ -27,7 +27,16 @@ fi
 # Preflight: Search API batched by repo:… OR … (committer-date + created) before hitting every repo.
 # Includes AI/bot commits (committer-date, not author-only). Personal accounts: use repos (default).
 # GITHUB_PREFLIGHT=author (cheap, misses AI commits). GITHUB_PREFLIGHT=namespace (org accounts). off = disable.
+# GITHUB_PREFLIGHT=events: answer the last 90 days from event feeds (few calls in total).
 export GITHUB_PREFLIGHT="${GITHUB_PREFLIGHT:-repos}"
+# The budget planner reads /rate_limit first and may run the full scan instead when it is cheaper (same
+# answer). GITHUB_PLAN=auto also lets it switch to search or event feeds, which can miss activity; check
+# keeps the one above, off skips planning. Preview a run with: python3 -m data_collectors.main --plan
+# Strategies are ranked by what they cost on earlier runs once they have 3 (logs/preflight_tuner.json,
+# which also remembers a namespace 422). A strategy whose "active" verdicts mostly found nothing, or that
+# mostly fell back to the full scan, is skipped. GITHUB_PREFLIGHT_TUNER=off ranks by estimates only.
+# GITHUB_WEBHOOKS=on answers days from the webhook receiver's log (bash/webhook_receiver.sh) and fetches
+# only repos it cannot vouch for; days the receiver was not up for go to the API as before.
 
 # Function to backfill date range (parallelized)
 backfill_range() {
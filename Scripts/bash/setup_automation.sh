@@ -10,6 +10,10 @@ PLIST_FILE="$SCRIPTS_DIR/config/$PLIST_NAME.plist"
 LAUNCH_AGENTS_DIR="$HOME/Library/LaunchAgents"
 INSTALLED_PLIST="$LAUNCH_AGENTS_DIR/$PLIST_NAME.plist"
 DAILY_SCRIPT="$SCRIPTS_DIR/bash/daily_auto_collect.sh"
+WEBHOOK_PLIST_NAME="com.obsidian.webhookreceiver"
+WEBHOOK_PLIST_FILE="$SCRIPTS_DIR/config/$WEBHOOK_PLIST_NAME.plist"
+WEBHOOK_INSTALLED_PLIST="$LAUNCH_AGENTS_DIR/$WEBHOOK_PLIST_NAME.plist"
+WEBHOOK_SCRIPT="$SCRIPTS_DIR/bash/webhook_receiver.sh"
 
 echo "🚀 Obsidian Daily Data Collection - Automation Setup"
 echo "======================================================"
@@ -28,12 +32,19 @@ show_usage() {
     echo "  status    - Check if automation is running"
     echo "  test      - Run data collection once manually"
     echo "  logs      - View recent automation logs"
+    echo "  webhooks-install   - Install and start the webhook receiver (keeps running)"
+    echo "  webhooks-uninstall - Stop and remove the webhook receiver"
     echo ""
 }
 
 # Function to update paths in plist file
+# Args (optional): plist file, label, program, log name prefix; default to the daily collection job.
 update_plist_paths() {
     local obsidian_path="$(cd "$SCRIPT_DIR/../.." && pwd)"
+    local plist_file="${1:-$PLIST_FILE}"
+    local label="${2:-$PLIST_NAME}"
+    local program="${3:-$DAILY_SCRIPT}"
+    local log_prefix="${4:-launchd}"
     
     # Use Python to update plist XML properly
     python3 <<PYTHON
@@ -41,7 +52,7 @@ import xml.etree.ElementTree as ET
 import os
 
 obsidian_path = "$obsidian_path"
-plist_path = "$PLIST_FILE"
+plist_path = "$plist_file"
 
 # Parse XML
 tree = ET.parse(plist_path)
@@ -66,11 +77,11 @@ def update_string_value(key_name, new_value):
     return False
 
 # Update all paths
-update_string_value('Label', 'com.obsidian.dailycollect')
-update_string_value('Program', os.path.join(obsidian_path, "Scripts", "bash", "daily_auto_collect.sh"))
+update_string_value('Label', "$label")
+update_string_value('Program', "$program")
 update_string_value('WorkingDirectory', obsidian_path)
-update_string_value('StandardOutPath', os.path.join(obsidian_path, "Scripts", "logs", "launchd_stdout.log"))
-update_string_value('StandardErrorPath', os.path.join(obsidian_path, "Scripts", "logs", "launchd_stderr.log"))
+update_string_value('StandardOutPath', os.path.join(obsidian_path, "Scripts", "logs", "${log_prefix}_stdout.log"))
+update_string_value('StandardErrorPath', os.path.join(obsidian_path, "Scripts", "logs", "${log_prefix}_stderr.log"))
 
 # Write back
 tree.write(plist_path, encoding='utf-8', xml_declaration=True)
@@ -268,6 +279,40 @@ view_logs() {
     tail -50 "$LOG_FILE"
 }
 
+# Function to install the webhook receiver (answers the nightly run from webhook deliveries)
+install_webhook_receiver() {
+    echo "📦 Installing webhook receiver..."
+    echo ""
+
+    update_plist_paths "$WEBHOOK_PLIST_FILE" "$WEBHOOK_PLIST_NAME" "$WEBHOOK_SCRIPT" "launchd_webhook"
+    chmod +x "$WEBHOOK_SCRIPT"
+    mkdir -p "$LAUNCH_AGENTS_DIR" "$SCRIPTS_DIR/logs"
+    cp "$WEBHOOK_PLIST_FILE" "$WEBHOOK_INSTALLED_PLIST"
+
+    if launchctl list 2>/dev/null | grep -q "$WEBHOOK_PLIST_NAME"; then
+        launchctl unload "$WEBHOOK_INSTALLED_PLIST" 2>/dev/null || true
+    fi
+    launchctl load "$WEBHOOK_INSTALLED_PLIST"
+
+    echo ""
+    echo "✅ Webhook receiver installed (http://127.0.0.1:\${GITHUB_WEBHOOK_PORT:-8765})"
+    echo "   Needs GITHUB_WEBHOOK_SECRET in .env (or github.webhook_secret), a tunnel to the port, and"
+    echo "   GITHUB_WEBHOOKS=on for the collection runs. Redeliver each hook's ping once so its repos count."
+    echo ""
+}
+
+# Function to uninstall the webhook receiver
+uninstall_webhook_receiver() {
+    echo "🗑️  Uninstalling webhook receiver..."
+    if launchctl list | grep -q "$WEBHOOK_PLIST_NAME"; then
+        launchctl unload "$WEBHOOK_INSTALLED_PLIST"
+    fi
+    if [ -f "$WEBHOOK_INSTALLED_PLIST" ]; then
+        rm "$WEBHOOK_INSTALLED_PLIST"
+    fi
+    echo "✅ Webhook receiver uninstalled"
+}
+
 # Parse command
 case "$1" in
     install)
@@ -294,6 +339,12 @@ case "$1" in
     logs)
         view_logs
         ;;
+    webhooks-install)
+        install_webhook_receiver
+        ;;
+    webhooks-uninstall)
+        uninstall_webhook_receiver
+        ;;
     *)
         show_usage
         exit 1
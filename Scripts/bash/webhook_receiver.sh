@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# GitHub webhook receiver
+# Appends push/pull_request/issues deliveries to logs/webhook_events.jsonl so collection runs with
+# GITHUB_WEBHOOKS=on answer days from it. Kept running by launchd (setup_automation.sh webhooks-install).
+# Secret: GITHUB_WEBHOOK_SECRET (.env) or github.webhook_secret in the config.
+
+# Configuration: Scripts/bash/ → Scripts = ..
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+SCRIPTS_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
+CONFIG_PATH="$SCRIPTS_DIR/config/unified_data_config.json"
+
+mkdir -p "$SCRIPTS_DIR/logs"
+cd "$SCRIPTS_DIR/python" || exit 1
+exec python3 -m data_collectors.webhook_receiver \
+    --config "$CONFIG_PATH" \
+    --host "${GITHUB_WEBHOOK_HOST:-127.0.0.1}" \
+    --port "${GITHUB_WEBHOOK_PORT:-8765}"
@@ -3,5 +3,14 @@ Data collector modules
 """
 
 from .github import GitHubCollector, fetch_commits_parallel_from_config
+from .async_engine import collect_repos_async, fetch_commits_parallel_async
+from .transport import GitHubTransport, get_transport
 
-__all__ = ['GitHubCollector', 'fetch_commits_parallel_from_config']
+__all__ = [
+    'GitHubCollector',
+    'fetch_commits_parallel_from_config',
+    'collect_repos_async',
+    'fetch_commits_parallel_async',
+    'GitHubTransport',
+    'get_transport',
+]
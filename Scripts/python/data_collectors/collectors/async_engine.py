@@ -0,0 +1,539 @@
+"""
+asyncio collection engine
+Same requests, retries and output dicts as the thread-pool path, multiplexed over one or two
+HTTP/2 connections (httpx) instead of blocking one OS thread per repo.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Optional, TextIO, Tuple
+
+from .github import (
+    GitHubCollector,
+    _access_denied_message,
+    _commits_all_branches_enabled,
+    _commits_range_access_denied,
+    _commits_range_headers,
+    _commits_range_summary,
+    _commits_range_window,
+    _count_created_in_window,
+    _created_desc_params,
+    _forbidden_or_ratelimit,
+    _load_commits_range_config,
+    _ndjson_line,
+    _next_page_url,
+    _rate_limit_is_error,
+    _rate_limit_wait_seconds,
+    _repo_commits_result,
+)
+from .branch_heads import branch_skip_reason, get_branch_head_cache
+from .concurrency import get_limiter
+from .day_window import Window, utc_timestamp
+from .deadline import DeadlineExceeded, check_deadline, deadline_async_sleep, deadline_timeout
+from .http_cache import get_http_cache
+from .transport import get_transport
+
+# Try to load httpx (+ h2 for HTTP/2) if available
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _async_max_inflight() -> int:
+    """Concurrent streams on the shared client (GITHUB_ASYNC_MAX_INFLIGHT, 1-64; default 16)."""
+    try:
+        n = int(os.getenv("GITHUB_ASYNC_MAX_INFLIGHT", "16"))
+    except ValueError:
+        n = 16
+    return max(1, min(n, 64))
+
+
+def _new_client(api_base: str, timeout: float = 30.0) -> "httpx.AsyncClient":
+    if not HTTPX_AVAILABLE:
+        raise RuntimeError("The async engine needs httpx: pip install 'httpx[http2]'")
+    inflight = _async_max_inflight()
+    # HTTP/2 (negotiated via TLS ALPN) multiplexes every stream over a couple of sockets;
+    # plain-http stand-ins and missing h2 fall back to HTTP/1.1, which needs one socket per stream.
+    multiplexed = HTTP2_AVAILABLE and api_base.startswith("https://")
+    connections = 2 if multiplexed else inflight
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=timeout,
+        # Renamed repos answer 301; follow like requests does (the registry learns from the history).
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=connections, max_keepalive_connections=connections),
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+
+class AsyncRequester:
+    """Shared client + in-flight cap; mirrors _github_request_with_retry for GETs."""
+
+    def __init__(self, client: "httpx.AsyncClient"):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(_async_max_inflight())
+        self.requests = 0
+
+    async def _send_limited(self, url: str, headers: Dict, params: Optional[Dict], timeout: int):
+        """Same AIMD budget as the thread pool (concurrency.py); waits on the loop instead of a thread."""
+        limiter = get_limiter(url)
+        check_deadline()
+        while True:
+            delay = limiter.try_acquire()
+            if not delay:
+                break
+            await deadline_async_sleep(delay, "waiting for a rate-limit slot")
+        loop = asyncio.get_running_loop()
+        response = None
+        start = loop.time()
+        try:
+            response = await self.client.get(url, headers=headers, params=params, timeout=deadline_timeout(timeout))
+            # Charged like the thread pool's requests, so the tuner's per-day cost covers this engine too.
+            get_transport().charge(url, response.status_code)
+            return response
+        finally:
+            limiter.release(response, loop.time() - start)
+
+    async def get(self, url: str, headers: Dict, params: Optional[Dict] = None, max_retries: int = 3, timeout: int = 10):
+        retry_count = 0
+        last_exception = None
+        cache = get_http_cache()
+        cache_key = cache.key(url, params, headers) if cache else None
+        cached = cache.lookup(cache_key) if cache_key else None
+
+        while retry_count <= max_retries:
+            try:
+                request_headers = headers
+                if cached:
+                    request_headers = dict(headers, **cache.conditional_headers(cached))
+                async with self.semaphore:
+                    self.requests += 1
+                    response = await self._send_limited(url, request_headers, params, timeout)
+
+                if cached and response.status_code == 304:
+                    return cache.replay(cache_key, cached, response)
+
+                if response.status_code == 403 and _rate_limit_is_error(response):
+                    wait_time = _rate_limit_wait_seconds(response)
+                    if wait_time is not None and wait_time > 0:
+                        reset_time = datetime.fromtimestamp(datetime.now().timestamp() + wait_time).strftime("%H:%M:%S")
+                        logging.warning(
+                            f"Rate limit exceeded. Waiting {wait_time} seconds until reset at {reset_time}..."
+                        )
+                        await deadline_async_sleep(wait_time + 1, "rate-limit reset")
+                        retry_count += 1
+                        continue
+                    logging.warning("Rate limit exceeded but no reset time available. Waiting 60 seconds...")
+                    await deadline_async_sleep(60, "rate-limit reset")
+                    retry_count += 1
+                    continue
+
+                if response.status_code == 429:
+                    wait_time = _rate_limit_wait_seconds(response) or 60
+                    logging.warning(f"Rate limit exceeded (429). Waiting {wait_time} seconds...")
+                    await deadline_async_sleep(wait_time + 1, "rate-limit reset")
+                    retry_count += 1
+                    continue
+
+                if response.status_code in [500, 502, 503, 504]:
+                    if retry_count < max_retries:
+                        wait_time = 2**retry_count
+                        logging.warning(
+                            f"Server error {response.status_code}. Retrying in {wait_time} seconds... "
+                            f"(attempt {retry_count + 1}/{max_retries + 1})"
+                        )
+                        await deadline_async_sleep(wait_time)
+                        retry_count += 1
+                        continue
+                    response.raise_for_status()
+
+                if response.status_code == 200:
+                    if cache_key:
+                        cache.store(cache_key, response)
+                    return response
+
+                if response.status_code == 408 and retry_count < max_retries:
+                    wait_time = 2**retry_count
+                    logging.warning(f"Status {response.status_code}. Retrying in {wait_time} seconds...")
+                    await deadline_async_sleep(wait_time)
+                    retry_count += 1
+                    continue
+
+                return response
+
+            except httpx.TimeoutException:
+                if retry_count < max_retries:
+                    wait_time = 2**retry_count
+                    logging.warning(
+                        f"Request timeout. Retrying in {wait_time} seconds... "
+                        f"(attempt {retry_count + 1}/{max_retries + 1})"
+                    )
+                    await deadline_async_sleep(wait_time)
+                    retry_count += 1
+                    continue
+                raise
+
+            except httpx.TransportError as e:
+                if retry_count < max_retries:
+                    wait_time = 2**retry_count
+                    logging.warning(
+                        f"Connection error. Retrying in {wait_time} seconds... "
+                        f"(attempt {retry_count + 1}/{max_retries + 1})"
+                    )
+                    await deadline_async_sleep(wait_time)
+                    retry_count += 1
+                    last_exception = e
+                    continue
+                raise
+
+        if last_exception:
+            raise last_exception
+        raise Exception(f"Failed after {max_retries + 1} attempts")
+
+
+async def _list_branch_heads_async(
+    collector: GitHubCollector, http: AsyncRequester, owner_repo: str, repo: str
+) -> List[Tuple[str, str]]:
+    branches_url = collector._repo_resource_url(owner_repo, repo, "branches")
+    heads: List[Tuple[str, str]] = []
+    page = 1
+    max_pages = 5
+    per_page = 100
+    while page <= max_pages:
+        try:
+            response = await http.get(branches_url, collector.headers, params={"per_page": per_page, "page": page})
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to fetch branches page {page} for {repo}: {e}")
+            break
+        if response.status_code != 200:
+            break
+        batch = response.json()
+        if not batch:
+            break
+        heads.extend((b["name"], (b.get("commit") or {}).get("sha", "")) for b in batch)
+        if len(batch) < per_page:
+            break
+        page += 1
+    return heads
+
+
+async def _walk_branch_for_date_async(
+    collector: GitHubCollector,
+    http: AsyncRequester,
+    commits_url: str,
+    repo: str,
+    branch: Optional[str],
+    window: Window,
+    seen_commits: set,
+    commit_details: List[Dict],
+    walked: Optional[set] = None,
+    stop_at: Optional[set] = None,
+) -> Optional[List[Dict]]:
+    first_page: Optional[List[Dict]] = None
+    page = 1
+    max_pages = 20
+    while page <= max_pages:
+        params = {
+            "since": window[0],
+            "until": window[1],
+            "per_page": 100,
+            "page": page,
+        }
+        if branch:
+            params["sha"] = branch
+        try:
+            response = await http.get(commits_url, collector.headers, params=params)
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to fetch commits for {repo} (branch={branch}, page={page}): {e}")
+            break
+        if response.status_code == 403:
+            _forbidden_or_ratelimit(response, repo, "commits")
+        if page == 1 and branch is None:
+            collector._note_repo_response(collector._owner_repo(repo), response)
+        if response.status_code != 200:
+            break
+        commits_data = response.json()
+        if page == 1:
+            first_page = commits_data
+        if not commits_data:
+            break
+        stop = collector._process_commits_page(commits_data, window, seen_commits, commit_details, walked, stop_at)
+        if stop:
+            break
+        if len(commits_data) < 100:
+            break
+        page += 1
+    return first_page
+
+
+async def _fetch_commits_for_repo_async(
+    collector: GitHubCollector,
+    http: AsyncRequester,
+    owner_repo: str,
+    repo: str,
+    window: Window,
+    seen_commits: set,
+    commit_details: List[Dict],
+) -> int:
+    commits_url = collector._commits_list_url(owner_repo, repo)
+    heads: List[Tuple[str, str]] = []
+    if _commits_all_branches_enabled():
+        try:
+            heads = await _list_branch_heads_async(collector, http, owner_repo, repo)
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to list branches for {repo}, using default: {e}")
+
+    initial_len = len(commit_details)
+
+    default_walked: set = set()
+    await _walk_branch_for_date_async(
+        collector, http, commits_url, repo, None, window, seen_commits, commit_details, walked=default_walked
+    )
+
+    cache = get_branch_head_cache() if heads else None
+    for name, sha in heads:
+        if branch_skip_reason(cache, owner_repo, name, sha, window[0], default_walked):
+            continue
+        first_page = await _walk_branch_for_date_async(
+            collector, http, commits_url, repo, name, window, seen_commits, commit_details, stop_at=default_walked
+        )
+        if cache:
+            cache.record(owner_repo, name, sha, first_page, window)
+
+    return len(commit_details) - initial_len
+
+
+async def _count_created_async(
+    collector: GitHubCollector, http: AsyncRequester, url: str, repo: str, resource: str, window: Window
+) -> int:
+    """Async counterpart of _list_created_since + _count_created_in_window."""
+    items: List[Dict] = []
+    page = 1
+    max_pages = 10
+    while page <= max_pages:
+        try:
+            response = await http.get(url, collector.headers, params=_created_desc_params(url, window[0], page))
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to fetch {resource} for {repo} (page={page}): {e}")
+            break
+        _forbidden_or_ratelimit(response, repo, resource)
+        if response.status_code != 200:
+            break
+        batch = response.json()
+        items.extend(batch)
+        if len(batch) < 100 or utc_timestamp(batch[-1].get("created_at") or "") < window[0]:
+            break
+        page += 1
+    return _count_created_in_window(items, window)
+
+
+async def fetch_repo_data_async(collector: GitHubCollector, http: AsyncRequester, repo: str, date_str: str) -> Dict:
+    """Async counterpart of GitHubCollector._fetch_repo_data; commits, PRs and issues run concurrently."""
+    seen_commits: set = set()
+    commit_details: List[Dict] = []
+    owner_repo = collector._owner_repo(repo)
+    window = collector._day_window(date_str)
+
+    async def commits() -> int:
+        try:
+            return await _fetch_commits_for_repo_async(
+                collector, http, owner_repo, repo, window, seen_commits, commit_details
+            )
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to fetch commits for {repo}: {e}")
+            return 0
+
+    repo_commits, repo_prs, repo_issues = await asyncio.gather(
+        commits(),
+        _count_created_async(
+            collector, http, collector._repo_resource_url(owner_repo, repo, "pulls"), repo, "PRs", window
+        ),
+        _count_created_async(
+            collector, http, collector._repo_resource_url(owner_repo, repo, "issues"), repo, "issues", window
+        ),
+    )
+
+    display_name = owner_repo.split("/")[-1] if "/" in owner_repo else repo
+    return {
+        "repo": display_name,
+        "commits": repo_commits,
+        "prs": repo_prs,
+        "issues": repo_issues,
+        "commit_details": commit_details,
+    }
+
+
+async def _collect_repos(collector: GitHubCollector, repos: List[str], date_str: str) -> Tuple[List[Dict], List[str]]:
+    async with _new_client(collector.api_base) as client:
+        http = AsyncRequester(client)
+        outcomes = await asyncio.gather(
+            *(fetch_repo_data_async(collector, http, repo, date_str) for repo in repos), return_exceptions=True
+        )
+    results: List[Dict] = []
+    error_repos: List[str] = []
+    for repo, outcome in zip(repos, outcomes):
+        if isinstance(outcome, PermissionError):
+            error_repos.append(repo)
+            logging.error(f"403 Forbidden error for {repo}: {outcome}")
+        elif isinstance(outcome, BaseException):
+            logging.error(f"Error processing {repo}: {outcome}")
+        else:
+            results.append(outcome)
+    return results, error_repos
+
+
+def collect_repos_async(collector: GitHubCollector, repos: List[str], date_str: str) -> Tuple[List[Dict], List[str]]:
+    """Drop-in for GitHubCollector._fanout_threads: (results, repos that hit 403)."""
+    return asyncio.run(_collect_repos(collector, repos, date_str))
+
+
+async def _iter_repo_commit_pages_async(
+    http: AsyncRequester, owner_repo: str, token: str, since_iso: str, until_iso: str, api_base: str
+) -> AsyncIterator[Dict]:
+    """Async counterpart of _iter_repo_commit_pages (Link rel="next" pagination)."""
+    url: Optional[str] = f"{api_base}/repos/{owner_repo}/commits"
+    params: Optional[Dict] = {"since": since_iso, "until": until_iso, "per_page": 100}
+    headers = _commits_range_headers(token)
+    while url:
+        try:
+            resp = await http.get(url, headers, params=params, timeout=30)
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            yield {"repository": owner_repo, "error": str(e), "commits": []}
+            return
+        page = _repo_commits_result(owner_repo, resp)
+        yield page
+        if page.get("error"):
+            return
+        url, params = _next_page_url(resp), None
+
+
+async def _fetch_repo_commits_async(
+    http: AsyncRequester, owner_repo: str, token: str, since_iso: str, until_iso: str, api_base: str
+) -> Dict:
+    commits: List[Dict] = []
+    async for page in _iter_repo_commit_pages_async(http, owner_repo, token, since_iso, until_iso, api_base):
+        if page.get("error"):
+            return dict(page, commits=commits)
+        commits.extend(page["commits"])
+    return {"repository": owner_repo, "commits": commits}
+
+
+async def _fetch_commits_parallel(config_path: str, since_date: date, until_date: date) -> Dict:
+    token, _, repos, day_tz, api_base = _load_commits_range_config(config_path)
+    since_iso, until_iso = _commits_range_window(since_date, until_date, day_tz)
+    async with _new_client(api_base) as client:
+        http = AsyncRequester(client)
+        outcomes = await asyncio.gather(
+            *(_fetch_repo_commits_async(http, repo, token, since_iso, until_iso, api_base) for repo in repos),
+            return_exceptions=True,
+        )
+    # Same outcomes as the thread path (_drain_repo_tasks): stop on 403s, "not fetched" for the rest.
+    per_repo: Dict[str, Dict] = {}
+    error_repos: List[str] = []
+    for repo, outcome in zip(repos, outcomes):
+        if not isinstance(outcome, BaseException):
+            per_repo[repo] = outcome
+            continue
+        if isinstance(outcome, PermissionError):
+            error_repos.append(repo)
+            logging.error(f"403 Forbidden error for {repo}: {outcome}")
+        elif isinstance(outcome, DeadlineExceeded):
+            logging.info(f"Skipped {repo}: run deadline reached.")
+        elif isinstance(outcome, Exception):
+            logging.error(f"Error processing {repo}: {outcome}")
+        else:
+            raise outcome
+        per_repo[repo] = {"repository": repo, "error": "not fetched", "commits": []}
+    if error_repos:
+        raise PermissionError(_access_denied_message(error_repos, "Process stopped."))
+    return _commits_range_summary(since_date, until_date, repos, per_repo)
+
+
+def fetch_commits_parallel_async(config_path: str, since_date: date, until_date: date) -> Dict:
+    """Async counterpart of fetch_commits_parallel_from_config (same summary dict)."""
+    return asyncio.run(_fetch_commits_parallel(config_path, since_date, until_date))
+
+
+async def _stream_commits_range(config_path: str, since_date: date, until_date: date, out: TextIO) -> Dict:
+    token, _, repos, day_tz, api_base = _load_commits_range_config(config_path)
+    since_iso, until_iso = _commits_range_window(since_date, until_date, day_tz)
+    counts = {"repositories": len(repos), "commits": 0, "errors": 0}
+    if not repos:
+        return counts
+
+    pages: "asyncio.Queue[Optional[Dict]]" = asyncio.Queue(maxsize=_async_max_inflight() * 2)
+    stop = asyncio.Event()
+    denied: List[str] = []
+
+    async with _new_client(api_base) as client:
+        http = AsyncRequester(client)
+
+        async def produce(repo: str) -> None:
+            try:
+                async for page in _iter_repo_commit_pages_async(http, repo, token, since_iso, until_iso, api_base):
+                    if stop.is_set():
+                        return
+                    await pages.put(page)
+            except PermissionError:
+                denied.append(repo)
+                stop.set()
+            except DeadlineExceeded:
+                stop.set()
+            finally:
+                await pages.put(None)
+
+        producers = [asyncio.ensure_future(produce(repo)) for repo in repos]
+        finished = 0
+        while finished < len(repos):
+            page = await pages.get()
+            if page is None:
+                finished += 1
+                continue
+            if stop.is_set():
+                continue
+            try:
+                if page.get("error"):
+                    counts["errors"] += 1
+                    out.write(_ndjson_line(page))
+                    if _commits_range_access_denied(page):
+                        denied.append(page["repository"])
+                        stop.set()
+                    continue
+                for record in page["commits"]:
+                    out.write(_ndjson_line(page, record))
+                counts["commits"] += len(page["commits"])
+                out.flush()
+            except BrokenPipeError:
+                stop.set()
+        await asyncio.gather(*producers, return_exceptions=True)
+
+    if denied:
+        raise PermissionError(_access_denied_message(denied, "Process stopped."))
+    return counts
+
+
+def stream_commits_range_async(config_path: str, since_date: date, until_date: date, out: TextIO) -> Dict:
+    """Async counterpart of stream_commits_range_from_config (same NDJSON lines and counts)."""
+    return asyncio.run(_stream_commits_range(config_path, since_date, until_date, out))
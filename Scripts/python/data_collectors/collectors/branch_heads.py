@@ -0,0 +1,133 @@
+"""
+Branch head cache for all-branches commit scans
+Remembers each branch's head sha and how old that head is, so stale branches cost no commit calls
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .day_window import utc_timestamp
+
+# collectors/branch_heads.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_CACHE_FILE = SCRIPTS_DIR / "logs" / "branch_heads.json"
+
+
+def _branch_head_cache_enabled() -> bool:
+    return os.getenv("GITHUB_BRANCH_HEAD_CACHE", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+class BranchHeadCache:
+    """
+    {owner/name: {branch: {"sha": head sha, "before": UTC timestamp}}} in one JSON file.
+
+    "before" is an exclusive bound on the head's committer date: nothing on that branch is dated at or
+    after it while the head is still `sha`. Shas are immutable, so a bound stays valid until the
+    branch moves; a moved head simply misses the cache. (Older files hold a bare YYYY-MM-DD, which
+    sorts before that day's timestamps and so still reads as midnight UTC.)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._counts = {"stale_skipped": 0, "shared_skipped": 0, "walked": 0}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data: Dict[str, Dict[str, Dict]] = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def before(self, repo: str, branch: str, sha: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(repo, {}).get(branch)
+        if entry and entry.get("sha") == sha:
+            return entry.get("before")
+        return None
+
+    def record(
+        self, repo: str, branch: str, sha: str, first_page: Optional[List[Dict]], window: Tuple[str, str]
+    ) -> None:
+        """
+        Learn the head's bound from the first page of a since/until walk over `window`: an empty page
+        means the head predates the window (only if the window reaches now; a historical window says
+        nothing about newer commits); a page starting at the head gives its exact committer date.
+        """
+        if first_page is None:
+            return
+        if not first_page:
+            if window[1] < datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"):
+                return
+            before = window[0]
+        elif first_page[0].get("sha") == sha:
+            head_at = datetime.strptime(
+                utc_timestamp(first_page[0]["commit"]["committer"]["date"]), "%Y-%m-%dT%H:%M:%SZ"
+            )
+            before = (head_at + timedelta(seconds=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        else:
+            return
+        with self._lock:
+            self._data.setdefault(repo, {})[branch] = {"sha": sha, "before": before}
+            self._dirty = True
+
+    def note(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._data)
+            self._dirty = False
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.debug("Branch head cache write failed (%s): %s", self.path, e)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, repos=len(self._data))
+
+
+_cache: Optional[BranchHeadCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_branch_head_cache() -> Optional[BranchHeadCache]:
+    """Process-wide cache (flushed at exit), or None when GITHUB_BRANCH_HEAD_CACHE=off."""
+    global _cache
+    if not _branch_head_cache_enabled():
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = BranchHeadCache(Path(os.getenv("GITHUB_BRANCH_HEAD_CACHE_FILE") or DEFAULT_CACHE_FILE))
+            atexit.register(_cache.flush)
+        return _cache
+
+
+def branch_skip_reason(
+    cache: Optional[BranchHeadCache], repo: str, branch: str, sha: str, since_iso: str, default_walked: set
+) -> Optional[str]:
+    """
+    "shared" when the head is already in the default branch's walk (its history adds nothing),
+    "stale" when the cached head predates since_iso (UTC window start); None = walk it.
+    """
+    if sha and sha in default_walked:
+        outcome = "shared_skipped"
+    else:
+        before = cache.before(repo, branch, sha) if cache else None
+        outcome = "stale_skipped" if before and before <= since_iso else None
+    if cache:
+        cache.note(outcome or "walked")
+    return outcome
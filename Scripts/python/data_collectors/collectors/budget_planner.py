@@ -0,0 +1,424 @@
+"""
+Pre-run rate-limit budget planner
+Reads the free /rate_limit endpoint and estimates what a run will cost per budget (core, search, graphql)
+from the repo count, preflight mode, backend, branch mode and date range. A single day runs the cheaper
+of the configured strategy and the full scan (GITHUB_PLAN=auto: of every strategy) that fits what is
+left; a backfill too big for what is left is split into repo batches, one per reset window. Estimates are rough (one page per list, activity taken from the previous run), so a 20%
+margin is kept; a day's strategies are ranked by measured costs instead once preflight_tuner.py has them.
+"""
+
+import logging
+import math
+import os
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from .deadline import DeadlineExceeded, deadline_remaining, deadline_sleep
+from .github import (
+    _EVENTS_MAX_AGE_DAYS,
+    GitHubCollector,
+    _collector_backend,
+    _commits_all_branches_enabled,
+    _graphql_batch_size,
+    _preflight_mode,
+)
+from .preflight_tuner import tune_candidates
+from .store import get_activity_store
+from .webhook_log import get_webhook_log
+
+BUDGETS = ("core", "search", "graphql")
+# Share of configured repos with activity on a day, when the previous run does not say.
+DEFAULT_ACTIVE_FRACTION = 0.25
+_MARGIN = 1.2
+
+
+def planner_mode() -> str:
+    """
+    GITHUB_PLAN: "equivalent" (default) picks the cheaper of the configured strategy and the full scan,
+    which give the same answer; "auto" picks the cheapest of all strategies, including search and event
+    feeds, which can miss activity; "check" keeps the configured strategy. All three wait for a reset or
+    split backfills; "off" skips planning.
+    """
+    v = os.getenv("GITHUB_PLAN", "").strip().lower()
+    if v in ("0", "false", "no", "off"):
+        return "off"
+    if v in ("check", "auto"):
+        return v
+    return "equivalent"
+
+
+def _equivalent(name: str, configured: str) -> bool:
+    """
+    Whether strategy `name` answers a day like `configured`: itself, or the full scan ("off"), which every
+    preflight only trims. Search collection sees default branches only, skips forks and lags its index;
+    event feeds are truncated and delayed.
+    """
+    return name in (configured, "off")
+
+
+def fetch_rate_limit(collector: GitHubCollector) -> Optional[Dict[str, Dict]]:
+    """{budget: {limit, remaining, reset}} from GET /rate_limit (free), or None when it cannot be read."""
+    try:
+        response = collector._make_request_with_retry(f"{collector.api_base}/rate_limit", max_retries=1)
+    except (PermissionError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        logging.info("Planner: /rate_limit failed (%s); planning without a budget.", e)
+        return None
+    if response.status_code != 200:
+        # GitHub Enterprise with rate limiting disabled answers 404.
+        logging.info("Planner: /rate_limit HTTP %s; planning without a budget.", response.status_code)
+        return None
+    resources = (response.json() or {}).get("resources") or {}
+    out = {}
+    for name in BUDGETS:
+        r = resources.get(name)
+        if r:
+            out[name] = {"limit": int(r.get("limit", 0)), "remaining": int(r.get("remaining", 0)), "reset": int(r.get("reset", 0))}
+    return out or None
+
+
+def _phase(name: str, budget: str, calls: float) -> Dict:
+    return {"phase": name, "budget": budget, "calls": int(math.ceil(calls))}
+
+
+def _totals(phases: List[Dict]) -> Dict[str, int]:
+    totals = {name: 0 for name in BUDGETS}
+    for p in phases:
+        totals[p["budget"]] += p["calls"]
+    return totals
+
+
+class _Shape:
+    """What a run touches: repos, owners, backend, branch mode, how long ago the window starts."""
+
+    def __init__(
+        self,
+        collector: GitHubCollector,
+        since: date,
+        until: date,
+        active_fraction: Optional[float],
+        repos: Optional[List[str]] = None,
+    ):
+        self.collector = collector
+        self.repos = collector._normalized_repo_list() if repos is None else [collector._owner_repo(r) for r in repos]
+        self.n = len(self.repos)
+        self.other_owners = len(
+            {r.split("/")[0].lower() for r in self.repos} - {(collector.username or "").lower()}
+        )
+        self.since = since
+        self.days = (until - since).days + 1
+        self.age_days = max(0, (date.today() - since).days)
+        self.backend = _collector_backend(collector.backend)
+        self.all_branches = _commits_all_branches_enabled()
+        self.active = min(1.0, max(0.0, DEFAULT_ACTIVE_FRACTION if active_fraction is None else active_fraction))
+
+    def pushed_fraction(self) -> float:
+        """Share of repos pushed to since the window began: grows with how far back it starts."""
+        return min(1.0, self.active * (1 + self.age_days))
+
+    def commit_calls(self) -> int:
+        """REST commit-list calls per repo and day: the default branch, plus branch list and changed heads."""
+        return 1 + (2 if self.all_branches else 0)
+
+    def repo_calls(self) -> Dict[str, float]:
+        """Calls per repo per budget for one day (lists assumed to fit one page)."""
+        if self.backend == "graphql":
+            return {"graphql": 1.0 / _graphql_batch_size()}
+        return {"core": (0 if self.backend == "git" else self.commit_calls()) + 2}
+
+    def range_repo_calls(self) -> Dict[str, float]:
+        """Calls per repo for a multi-day window: extra commit pages about monthly, PR/issue pages quarterly."""
+        if self.days == 1:
+            return self.repo_calls()
+        commits = 0 if self.backend == "git" else (1 + self.days // 30) * (3 if self.all_branches else 1)
+        return {"core": commits + 2 * (1 + self.days // 90)}
+
+    def idle_repo_calls(self) -> int:
+        """PR and issue listings for a repo not pushed to since the window began (its commit fetch is skipped)."""
+        return 2 * (1 + self.days // 90)
+
+    def prune_calls(self) -> int:
+        """_prune_idle_repos: /user/repos, plus one listing per other owner."""
+        if os.getenv("GITHUB_PUSHED_AT_PRUNE", "").strip().lower() in ("0", "false", "no", "off"):
+            return 0
+        return 1 + self.other_owners
+
+    def search_queries(self) -> int:
+        """Repo-scoped search queries for one kind (commits or issues), as _chunk_repo_search_queries builds them."""
+        day = self.collector._search_day(self.since.isoformat())
+        return len(self.collector._chunk_repo_search_queries(f"committer-date:{day}"))
+
+
+def _idle_phases(shape: _Shape, share: float) -> List[Dict]:
+    if share >= 1.0 or not shape.prune_calls():
+        return []
+    return [_phase("PR/issue listing (repos not pushed to)", "core", shape.idle_repo_calls() * shape.n * (1 - share))]
+
+
+def _fanout_phases(shape: _Shape, share: float, label: str) -> List[Dict]:
+    per_repo = shape.repo_calls()
+    return [_phase(f"{label} ({shape.backend})", budget, calls * shape.n * share) for budget, calls in per_repo.items()]
+
+
+def _day_candidates(shape: _Shape, configured: str) -> Dict[str, List[Dict]]:
+    """
+    Phases per preflight strategy that can answer the day. Only the configured one and "off" give the
+    same answer (_equivalent); the others are candidates for GITHUB_PLAN=auto and the --plan report.
+    """
+    store = get_activity_store()
+    collector = shape.collector
+    window = collector._day_window(shape.since.isoformat())
+    if store and shape.n and all(store.covers(r, window) for r in shape.repos):
+        # One head check per repo whose day is not settled yet (store.head_check_due).
+        due = sum(1 for r in shape.repos if store.head_check_due(r, window))
+        return {configured: [_phase("activity store head checks", "core", due)]}
+    log = get_webhook_log()
+    if log and shape.n and log.covers_window(window):
+        # Answered from the webhook log; only repos it cannot vouch for are fetched.
+        return {configured: [_phase("webhook event log", "core", 0)]}
+
+    prune = _phase("pushed_at listing", "core", shape.prune_calls())
+    pruned = _fanout_phases(shape, shape.pushed_fraction(), "per-repo fetch") + _idle_phases(shape, shape.pushed_fraction())
+    candidates: Dict[str, List[Dict]] = {"off": [prune] + pruned}
+
+    queries = shape.search_queries()
+    try:
+        max_queries = int(os.getenv("GITHUB_PREFLIGHT_MAX_SEARCH_QUERIES", "24"))
+    except ValueError:
+        max_queries = 24
+    if queries and 2 * queries <= max_queries:
+        candidates["repos"] = [_phase("preflight search", "search", 2 * queries)] + _fanout_phases(
+            shape, shape.active, "per-repo fetch (active repos)"
+        )
+        if not shape.all_branches:
+            candidates["search"] = [_phase("search collection", "search", 2 * queries)]
+    if shape.age_days < _EVENTS_MAX_AGE_DAYS and collector.username:
+        feeds = 2 + shape.other_owners
+        candidates["events"] = [
+            _phase("event feeds", "core", feeds),
+            _phase("commit walks (pushed repos)", "core", shape.commit_calls() * shape.n * shape.pushed_fraction()),
+        ]
+    if configured in ("author", "namespace"):
+        candidates[configured] = [_phase(f"{configured} preflight", "search", 2), prune] + pruned
+    return candidates
+
+
+def _fits(totals: Dict[str, int], rate: Optional[Dict[str, Dict]]) -> bool:
+    """Core and GraphQL totals (with margin) within what is left. Search refills every minute: always fits."""
+    if not rate:
+        return True
+    return all(
+        totals[b] * _MARGIN <= rate[b]["remaining"] for b in ("core", "graphql") if b in rate and totals[b]
+    )
+
+
+def _primary_cost(totals: Dict[str, int]) -> tuple:
+    # Core and GraphQL are hourly budgets; search (30/minute) only breaks ties.
+    return (totals["core"] + totals["graphql"], totals["search"])
+
+
+def _seconds_to_reset(rate: Optional[Dict[str, Dict]], budget: str) -> int:
+    if not rate or budget not in rate:
+        return 0
+    return max(0, rate[budget]["reset"] - int(time.time())) + 1
+
+
+def plan_day(
+    collector: GitHubCollector, target_date: date, rate: Optional[Dict[str, Dict]], active_fraction: Optional[float] = None
+) -> Dict:
+    """
+    Plan for collect_data_for_date: estimated calls per strategy, the chosen one (cheapest equivalent one
+    that fits by default, cheapest of all in "auto" mode, the configured one in "check" mode) and how long
+    to wait for a reset when even that does not fit.
+    With the tuner on, strategies the account cannot use or whose verdicts were too often wrong are dropped,
+    and strategies with enough runs are ranked by what they really cost ("tuning" records which).
+    """
+    configured = _preflight_mode() or "off"
+    shape = _Shape(collector, target_date, target_date, active_fraction)
+    candidates = {name: {"phases": phases, "totals": _totals(phases)} for name, phases in _day_candidates(shape, configured).items()}
+    totals = {name: c["totals"] for name, c in candidates.items()}
+    tuning = tune_candidates(collector, totals, configured, shape.n, shape.backend)
+    if tuning:
+        for name in list(tuning["unsupported"]) + list(tuning["inaccurate"]):
+            if name != "off":
+                candidates.pop(name, None)
+        for name, totals in tuning["measured"].items():
+            if name in candidates:
+                candidates[name]["totals"] = totals
+    if configured not in candidates:
+        # The configured mode does not apply here (e.g. events for an old date, namespace search on a
+        # personal account); the collector falls back.
+        configured = "off"
+    chosen = configured
+    mode = planner_mode()
+    if mode in ("auto", "equivalent"):
+        pool = [name for name in candidates if mode == "auto" or _equivalent(name, configured)]
+        fitting = [name for name in pool if _fits(candidates[name]["totals"], rate)]
+        chosen = min(fitting or pool, key=lambda name: (_primary_cost(candidates[name]["totals"]), name != configured))
+    totals = candidates[chosen]["totals"]
+    fits = _fits(totals, rate)
+    if tuning:
+        tuning = dict(tuning, chosen=chosen, basis="measured" if chosen in tuning["measured"] else "estimated")
+    return {
+        "kind": "day",
+        "target_date": target_date.isoformat(),
+        "repositories": shape.n,
+        "backend": shape.backend,
+        "all_branches": shape.all_branches,
+        "active_fraction": round(shape.active, 3),
+        "configured": configured,
+        "strategy": chosen,
+        "candidates": {name: c["totals"] for name, c in candidates.items()},
+        "phases": candidates[chosen]["phases"],
+        "estimated": totals,
+        "rate_limit": rate,
+        "fits": fits,
+        "windows": 1 if fits else 2,
+        "wait_seconds": 0 if fits else _seconds_to_reset(rate, "graphql" if totals["graphql"] else "core"),
+        "tuning": tuning,
+    }
+
+
+def plan_range(
+    collector: GitHubCollector,
+    since: date,
+    until: date,
+    rate: Optional[Dict[str, Dict]],
+    active_fraction: Optional[float] = None,
+    commits_only: bool = False,
+    repos: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Plan for collect_data_for_range over `repos` (default all configured), or --commits-range (commits_only:
+    default-branch commit lists for every repo, no pruning): estimated calls, and repo batches sized so
+    each fits one reset window (the first what is left of the current one).
+    """
+    shape = _Shape(collector, since, until, active_fraction, repos)
+    if commits_only:
+        share, prune_calls = 1.0, 0
+        per_repo = {"core": 1.0 + shape.days // 30}
+        label = "per-repo commit listing"
+    else:
+        share, prune_calls = shape.pushed_fraction(), shape.prune_calls()
+        per_repo = shape.range_repo_calls()
+        label = f"per-repo window fetch ({shape.backend})"
+    phases = ([_phase("pushed_at listing", "core", prune_calls)] if prune_calls else []) + [
+        _phase(label, budget, calls * shape.n * share) for budget, calls in per_repo.items()
+    ]
+    if not commits_only:
+        phases += _idle_phases(shape, share)
+    totals = _totals(phases)
+    budget = "graphql" if "graphql" in per_repo else "core"
+    cost = per_repo[budget] * share * _MARGIN
+    if budget == "core" and not commits_only:
+        cost += shape.idle_repo_calls() * (1 - share) * _MARGIN
+    batches = [list(shape.repos)]
+    wait_first = False
+    if rate and budget in rate and planner_mode() != "off" and not _fits(totals, rate):
+        first = max(0, int((rate[budget]["remaining"] - prune_calls * _MARGIN) / cost))
+        per_window = max(1, int((rate[budget]["limit"] - prune_calls * _MARGIN) / cost))
+        wait_first = first == 0
+        batches = [shape.repos[:first]] if first else []
+        for i in range(first, shape.n, per_window):
+            batches.append(shape.repos[i : i + per_window])
+    # Reset windows touched, the current one included.
+    windows = len(batches) + (1 if wait_first else 0)
+    wait = _seconds_to_reset(rate, budget) if windows > 1 else 0
+    left = deadline_remaining()
+    return {
+        "kind": "range",
+        "since": since.isoformat(),
+        "until": until.isoformat(),
+        "repositories": shape.n,
+        "backend": shape.backend,
+        "all_branches": shape.all_branches,
+        "active_fraction": round(shape.active, 3),
+        "strategy": "batched" if len(batches) > 1 else "single",
+        "phases": phases,
+        "estimated": totals,
+        "rate_limit": rate,
+        "fits": windows == 1,
+        "windows": windows,
+        "batches": [len(b) for b in batches],
+        "repo_batches": batches,
+        "budget": budget,
+        "batch_costs": [int(math.ceil(prune_calls * _MARGIN + cost * len(b))) for b in batches],
+        "wait_seconds": wait,
+        "deadline_too_short": bool(left is not None and wait and wait + (windows - 2) * 3600 > left),
+    }
+
+
+def wait_for_budget(collector: GitHubCollector, budget: str = "core", need: int = 1) -> None:
+    """Sleep until `budget` has `need` calls left (re-reading /rate_limit after the reset). Honours the run deadline."""
+    rate = fetch_rate_limit(collector)
+    if not rate or budget not in rate or rate[budget]["remaining"] >= need:
+        return
+    seconds = _seconds_to_reset(rate, budget)
+    reset = datetime.fromtimestamp(rate[budget]["reset"]).strftime("%H:%M:%S")
+    print(f"⏳ Planner: waiting {seconds}s for the {budget} budget to reset at {reset}...")
+    deadline_sleep(seconds, f"{budget} budget reset")
+
+
+def format_plan(plan: Dict) -> str:
+    """Human-readable --plan output."""
+    lines = []
+    if plan["kind"] == "day":
+        lines.append(
+            f"📋 Plan for {plan['target_date']}: {plan['repositories']} repos, backend={plan['backend']}, "
+            f"{'all branches' if plan['all_branches'] else 'default branch'}, preflight={plan['configured']}"
+        )
+    else:
+        lines.append(
+            f"📋 Plan for {plan['since']} .. {plan['until']}: {plan['repositories']} repos, backend={plan['backend']}, "
+            f"{'all branches' if plan['all_branches'] else 'default branch'}"
+        )
+    rate = plan.get("rate_limit")
+    if rate:
+        lines.append(
+            "   Budget now: "
+            + ", ".join(
+                f"{name} {r['remaining']}/{r['limit']} (reset {datetime.fromtimestamp(r['reset']).strftime('%H:%M:%S')})"
+                for name, r in rate.items()
+            )
+        )
+    else:
+        lines.append("   Budget now: unknown (/rate_limit unavailable)")
+    lines.append(f"   Active share of repos assumed: {plan['active_fraction']:.0%}")
+    if plan["kind"] == "day":
+        lines.append(f"   {'strategy':<10}{'core':>8}{'search':>8}{'graphql':>9}")
+        measured = (plan.get("tuning") or {}).get("measured") or {}
+        for name, t in sorted(plan["candidates"].items(), key=lambda kv: _primary_cost(kv[1])):
+            mark = " (measured)" if name in measured else ""
+            mark += "  <- chosen" if name == plan["strategy"] else ""
+            lines.append(f"   {name:<10}{t['core']:>8}{t['search']:>8}{t['graphql']:>9}{mark}")
+        unsupported = (plan.get("tuning") or {}).get("unsupported")
+        if unsupported:
+            lines.append(f"   Not available for this account (cached): {', '.join(unsupported)}")
+        inaccurate = (plan.get("tuning") or {}).get("inaccurate")
+        if inaccurate:
+            lines.append(
+                "   Ruled out on earlier runs: " + ", ".join(f"{name} ({why})" for name, why in sorted(inaccurate.items()))
+            )
+    lines.append(f"   Phases ({plan['strategy']}):")
+    for p in plan["phases"]:
+        lines.append(f"     {p['phase']:<40}{p['budget']:<9}{p['calls']:>6}")
+    if plan["fits"]:
+        lines.append("   Fits in what is left of the current rate-limit window.")
+    elif plan["kind"] == "day" or len(plan["batches"]) == 1:
+        lines.append(f"   Does not fit; the run waits {plan['wait_seconds']}s for the reset first.")
+    else:
+        lines.append(
+            f"   Split into {len(plan['batches'])} repo batches {plan['batches']} over {plan['windows']} reset windows."
+        )
+        if plan.get("deadline_too_short"):
+            lines.append("   The run deadline ends before the last window; expect a partial result.")
+    return "\n".join(lines)
+
+
+def plan_summary(plan: Optional[Dict]) -> Optional[Dict]:
+    """The plan for last_run_metrics.json (no repo lists; the tuner's part goes to its own metric)."""
+    if not plan:
+        return None
+    return {k: v for k, v in plan.items() if k not in ("repo_batches", "batch_costs", "phases", "tuning")}
@@ -0,0 +1,193 @@
+"""
+Adaptive concurrency for GitHub API calls
+AIMD in-flight limits per budget (core REST, search, GraphQL), steered by rate-limit headers,
+observed latency and secondary-limit 403s.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from .transport import _budget, _rate_limit_is_error
+
+# Hard ceiling for the thread pool; the controller decides how many of those actually send.
+MAX_POOL_WORKERS = 32
+
+
+def _adaptive_enabled() -> bool:
+    return os.getenv("GITHUB_ADAPTIVE_CONCURRENCY", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _core_ceiling() -> int:
+    """GITHUB_FETCH_MAX_WORKERS is now the ceiling the controller may grow to (default 16)."""
+    try:
+        n = int(os.getenv("GITHUB_FETCH_MAX_WORKERS", "16"))
+    except ValueError:
+        n = 16
+    return max(1, min(n, MAX_POOL_WORKERS))
+
+
+class AIMDLimiter:
+    """
+    Additive-increase / multiplicative-decrease window of concurrent requests.
+
+    - success with healthy budget: window += 1/window (about +1 per round of requests)
+    - secondary-limit 403 / 429 or a latency spike: window halves, and new sends pause for retry-after
+    - low x-ratelimit-remaining: sends are paced so what is left lasts until x-ratelimit-reset
+    """
+
+    def __init__(self, name: str, initial: float, minimum: float, maximum: float):
+        self.name = name
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = max(minimum, min(initial, maximum))
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._next_send = 0.0
+        self._pace_interval = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._last_decrease = 0.0
+        self._counts = {"requests": 0, "increases": 0, "decreases": 0, "throttled": 0}
+        self._peak_window = self.window
+
+    def _take_locked(self, now: float) -> bool:
+        if self._inflight >= int(self.window) or now < self._next_send:
+            return False
+        self._inflight += 1
+        self._counts["requests"] += 1
+        if self._pace_interval:
+            self._next_send = now + self._pace_interval
+        return True
+
+    def acquire(self, until: Optional[float] = None) -> bool:
+        """
+        Block the calling thread until a slot is free and pacing allows a send. Returns False, without
+        a slot, once time.monotonic() reaches `until` (the run deadline).
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._take_locked(now):
+                    return True
+                if until is not None and now >= until:
+                    return False
+                timeout = max(0.01, self._next_send - now) if now < self._next_send else None
+                if until is not None:
+                    timeout = min(timeout or until - now, until - now)
+                self._cond.wait(timeout)
+
+    def try_acquire(self) -> float:
+        """Non-blocking acquire for the asyncio engine: 0.0 on success, else seconds to wait before retrying."""
+        with self._cond:
+            now = time.monotonic()
+            if self._take_locked(now):
+                return 0.0
+            return max(0.01, self._next_send - now)
+
+    def release(self, response=None, latency: Optional[float] = None) -> None:
+        with self._cond:
+            self._inflight -= 1
+            if response is not None:
+                self._observe(response, latency)
+            self._cond.notify_all()
+
+    def _observe(self, response, latency: Optional[float]) -> None:
+        now = time.monotonic()
+        headers = response.headers
+        status = response.status_code
+
+        remaining = _int_header(headers, "x-ratelimit-remaining")
+        reset = _int_header(headers, "x-ratelimit-reset")
+        limit = _int_header(headers, "x-ratelimit-limit")
+        if remaining is not None and reset is not None:
+            seconds_left = max(0, reset - int(time.time()))
+            reserve = max(self.window * 2, (limit or 0) * 0.1)
+            # Spread what is left over the reset window once the budget runs low.
+            self._pace_interval = seconds_left / max(1, remaining) if remaining < reserve else 0.0
+
+        # Primary exhaustion or a secondary limit (retry-after, or only the message says so) both mean back off.
+        throttled = status in (403, 429) and ("retry-after" in headers or _rate_limit_is_error(response))
+        if throttled:
+            self._counts["throttled"] += 1
+            retry_after = _int_header(headers, "retry-after") or 0
+            self._next_send = max(self._next_send, now + retry_after)
+            self._decrease(now)
+            return
+
+        if latency is not None and status < 500:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            elif latency > 2.5 * self._latency_ewma and latency > 1.0:
+                self._decrease(now)
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+        if status < 400 and self._pace_interval == 0.0 and self.window < self.maximum:
+            self.window = min(self.maximum, self.window + 1.0 / self.window)
+            self._counts["increases"] += 1
+            self._peak_window = max(self._peak_window, self.window)
+
+    def _decrease(self, now: float) -> None:
+        # At most one halving per latency-ish interval, so one burst of 403s is one signal.
+        if now - self._last_decrease < 1.0:
+            return
+        self._last_decrease = now
+        self.window = max(self.minimum, self.window / 2)
+        self._counts["decreases"] += 1
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return dict(
+                self._counts,
+                window=round(self.window, 2),
+                peak_window=round(self._peak_window, 2),
+                maximum=self.maximum,
+                pace_interval_s=round(self._pace_interval, 2),
+            )
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_limiters: Dict[str, AIMDLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _new_limiter(budget: str) -> AIMDLimiter:
+    ceiling = _core_ceiling()
+    if not _adaptive_enabled():
+        # Fixed cap, like the old GITHUB_FETCH_MAX_WORKERS behaviour.
+        return AIMDLimiter(budget, ceiling, ceiling, ceiling)
+    if budget == "search":
+        # 30 requests/minute: never more than two at a time; pacing does the rest.
+        return AIMDLimiter(budget, 1, 1, 2)
+    if budget == "graphql":
+        return AIMDLimiter(budget, 2, 1, min(4, ceiling))
+    return AIMDLimiter(budget, min(4, ceiling), 1, ceiling)
+
+
+def get_limiter(url: str) -> AIMDLimiter:
+    budget = _budget(url)
+    with _limiters_lock:
+        limiter = _limiters.get(budget)
+        if limiter is None:
+            limiter = _limiters[budget] = _new_limiter(budget)
+        return limiter
+
+
+def pool_workers(num_jobs: int) -> int:
+    """Thread-pool size: enough threads for the controller's ceiling, never more than jobs."""
+    return min(_core_ceiling(), max(1, num_jobs))
+
+
+def concurrency_stats() -> Dict:
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.stats() for name, limiter in limiters.items()}
@@ -0,0 +1,90 @@
+"""
+Day windows in the user's timezone
+A calendar "day" is local midnight to midnight, expressed as UTC `...Z` bounds for GitHub queries
+"""
+
+import logging
+import os
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Optional, Tuple, Union
+
+# Try to load zoneinfo (Python 3.9+) for IANA names if available
+try:
+    from zoneinfo import ZoneInfo
+    ZONEINFO_AVAILABLE = True
+except ImportError:
+    ZONEINFO_AVAILABLE = False
+
+# Sentinel: the machine's local zone (DST-aware, resolved per timestamp).
+LOCAL = "local"
+
+DayTimezone = Union[tzinfo, str]
+Window = Tuple[str, str]
+
+
+def resolve_day_timezone(configured: Optional[str] = None) -> DayTimezone:
+    """
+    GITHUB_DAY_TIMEZONE, else github.timezone from config: an IANA name ("Asia/Kolkata"), "local"
+    for the machine's zone, or "UTC" (default, the historical behaviour).
+    """
+    name = (os.getenv("GITHUB_DAY_TIMEZONE") or configured or "UTC").strip()
+    if name.upper() == "UTC":
+        return timezone.utc
+    if name.lower() == LOCAL:
+        return LOCAL
+    if not ZONEINFO_AVAILABLE:
+        logging.warning("Timezone %s needs Python 3.9+ (zoneinfo); using UTC days.", name)
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except Exception as e:
+        logging.warning("Unknown timezone %s (%s); using UTC days.", name, e)
+        return timezone.utc
+
+
+def _zulu(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _localize(naive: datetime, tz: DayTimezone) -> datetime:
+    return naive.astimezone() if tz == LOCAL else naive.replace(tzinfo=tz)
+
+
+def _as_date(day: Union[date, str]) -> date:
+    return day if isinstance(day, date) else date.fromisoformat(day)
+
+
+def day_window(day: Union[date, str], tz: DayTimezone) -> Window:
+    """(start, end) of `day` in tz as inclusive UTC bounds, e.g. ('2026-04-03T18:30:00Z', '2026-04-04T18:29:59Z')."""
+    start = datetime.combine(_as_date(day), time.min)
+    return _zulu(_localize(start, tz)), _zulu(_localize(start + timedelta(days=1), tz) - timedelta(seconds=1))
+
+
+def span_window(since_day: Union[date, str], until_day: Union[date, str], tz: DayTimezone) -> Window:
+    return day_window(since_day, tz)[0], day_window(until_day, tz)[1]
+
+
+def utc_timestamp(value: str) -> str:
+    """Any ISO timestamp (Z, +05:30, fractional seconds) as UTC `...Z`; unparseable values pass through."""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return _zulu(dt)
+
+
+def in_window(value: str, window: Window) -> bool:
+    return window[0] <= utc_timestamp(value) <= window[1]
+
+
+def local_day(value: str, tz: DayTimezone) -> str:
+    """YYYY-MM-DD of a timestamp in tz (the calendar day it belongs to)."""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value[:10]
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt.astimezone() if tz == LOCAL else dt.astimezone(tz)).date().isoformat()
@@ -0,0 +1,113 @@
+"""
+Run-level deadline
+One wall-clock budget for a whole collection run. Requests, retry sleeps and rate-limit waits check it,
+so workers give up instead of sleeping past it and the run ends with a partial result.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+_lock = threading.Lock()
+_deadline: Optional[float] = None  # time.monotonic() value
+_seconds: Optional[float] = None
+_counts = {"cancelled": 0, "sleeps_cut": 0}
+_exceeded = False
+
+
+class DeadlineExceeded(TimeoutError):
+    """The run's deadline passed (or a wait would cross it); the caller's work is abandoned."""
+
+
+def resolve_deadline_minutes(cli: Optional[float] = None, configured: Optional[float] = None) -> Optional[float]:
+    """--deadline-minutes, else GITHUB_RUN_DEADLINE_MINUTES, else github.run_deadline_minutes; None/0 = no deadline."""
+    for value in (cli, os.getenv("GITHUB_RUN_DEADLINE_MINUTES"), configured):
+        if value in (None, ""):
+            continue
+        try:
+            minutes = float(value)
+        except (TypeError, ValueError):
+            logging.warning("Ignoring invalid run deadline %r.", value)
+            continue
+        return minutes if minutes > 0 else None
+    return None
+
+
+def set_run_deadline(seconds: Optional[float]) -> None:
+    """Start the clock: the run must finish within `seconds` from now (None clears the deadline)."""
+    global _deadline, _seconds, _exceeded
+    with _lock:
+        _seconds = seconds
+        _deadline = time.monotonic() + seconds if seconds else None
+        _exceeded = False
+        _counts.update(cancelled=0, sleeps_cut=0)
+
+
+def deadline_remaining() -> Optional[float]:
+    """Seconds left (never negative), or None without a deadline."""
+    with _lock:
+        return None if _deadline is None else max(0.0, _deadline - time.monotonic())
+
+
+def deadline_at() -> Optional[float]:
+    """The deadline as a time.monotonic() value, for waits that take an absolute bound."""
+    with _lock:
+        return _deadline
+
+
+def _cancel(counter: str, what: str) -> DeadlineExceeded:
+    global _exceeded
+    with _lock:
+        first = not _exceeded
+        _exceeded = True
+        _counts[counter] += 1
+    if first:
+        logging.warning("Run deadline (%ss) reached; cancelling outstanding GitHub work.", int(_seconds or 0))
+    return DeadlineExceeded(f"run deadline reached ({what})")
+
+
+def check_deadline(what: str = "request") -> None:
+    """Raise DeadlineExceeded if the deadline has passed. Call before starting any unit of work."""
+    left = deadline_remaining()
+    if left is not None and left <= 0:
+        raise _cancel("cancelled", what)
+
+
+def deadline_timeout(timeout: float) -> float:
+    """A per-request timeout that does not outlive the deadline."""
+    left = deadline_remaining()
+    return timeout if left is None else max(0.5, min(timeout, left))
+
+
+def check_wait(seconds: float, what: str = "retry wait") -> None:
+    """Raise DeadlineExceeded if waiting `seconds` would cross the deadline."""
+    left = deadline_remaining()
+    if left is not None and seconds >= left:
+        raise _cancel("sleeps_cut", what)
+
+
+def deadline_sleep(seconds: float, what: str = "retry wait") -> None:
+    """time.sleep that raises instead of sleeping past the deadline."""
+    check_wait(seconds, what)
+    time.sleep(seconds)
+
+
+async def deadline_async_sleep(seconds: float, what: str = "retry wait") -> None:
+    check_wait(seconds, what)
+    await asyncio.sleep(seconds)
+
+
+def deadline_exceeded() -> bool:
+    with _lock:
+        return _exceeded
+
+
+def deadline_stats() -> Optional[Dict]:
+    """Deadline outcome for last_run_metrics.json, or None when the run had no deadline."""
+    with _lock:
+        if _seconds is None:
+            return None
+        return dict(_counts, seconds=_seconds, exceeded=_exceeded)
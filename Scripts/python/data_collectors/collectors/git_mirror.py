@@ -0,0 +1,239 @@
+"""
+Local git mirror backend
+Bare mirrors of the configured repos answer "commits in this window" with git log, so the REST API
+is only needed for PRs and issues.
+"""
+
+import base64
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .day_window import Window, in_window, utc_timestamp
+from .deadline import check_deadline, deadline_remaining
+
+# collectors/git_mirror.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_MIRROR_DIR = SCRIPTS_DIR / "logs" / "git_mirrors"
+
+# git log record/field separators (ASCII RS/US never appear in names or messages).
+_RS = "\x1e"
+_US = "\x1f"
+_LOG_FORMAT = "%H%x1f%an%x1f%cI%x1f%B%x1e"
+
+_counts = {"repos": 0, "cloned": 0, "fetched": 0, "fresh": 0, "failed": 0, "deadline": 0}
+_counts_lock = threading.Lock()
+_used = False
+
+
+def git_available() -> bool:
+    return shutil.which("git") is not None
+
+
+def _mirror_dir() -> Path:
+    return Path(os.getenv("GITHUB_GIT_MIRROR_DIR") or DEFAULT_MIRROR_DIR)
+
+
+def _remote_base() -> str:
+    return (os.getenv("GITHUB_GIT_MIRROR_REMOTE") or "https://github.com").rstrip("/")
+
+
+def _refresh_seconds() -> int:
+    """Mirrors fetched less than GITHUB_GIT_MIRROR_REFRESH_S ago (default 600) are used as-is."""
+    try:
+        return max(0, int(os.getenv("GITHUB_GIT_MIRROR_REFRESH_S", "600")))
+    except ValueError:
+        return 600
+
+
+def _mirror_workers(num_repos: int) -> int:
+    try:
+        n = int(os.getenv("GITHUB_GIT_MIRROR_WORKERS", "0"))
+    except ValueError:
+        n = 0
+    return max(1, min(n or os.cpu_count() or 4, num_repos))
+
+
+def _git(
+    args: List[str], token: str = "", cwd: Optional[Path] = None, timeout: int = 600, stop_at: Optional[float] = None
+) -> subprocess.CompletedProcess:
+    """
+    Run one git command. `stop_at` (time.time() of the run deadline; worker processes do not share the
+    deadline module's clock) caps the timeout, and a command that would start after it is not run.
+    """
+    cmd = ["git"]
+    if stop_at is not None:
+        left = stop_at - time.time()
+        if left <= 0:
+            raise subprocess.TimeoutExpired(cmd + args, 0)
+        timeout = min(timeout, left)
+    if token:
+        # Passed per command so the token never lands in the mirror's config.
+        basic = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+        cmd += ["-c", f"http.extraHeader=Authorization: Basic {basic}"]
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    return subprocess.run(
+        cmd + args, cwd=str(cwd) if cwd else None, env=env, capture_output=True, text=True, timeout=timeout
+    )
+
+
+def _sync_mirror(
+    owner_repo: str, token: str, path: Path, remote: str, refresh_s: int, stop_at: Optional[float] = None
+) -> str:
+    """
+    Create or refresh the bare mirror at `path`. Returns "cloned", "fetched" or "fresh".
+    Only branches are mirrored (refs/heads/*): GitHub's refs/pull/* would add fork history the REST
+    branch walk never sees.
+    """
+    url = f"{remote}/{owner_repo}.git"
+    outcome = "fetched"
+    if not (path / "HEAD").exists():
+        path.mkdir(parents=True, exist_ok=True)
+        _check(_git(["init", "--bare", "--quiet", str(path)], stop_at=stop_at), owner_repo, "init")
+        _check(_git(["remote", "add", "--mirror=fetch", "origin", url], cwd=path, stop_at=stop_at), owner_repo, "remote add")
+        _check(_git(["config", "remote.origin.fetch", "+refs/heads/*:refs/heads/*"], cwd=path, stop_at=stop_at), owner_repo, "config")
+        outcome = "cloned"
+    else:
+        fetch_head = path / "FETCH_HEAD"
+        if refresh_s and fetch_head.exists() and time.time() - fetch_head.stat().st_mtime < refresh_s:
+            return "fresh"
+
+    _check(_git(["fetch", "--prune", "--quiet", "origin"], token, cwd=path, stop_at=stop_at), owner_repo, "fetch")
+    # Keep HEAD on the remote's default branch, so the default-branch-only mode logs the same branch REST walks.
+    ls = _git(["ls-remote", "--symref", "origin", "HEAD"], token, cwd=path, timeout=60, stop_at=stop_at)
+    for line in ls.stdout.splitlines():
+        if line.startswith("ref:") and line.endswith("\tHEAD"):
+            _git(["symbolic-ref", "HEAD", line[4:].split("\t")[0].strip()], cwd=path, stop_at=stop_at)
+            break
+    return outcome
+
+
+def _check(proc: subprocess.CompletedProcess, owner_repo: str, step: str) -> None:
+    if proc.returncode != 0:
+        raise RuntimeError(f"git {step} failed for {owner_repo}: {proc.stderr.strip()[:300]}")
+
+
+def _log_commits(
+    owner_repo: str, path: Path, window: Window, all_branches: bool, html_base: str, stop_at: Optional[float] = None
+) -> List[Dict]:
+    """commit_details records (same fields as _commit_detail) for commits whose committer date is in the window."""
+    refs = ["--branches"] if all_branches else ["HEAD"]
+    proc = _git(
+        ["log", *refs, f"--since={window[0]}", f"--until={window[1]}", f"--format={_LOG_FORMAT}"],
+        cwd=path,
+        stop_at=stop_at,
+    )
+    if proc.returncode != 0:
+        if "does not have any commits" in proc.stderr or "unknown revision" in proc.stderr:
+            # Empty repository, like the REST 409.
+            return []
+        _check(proc, owner_repo, "log")
+    details: List[Dict] = []
+    for record in proc.stdout.split(_RS):
+        record = record.lstrip("\n")
+        if not record:
+            continue
+        sha, author, committed_at, body = record.split(_US, 3)
+        timestamp = utc_timestamp(committed_at)
+        if not in_window(timestamp, window):
+            continue
+        details.append(
+            {
+                "sha": sha[:7],
+                "message": body.split("\n")[0],
+                "author": author or "Unknown",
+                "url": f"{html_base}/{owner_repo}/commit/{sha}",
+                "timestamp": timestamp,
+            }
+        )
+    return details
+
+
+def _mirror_repo_commits(
+    owner_repo: str,
+    token: str,
+    window: Window,
+    all_branches: bool,
+    root: str,
+    remote: str,
+    refresh_s: int,
+    stop_at: Optional[float] = None,
+) -> Tuple[str, List[Dict]]:
+    """Process-pool job: sync one mirror and log its window. Returns (sync outcome, commit_details)."""
+    path = Path(root) / f"{owner_repo.lower()}.git"
+    outcome = _sync_mirror(owner_repo, token, path, remote, refresh_s, stop_at)
+    return outcome, _log_commits(owner_repo, path, window, all_branches, remote, stop_at)
+
+
+def mirror_commits(owner_repos: List[str], token: str, window: Window, all_branches: bool) -> Dict[str, Optional[List[Dict]]]:
+    """
+    {owner/name: commit_details} for every repo; None for repos whose mirror could not be synced
+    (the caller fetches those over REST). One process per repo, GITHUB_GIT_MIRROR_WORKERS at a time
+    (default: CPU count). Every git command is cut off at the run deadline and no repo is handed out
+    after it; those repos stay None.
+    """
+    global _used
+    out: Dict[str, Optional[List[Dict]]] = {repo: None for repo in owner_repos}
+    if not owner_repos:
+        return out
+    check_deadline("git mirror sync")
+    root = _mirror_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    remote = _remote_base()
+    refresh_s = _refresh_seconds()
+    with _counts_lock:
+        _used = True
+        _counts["repos"] += len(owner_repos)
+    left = deadline_remaining()
+    stop_at = None if left is None else time.time() + left
+    workers = _mirror_workers(len(owner_repos))
+    queued = list(owner_repos)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        running: Dict = {}
+        while queued or running:
+            # Hand out repos one free worker at a time, so none starts once the deadline has passed.
+            while queued and len(running) < workers and (stop_at is None or time.time() < stop_at):
+                repo = queued.pop(0)
+                job = (repo, token, window, all_branches, str(root), remote, refresh_s, stop_at)
+                running[executor.submit(_mirror_repo_commits, *job)] = repo
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                repo = running.pop(future)
+                try:
+                    outcome, details = future.result()
+                except subprocess.TimeoutExpired as e:
+                    if stop_at is not None and time.time() >= stop_at:
+                        outcome, details = "deadline", None
+                    else:
+                        logging.warning("Git mirror for %s timed out (%s); using the REST API for its commits.", repo, e)
+                        outcome, details = "failed", None
+                        failed += 1
+                except Exception as e:
+                    logging.warning("Git mirror for %s unavailable (%s); using the REST API for its commits.", repo, e)
+                    outcome, details = "failed", None
+                    failed += 1
+                out[repo] = details
+                with _counts_lock:
+                    _counts[outcome] += 1
+    if queued:
+        with _counts_lock:
+            _counts["deadline"] += len(queued)
+    cut = sum(1 for repo in owner_repos if out[repo] is None) - failed
+    if cut:
+        logging.warning("Run deadline reached; %s git mirrors not synced.", cut)
+    return out
+
+
+def git_mirror_stats() -> Optional[Dict]:
+    """Mirror sync outcomes for this run, or None when the git backend was not used."""
+    with _counts_lock:
+        return dict(_counts, path=str(_mirror_dir())) if _used else None
@@ -4,30 +4,85 @@ Fetches commits, PRs, and issues from GitHub repositories
 """
 
 import os
+import bisect
 import json
 import logging
+import queue
+import threading
 import time
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import date, datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from ..utils.config import setup_env, DOTENV_AVAILABLE
 from ..utils.helpers import normalize_repo_identifier
+from .branch_heads import branch_skip_reason, get_branch_head_cache
+from .concurrency import get_limiter, pool_workers
+from .day_window import (
+    DayTimezone,
+    Window,
+    day_window,
+    in_window,
+    local_day,
+    resolve_day_timezone,
+    span_window,
+    utc_timestamp,
+)
+from .deadline import (
+    DeadlineExceeded,
+    check_deadline,
+    check_wait,
+    deadline_at,
+    deadline_exceeded,
+    deadline_sleep,
+    deadline_timeout,
+)
+from .graphql import (
+    _graphql_batch_size,
+    build_batch_query,
+    graphql_rate_limited,
+    parse_repo_node,
+)
+from .git_mirror import git_available, mirror_commits
+from .http_cache import get_http_cache
+from .preflight_tuner import get_preflight_tuner, tuner_account
+from .repo_registry import get_repo_registry
+from .retry_scheduler import ParkRequest, TaskContext, current_task, parking_enabled, run_parkable
+from .store import ActivityStore, get_activity_store
+from .transport import _rate_limit_is_error, get_transport
+from .webhook_log import EVENTS as WEBHOOK_EVENTS, get_webhook_log
 
 if DOTENV_AVAILABLE:
     from dotenv import load_dotenv
 
+DEFAULT_API_BASE = "https://api.github.com"
+
+# Owners with at least this many configured repos get their full repo list read (once per registry TTL),
+# so searches can name the owner instead of each repo (GITHUB_OWNER_QUALIFIER_MIN_REPOS overrides).
+_OWNER_QUALIFIER_MIN_REPOS = 20
+
+# Pages per branch listing in one activity-store sync leg (100 commits each).
+_STORE_SYNC_MAX_PAGES = 50
+
+# Event feeds keep 90 days and at most 300 events (3 pages of 100).
+_EVENTS_MAX_AGE_DAYS = 90
+_EVENTS_MAX_PAGES = 3
+
+
+def _github_api_base(configured: Optional[str] = None) -> str:
+    """REST root: GITHUB_API_BASE, else github.api_base from config (e.g. a local stand-in or GHES)."""
+    return (os.getenv("GITHUB_API_BASE") or configured or DEFAULT_API_BASE).rstrip("/")
+
 
 def _get_github_fetch_max_workers(num_repos: int) -> int:
-    """Cap concurrent repo fetches to reduce secondary rate limits (GitHub abuse detection)."""
-    try:
-        max_w = int(os.getenv("GITHUB_FETCH_MAX_WORKERS", "8"))
-    except ValueError:
-        max_w = 8
-    max_w = max(1, min(max_w, 10))
-    return min(max_w, max(1, num_repos))
+    """
+    Thread-pool size for repo fetches. This is only a ceiling (GITHUB_FETCH_MAX_WORKERS, default 16):
+    requests in flight are governed per budget by the AIMD controller in concurrency.py, which backs off
+    on secondary rate limits and low x-ratelimit-remaining. GITHUB_ADAPTIVE_CONCURRENCY=off pins it.
+    """
+    return pool_workers(num_repos)
 
 
 def _commits_all_branches_enabled() -> bool:
@@ -35,6 +90,30 @@ def _commits_all_branches_enabled() -> bool:
     return os.getenv("GITHUB_COMMITS_ALL_BRANCHES", "").lower() in ("1", "true", "yes")
 
 
+def _collector_backend(configured: Optional[str] = None) -> str:
+    """
+    Per-repo fan-out backend: "rest" (default, ~3 calls per repo on a thread pool), "async" (same calls
+    multiplexed on asyncio/HTTP/2, see async_engine.py), "graphql" (aliased batches) or "git" (commits
+    from local mirrors via git log, see git_mirror.py; REST only for PRs and issues).
+    GITHUB_COLLECTOR_BACKEND overrides github.backend from the config file.
+    With the activity store on (store.py), "rest" syncs repos into it instead of fetching one day.
+    """
+    v = (os.getenv("GITHUB_COLLECTOR_BACKEND") or configured or "").strip().lower()
+    if v == "async":
+        return "async"
+    if v == "git":
+        if not git_available():
+            logging.warning("git backend selected but git is not on PATH; using REST.")
+            return "rest"
+        return "git"
+    if v == "graphql":
+        if _commits_all_branches_enabled():
+            logging.info("GraphQL backend walks the default branch only; using REST for all-branches mode.")
+            return "rest"
+        return "graphql"
+    return "rest"
+
+
 def _preflight_mode() -> Optional[str]:
     """
     Fast path before scanning every configured repo (Search API vs N parallel repo fetches).
@@ -44,8 +123,16 @@ def _preflight_mode() -> Optional[str]:
       repos for issues/PRs created that day. Works for personal accounts (no org: qualifier).
     - "author": only your author identity (cheap; misses AI/bot commits and others' work).
     - "namespace": org:OWNER (single owner); good for orgs; 422 on personal → fall back to full scan.
+    - "search": same repo-scoped queries as "repos", but paged through and used as the result itself when
+      total_count < GITHUB_SEARCH_COLLECT_MAX (default 500); default branch only.
+    - "events": dates in the last 90 days are answered from the user's (and other owners' org) event
+      feeds: PR/issue openings straight from the events, commits only for repos pushed to since the
+      day began. Falls back to the full scan whenever a feed may be truncated.
 
     Disable: GITHUB_DISABLE_PREFLIGHT=1. Full scan only: GITHUB_PREFLIGHT=off.
+    The budget planner (budget_planner.py) may run the full scan instead when it costs less, ranked by
+    the costs preflight_tuner.py measured on earlier runs; GITHUB_PLAN=auto also considers search and
+    event feeds, GITHUB_PLAN=check keeps this one.
     """
     if os.getenv("GITHUB_DISABLE_PREFLIGHT", "").strip().lower() in ("1", "true", "yes"):
         return None
@@ -58,26 +145,28 @@ def _preflight_mode() -> Optional[str]:
         return "author"
     if v == "namespace":
         return "namespace"
+    if v == "events":
+        return "events"
+    if v == "search":
+        if _commits_all_branches_enabled():
+            # Commit search only indexes default branches.
+            return "repos"
+        return "search"
     return None
 
 
-def _rate_limit_is_error(response: requests.Response) -> bool:
-    if response.status_code == 429:
-        return True
-    if response.status_code != 403:
-        return False
-    remaining = response.headers.get("x-ratelimit-remaining", "")
-    if remaining == "0":
-        return True
-    try:
-        error_data = response.json()
-        if isinstance(error_data, dict):
-            message = error_data.get("message", "").lower()
-            if "rate limit" in message or "api rate limit" in message:
-                return True
-    except Exception:
-        pass
-    return False
+def _listing_floor(items: List[Dict], complete: bool, since_iso: str, max_pages: int, stamp) -> Optional[str]:
+    """
+    Oldest UTC timestamp a newest-first listing since `since_iso` is complete down to: since_iso when it
+    ran to the end, just above its oldest item when it stopped at its page cap, None when it failed.
+    """
+    if complete:
+        return since_iso
+    if not items or len(items) < max_pages * 100:
+        return None
+    oldest = min(utc_timestamp(stamp(item)) for item in items)
+    dt = datetime.strptime(oldest, "%Y-%m-%dT%H:%M:%SZ") + timedelta(seconds=1)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _rate_limit_wait_seconds(response: requests.Response) -> Optional[int]:
@@ -104,13 +193,106 @@ def _github_get_with_retry(
     max_retries: int = 3,
     timeout: int = 10,
 ) -> requests.Response:
-    """GET with retries for rate limits and transient errors."""
-    retry_count = 0
+    """GET with retries for rate limits and transient errors. Sends If-None-Match when cached."""
+    return _github_request_with_retry("GET", url, headers, params, None, max_retries, timeout)
+
+
+def _github_post_with_retry(
+    url: str,
+    headers: Dict,
+    json_body: Dict,
+    max_retries: int = 3,
+    timeout: int = 30,
+) -> requests.Response:
+    """POST (GraphQL) with the same retry/rate-limit handling as GETs; never cached."""
+    return _github_request_with_retry("POST", url, headers, None, json_body, max_retries, timeout)
+
+
+def _send_limited(
+    method: str,
+    url: str,
+    headers: Dict,
+    params: Optional[Dict],
+    json_body: Optional[Dict],
+    timeout: int,
+) -> requests.Response:
+    """One request through the pooled transport, holding a slot of its rate-limit budget."""
+    check_deadline()
+    limiter = get_limiter(url)
+    if not limiter.acquire(until=deadline_at()):
+        check_deadline("waiting for a rate-limit slot")
+    response = None
+    start = time.perf_counter()
+    try:
+        response = get_transport().request(
+            method, url, headers=headers, params=params, json=json_body, timeout=deadline_timeout(timeout)
+        )
+        return response
+    finally:
+        limiter.release(response, time.perf_counter() - start)
+
+
+def _github_request_with_retry(
+    method: str,
+    url: str,
+    headers: Dict,
+    params: Optional[Dict] = None,
+    json_body: Optional[Dict] = None,
+    max_retries: int = 3,
+    timeout: int = 10,
+) -> requests.Response:
+    """
+    Inside a parkable task (retry_scheduler.py) a wait parks the task instead of sleeping, and
+    responses the task already received are replayed when it is re-dispatched.
+    """
+    task = current_task() if parking_enabled() else None
+    if task is None:
+        return _request_with_retry(method, url, headers, params, json_body, max_retries, timeout)
+    task_key = (method, url, json.dumps(params, sort_keys=True, default=str), json.dumps(json_body, sort_keys=True))
+    response = task.replay(task_key)
+    if response is None:
+        response = _request_with_retry(method, url, headers, params, json_body, max_retries, timeout, task, task_key)
+        task.responses[task_key] = response
+    return response
+
+
+def _retry_wait(seconds: float, what: str, task: Optional[TaskContext], task_key, next_attempt: int) -> None:
+    """Sleep before a retry, or park the current task (freeing its pool thread) when it is parkable."""
+    if task is None:
+        deadline_sleep(seconds, what)
+        return
+    check_wait(seconds, what)
+    task.attempts[task_key] = next_attempt
+    raise ParkRequest(seconds, what)
+
+
+def _request_with_retry(
+    method: str,
+    url: str,
+    headers: Dict,
+    params: Optional[Dict],
+    json_body: Optional[Dict],
+    max_retries: int,
+    timeout: int,
+    task: Optional[TaskContext] = None,
+    task_key=None,
+) -> requests.Response:
+    retry_count = task.attempts.get(task_key, 0) if task else 0
     last_exception = None
+    cache = get_http_cache() if method == "GET" else None
+    cache_key = cache.key(url, params, headers) if cache else None
+    cached = cache.lookup(cache_key) if cache_key else None
 
     while retry_count <= max_retries:
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=timeout)
+            request_headers = headers
+            if cached:
+                request_headers = dict(headers, **cache.conditional_headers(cached))
+            response = _send_limited(method, url, request_headers, params, json_body, timeout)
+
+            if cached and response.status_code == 304:
+                # 304s do not count against the primary rate limit.
+                return cache.replay(cache_key, cached, response)
 
             if response.status_code == 403 and _rate_limit_is_error(response):
                 wait_time = _rate_limit_wait_seconds(response)
@@ -119,11 +301,11 @@ def _github_get_with_retry(
                     logging.warning(
                         f"Rate limit exceeded. Waiting {wait_time} seconds until reset at {reset_time}..."
                     )
-                    time.sleep(wait_time + 1)
+                    _retry_wait(wait_time + 1, "rate-limit reset", task, task_key, retry_count + 1)
                     retry_count += 1
                     continue
                 logging.warning("Rate limit exceeded but no reset time available. Waiting 60 seconds...")
-                time.sleep(60)
+                _retry_wait(60, "rate-limit reset", task, task_key, retry_count + 1)
                 retry_count += 1
                 continue
 
@@ -133,7 +315,7 @@ def _github_get_with_retry(
                 logging.warning(
                     f"Rate limit exceeded (429). Waiting {wait_time} seconds until reset at {reset_time}..."
                 )
-                time.sleep(wait_time + 1)
+                _retry_wait(wait_time + 1, "rate-limit reset", task, task_key, retry_count + 1)
                 retry_count += 1
                 continue
 
@@ -144,19 +326,21 @@ def _github_get_with_retry(
                         f"Server error {response.status_code}. Retrying in {wait_time} seconds... "
                         f"(attempt {retry_count + 1}/{max_retries + 1})"
                     )
-                    time.sleep(wait_time)
+                    _retry_wait(wait_time, "retry backoff", task, task_key, retry_count + 1)
                     retry_count += 1
                     continue
                 response.raise_for_status()
 
             if response.status_code == 200:
+                if cache_key:
+                    cache.store(cache_key, response)
                 return response
 
             if response.status_code in [408, 429]:
                 if retry_count < max_retries:
                     wait_time = 2**retry_count
                     logging.warning(f"Status {response.status_code}. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    _retry_wait(wait_time, "retry backoff", task, task_key, retry_count + 1)
                     retry_count += 1
                     continue
 
@@ -169,7 +353,7 @@ def _github_get_with_retry(
                     f"Request timeout. Retrying in {wait_time} seconds... "
                     f"(attempt {retry_count + 1}/{max_retries + 1})"
                 )
-                time.sleep(wait_time)
+                _retry_wait(wait_time, "retry backoff", task, task_key, retry_count + 1)
                 retry_count += 1
                 continue
             raise
@@ -181,7 +365,7 @@ def _github_get_with_retry(
                     f"Connection error. Retrying in {wait_time} seconds... "
                     f"(attempt {retry_count + 1}/{max_retries + 1})"
                 )
-                time.sleep(wait_time)
+                _retry_wait(wait_time, "retry backoff", task, task_key, retry_count + 1)
                 retry_count += 1
                 last_exception = e
                 continue
@@ -218,11 +402,28 @@ def _forbidden_or_ratelimit(response: requests.Response, repo: str, resource: st
 class GitHubCollector:
     """GitHub data collector for commits, PRs, and issues"""
 
-    def __init__(self, token: str, username: str, repositories: List[str]):
+    def __init__(
+        self,
+        token: str,
+        username: str,
+        repositories: List[str],
+        backend: Optional[str] = None,
+        day_timezone: Optional[str] = None,
+        api_base: Optional[str] = None,
+    ):
         self.token = token
         self.username = username
         self.repositories = repositories
-        self.api_base = "https://api.github.com"
+        self.backend = backend
+        self.day_tz = resolve_day_timezone(day_timezone)
+        self.api_base = _github_api_base(api_base)
+        # Preflight strategy picked by the budget planner (budget_planner.py); None = GITHUB_PREFLIGHT.
+        self.preflight: Optional[str] = None
+        self._canonical: Optional[List[str]] = None
+        self._owner_qualifiers: Optional[Dict[str, str]] = None
+        # Activity store: {owner/name: branch heads read this run, or None when they could not be}.
+        self._store_heads: Dict[str, Optional[Dict[str, str]]] = {}
+        self._store_heads_lock = threading.Lock()
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
@@ -231,6 +432,53 @@ class GitHubCollector:
     def _owner_repo(self, repo: str) -> str:
         return normalize_repo_identifier(repo, self.username)
 
+    def _preflight(self) -> Optional[str]:
+        """The planner's strategy for this run ("off" = full scan), else _preflight_mode()."""
+        if self.preflight is not None:
+            return None if self.preflight == "off" else self.preflight
+        return _preflight_mode()
+
+    def _canonical_repos(self) -> List[str]:
+        """
+        Configured repos to fetch: with the repo registry (repo_registry.py) on, canonical owner/name
+        with renames followed, case-insensitive duplicates and cached 404s dropped; else as configured.
+        Resolved once per collector.
+        """
+        if self._canonical is None:
+            registry = get_repo_registry()
+            if registry is None:
+                self._canonical = list(self.repositories)
+            else:
+                self._canonical = registry.resolve(self.repositories, self.username, self._fetch_repo_meta)
+        return self._canonical
+
+    def _fetch_repo_meta(self, owner_repo: str) -> Tuple[int, Optional[Dict]]:
+        """GET /repos/{owner_repo} (redirects followed) for the registry: (status, repo JSON or None)."""
+        try:
+            response = self._make_request_with_retry(f"{self.api_base}/repos/{owner_repo}")
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.info("Repo lookup for %s failed: %s", owner_repo, e)
+            return 0, None
+        _forbidden_or_ratelimit(response, owner_repo, "repository")
+        return response.status_code, response.json() if response.status_code == 200 else None
+
+    def _note_repo_response(self, owner_repo: str, response: requests.Response) -> None:
+        registry = get_repo_registry()
+        if registry:
+            registry.note_response(owner_repo, response)
+
+    def _day_window(self, date_str: str) -> Window:
+        """UTC bounds of date_str in the configured day timezone."""
+        return day_window(date_str, self.day_tz)
+
+    def _search_day(self, date_str: str) -> str:
+        """Search date qualifier value: the bare day for UTC, else the exact local-day range."""
+        if self.day_tz is timezone.utc:
+            return date_str
+        return "..".join(self._day_window(date_str))
+
     def _make_request_with_retry(
         self, url: str, params: Optional[Dict] = None, max_retries: int = 3, timeout: int = 10
     ) -> requests.Response:
@@ -246,7 +494,7 @@ class GitHubCollector:
 
     def _unique_repo_owners(self) -> set:
         owners: set = set()
-        for repo in self.repositories:
+        for repo in self._canonical_repos():
             o = self._owner_repo(repo).split("/")[0]
             if o:
                 owners.add(o)
@@ -267,92 +515,588 @@ class GitHubCollector:
         """Deduplicated owner/name list from config (order preserved)."""
         seen: set = set()
         out: List[str] = []
-        for repo in self.repositories:
+        for repo in self._canonical_repos():
             o = self._owner_repo(repo)
             if o and o not in seen:
                 seen.add(o)
                 out.append(o)
         return out
 
+    def _read_owner_listing(self, owner: str) -> Optional[Dict]:
+        """
+        Every repo of `owner` (/user/repos for the token's user, else /orgs then /users) into the repo
+        registry. Returns the registry's owner inventory, or None when the listing is incomplete.
+        """
+        registry = get_repo_registry()
+        if self.username and owner == self.username.lower():
+            listings = [("user", f"{self.api_base}/user/repos", {"affiliation": "owner"})]
+        else:
+            listings = [
+                ("org", f"{self.api_base}/orgs/{owner}/repos", {"type": "all"}),
+                ("user", f"{self.api_base}/users/{owner}/repos", {"type": "all"}),
+            ]
+        for kind, url, params in listings:
+            repos: List[Dict] = []
+            for page in range(1, 51):
+                try:
+                    response = self._make_request_with_retry(url, params=dict(params, per_page=100, page=page))
+                except (PermissionError, DeadlineExceeded):
+                    raise
+                except Exception as e:
+                    logging.info("Repo listing for %s failed (%s); naming its repos one by one.", owner, e)
+                    return None
+                _forbidden_or_ratelimit(response, url, "repo listing")
+                if response.status_code != 200:
+                    break
+                batch = response.json()
+                repos.extend(r for r in batch if ((r.get("owner") or {}).get("login") or "").lower() == owner)
+                if len(batch) < 100:
+                    registry.note_owner_listing(owner, kind, repos)
+                    return registry.owner_inventory(owner)
+            if page > 1:
+                # Listed part of the way, then failed or ran out of pages: not known to be complete.
+                return None
+        return None
+
+    def _owner_search_qualifiers(self) -> Dict[str, str]:
+        """
+        {owner lower: "user:owner" | "org:owner"} for owners whose every repo is configured (per a complete
+        listing in the repo registry) and none is a fork, which commit search leaves out. Owners with
+        GITHUB_OWNER_QUALIFIER_MIN_REPOS (default 20) or more configured repos are listed when the registry
+        has no fresh listing. Empty with the registry off. Resolved once per collector.
+        """
+        if self._owner_qualifiers is not None:
+            return self._owner_qualifiers
+        qualifiers: Dict[str, str] = {}
+        registry = get_repo_registry()
+        if registry:
+            try:
+                min_repos = int(os.getenv("GITHUB_OWNER_QUALIFIER_MIN_REPOS", str(_OWNER_QUALIFIER_MIN_REPOS)))
+            except ValueError:
+                min_repos = _OWNER_QUALIFIER_MIN_REPOS
+            by_owner: Dict[str, set] = {}
+            for o in self._normalized_repo_list():
+                by_owner.setdefault(o.split("/")[0].lower(), set()).add(o.lower())
+            for owner, names in by_owner.items():
+                inventory = registry.owner_inventory(owner)
+                if inventory is None and len(names) >= max(1, min_repos):
+                    inventory = self._read_owner_listing(owner)
+                if inventory and inventory["repos"] and not inventory["forks"] and set(inventory["repos"]) <= names:
+                    qualifiers[owner] = f"{inventory['kind']}:{owner}"
+        self._owner_qualifiers = qualifiers
+        return qualifiers
+
+    def _search_terms(self) -> List[str]:
+        """repo:owner/name per configured repo, with the repos of fully configured owners folded into user:/org:."""
+        qualifiers = self._owner_search_qualifiers()
+        terms = list(dict.fromkeys(qualifiers.values()))
+        terms.extend(f"repo:{o}" for o in self._normalized_repo_list() if o.split("/")[0].lower() not in qualifiers)
+        return terms
+
+    def _configured_search_repos(self) -> set:
+        """Lowercase owner/name of configured repos: search hits from other repos (an owner's new repo
+        under user:/org:) are dropped."""
+        return {o.lower() for o in self._normalized_repo_list()}
+
     def _chunk_repo_search_queries(self, prefix: str) -> List[str]:
         """
-        Build GitHub Search `q` strings under the 256-char limit (leave margin).
-        Example: committer-date:2026-04-04 (repo:a/b OR repo:a/c)
+        Build GitHub Search `q` strings under the 256-char limit (leave margin), as few as possible:
+        _search_terms bin-packed first-fit-decreasing (_pack_search_terms).
+        Example: committer-date:2026-04-04 (repo:a/b OR repo:c/d OR org:acme)
         """
-        repos = self._normalized_repo_list()
-        if not repos:
+        terms = self._search_terms()
+        if not terms:
             return []
         try:
             max_len = int(os.getenv("GITHUB_PREFLIGHT_MAX_Q_LEN", "240"))
         except ValueError:
             max_len = 240
         max_len = max(80, min(max_len, 250))
-        queries: List[str] = []
-        start = 0
-        while start < len(repos):
-            chunk: List[str] = []
-            j = start
-            while j < len(repos):
-                trial = chunk + [repos[j]]
-                if len(trial) == 1:
-                    q = f"{prefix} repo:{trial[0]}"
+        capacity = max_len - len(prefix) - len(" ()")
+        tuner = get_preflight_tuner()
+        if tuner:
+            groups = tuner.packed_groups(tuner_account(self), terms, capacity, _pack_search_terms)
+        else:
+            groups = _pack_search_terms(terms, capacity)
+        if groups is None:
+            logging.warning(
+                "Preflight: cannot fit a repo in a search query (max %s chars); running full scan.", max_len
+            )
+            return []
+        return [f"{prefix} {g[0]}" if len(g) == 1 else f"{prefix} ({' OR '.join(g)})" for g in groups]
+
+    def _search_all_items(self, path: str, q: str, params: Dict, limit: int) -> Optional[List[Dict]]:
+        """
+        Every item for one search query, or None when total_count >= limit, results are incomplete,
+        or a page fails (caller falls back to the fan-out). Search never returns more than 1,000 items.
+        """
+        items: List[Dict] = []
+        page = 1
+        total = None
+        while total is None or len(items) < total:
+            r = self._search_request(path, dict(params, q=q, per_page=100, page=page))
+            _forbidden_or_ratelimit(r, "search collection", path)
+            if r.status_code != 200:
+                logging.info("Search collection: %s HTTP %s; falling back to per-repo fetches.", path, r.status_code)
+                return None
+            data = r.json()
+            if data.get("incomplete_results"):
+                logging.info("Search collection: %s returned incomplete results; falling back.", path)
+                return None
+            if total is None:
+                total = int(data.get("total_count") or 0)
+                if total >= min(limit, 1000):
+                    logging.info("Search collection: %s total_count=%s (limit %s); falling back.", path, total, limit)
+                    return None
+            batch = data.get("items") or []
+            if not batch:
+                break
+            items.extend(batch)
+            page += 1
+        return items
+
+    def _collect_via_search(self, date_str: str) -> Optional[Dict]:
+        """
+        GITHUB_PREFLIGHT=search: page through the repo-scoped commit/issue searches and build the
+        collect_data_for_date result straight from the items, with no per-repo fan-out.
+        None = too much activity (GITHUB_SEARCH_COLLECT_MAX, default 500) or a failed query.
+        """
+        try:
+            limit = int(os.getenv("GITHUB_SEARCH_COLLECT_MAX", "500"))
+        except ValueError:
+            limit = 500
+        try:
+            max_queries = int(os.getenv("GITHUB_PREFLIGHT_MAX_SEARCH_QUERIES", "24"))
+        except ValueError:
+            max_queries = 24
+
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        # Search matches dates in the committer's own offset; widen by a day and keep the configured
+        # day window, like the REST path does.
+        span = f"{(day - timedelta(days=1)).isoformat()}..{(day + timedelta(days=1)).isoformat()}"
+        commit_qs = self._chunk_repo_search_queries(f"committer-date:{span}")
+        issue_qs = self._chunk_repo_search_queries(f"created:{span}")
+        window = self._day_window(date_str)
+        if not commit_qs or not issue_qs or len(commit_qs) + len(issue_qs) > max_queries:
+            return None
+
+        per_repo: Dict[str, Dict] = {}
+        # Search hits are matched case-insensitively; report names as configured, like the REST path.
+        display = {o.lower(): o.split("/")[-1] for o in self._normalized_repo_list()}
+        configured = self._configured_search_repos()
+
+        def entry(full_name: str, name: str) -> Dict:
+            key = full_name.lower()
+            if key not in per_repo:
+                per_repo[key] = {"repo": name, "commits": 0, "prs": 0, "issues": 0, "commit_details": [], "_shas": set()}
+            return per_repo[key]
+
+        for q in commit_qs:
+            items = self._search_all_items("/search/commits", q, {"sort": "committer-date", "order": "desc"}, limit)
+            if items is None:
+                return None
+            for item in items:
+                commit_obj = item.get("commit") or {}
+                timestamp = utc_timestamp((commit_obj.get("committer") or {}).get("date", ""))
+                if not in_window(timestamp, window):
+                    continue
+                full_name = _search_item_repo(item)
+                if full_name not in configured:
+                    continue
+                e = entry(full_name, display.get(full_name, full_name.split("/")[-1]))
+                if item["sha"] in e["_shas"]:
+                    continue
+                e["_shas"].add(item["sha"])
+                e["commit_details"].append(
+                    {
+                        "sha": item["sha"][:7],
+                        "message": (commit_obj.get("message") or "").split("\n")[0],
+                        "author": (commit_obj.get("author") or {}).get("name", "Unknown"),
+                        "url": item.get("html_url", ""),
+                        "timestamp": timestamp,
+                    }
+                )
+
+        for q in issue_qs:
+            items = self._search_all_items("/search/issues", q, {"sort": "created", "order": "desc"}, limit)
+            if items is None:
+                return None
+            for item in items:
+                if not in_window(item.get("created_at") or "", window):
+                    continue
+                full_name = _search_item_repo(item)
+                if full_name not in configured:
+                    continue
+                e = entry(full_name, display.get(full_name, full_name.split("/")[-1]))
+                # Issue search also returns PRs; count each once, under its own kind.
+                if "pull_request" in item:
+                    e["prs"] += 1
                 else:
-                    inner = " OR ".join(f"repo:{r}" for r in trial)
-                    q = f"{prefix} ({inner})"
-                if len(q) > max_len:
-                    break
-                chunk = trial
-                j += 1
-            if not chunk:
-                logging.warning(
-                    "Preflight: cannot fit repo %s in search query (max %s chars); running full scan.",
-                    repos[start],
-                    max_len,
+                    e["issues"] += 1
+
+        results = []
+        for e in per_repo.values():
+            e.pop("_shas")
+            # Newest first in UTC, like the REST commits list.
+            e["commit_details"].sort(key=lambda c: c["timestamp"], reverse=True)
+            e["commits"] = len(e["commit_details"])
+            results.append(e)
+        commits, prs, issues, repository_details = _summarize_repo_results(results)
+        logging.info(
+            "Search collection: %s commits, %s PRs, %s issues on %s from %s search queries; no fan-out.",
+            commits,
+            prs,
+            issues,
+            date_str,
+            len(commit_qs) + len(issue_qs),
+        )
+        return {
+            "commits": commits,
+            "prs": prs,
+            "issues": issues,
+            "repository_details": repository_details,
+            "preflight_skipped_fanout": True,
+            "collected_via_search": True,
+            "repositories_configured": len(self.repositories),
+        }
+
+    def _events_feed(self, url: str, since_iso: str) -> Optional[List[Dict]]:
+        """
+        Events from one feed (newest first) back to since_iso. None = the feed may not reach back that
+        far (GitHub serves at most 300 events per feed) or could not be read.
+        """
+        events: List[Dict] = []
+        for page in range(1, _EVENTS_MAX_PAGES + 1):
+            r = self._make_request_with_retry(url, params={"per_page": 100, "page": page})
+            _forbidden_or_ratelimit(r, url, "events")
+            if r.status_code != 200:
+                # 422 = past the feed's pagination limit: older events exist but cannot be read.
+                logging.info("Events: %s HTTP %s; feed not usable.", url, r.status_code)
+                return None
+            batch = r.json()
+            events.extend(batch)
+            if len(batch) < 100:
+                # End of the feed: nothing older within the retention window.
+                return events
+            if utc_timestamp(batch[-1].get("created_at") or "") < since_iso:
+                return events
+        logging.info("Events: %s has more than %s events since %s; feed truncated.", url, len(events), since_iso)
+        return None
+
+    def _events_feeds(self, owners: set) -> List[Tuple[Optional[str], List[str]]]:
+        """
+        (owner, feed URLs to try in order) per feed: the token user's own events and received events
+        (activity by others on repos the user watches, own repos included) with owner None, and one org
+        feed per other owner. The member's view of an org feed includes private repos; /orgs/{org}/events
+        is public only.
+        """
+        user = self.username
+        feeds: List[Tuple[Optional[str], List[str]]] = [
+            (None, [f"{self.api_base}/users/{user}/events"]),
+            (None, [f"{self.api_base}/users/{user}/received_events"]),
+        ]
+        for owner in sorted(owners):
+            if owner.lower() != user.lower():
+                feeds.append(
+                    (owner.lower(), [f"{self.api_base}/users/{user}/events/orgs/{owner}", f"{self.api_base}/orgs/{owner}/events"])
                 )
-                return []
-            if len(chunk) == 1:
-                queries.append(f"{prefix} repo:{chunk[0]}")
-            else:
-                inner = " OR ".join(f"repo:{r}" for r in chunk)
-                queries.append(f"{prefix} ({inner})")
-            start = j
-        return queries
+        return feeds
+
+    def _collect_via_events(self, date_str: str) -> Optional[Dict]:
+        """
+        GITHUB_PREFLIGHT=events: a few event-feed pages instead of ~3 calls per repo.
+        PullRequestEvent/IssuesEvent "opened" give the PR and issue counts; a PushEvent since the day
+        began marks the repos whose commits are listed (commits pushed later can still be dated that day).
+        Repos whose owner has no readable feed are fetched per repo. None = date older than the feeds
+        keep or a user feed truncated; the caller runs the full scan.
+        Events can reach the API minutes after the push, so a run right after late activity may miss it.
+        """
+        window = self._day_window(date_str)
+        oldest = (datetime.now(timezone.utc) - timedelta(days=_EVENTS_MAX_AGE_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if window[0] < oldest:
+            return None
+        configured = {o.lower(): o for o in self._normalized_repo_list()}
+        if not configured or not self.username:
+            return None
+
+        events: Dict[str, Dict] = {}
+        unread_owners: set = set()
+        calls = 0
+        for owner, urls in self._events_feeds({o.split("/")[0] for o in configured.values()}):
+            feed = None
+            for url in urls:
+                calls += 1
+                feed = self._events_feed(url, window[0])
+                if feed is not None:
+                    break
+            if feed is None:
+                if owner is None:
+                    logging.info("Events: user feed unusable for %s; running full scan.", date_str)
+                    return None
+                unread_owners.add(owner)
+                continue
+            for event in feed:
+                events.setdefault(str(event.get("id")), event)
+
+        pushed: set = set()
+        opened: Dict[str, Dict[str, set]] = {}
+        for event in events.values():
+            full = ((event.get("repo") or {}).get("name") or "").lower()
+            if full not in configured or full.split("/")[0] in unread_owners:
+                continue
+            created = utc_timestamp(event.get("created_at") or "")
+            kind = event.get("type")
+            payload = event.get("payload") or {}
+            if kind == "PushEvent":
+                if created >= window[0]:
+                    pushed.add(full)
+            elif kind in ("PullRequestEvent", "IssuesEvent") and payload.get("action") == "opened":
+                item = payload.get("pull_request" if kind == "PullRequestEvent" else "issue") or {}
+                if kind == "IssuesEvent" and "pull_request" in item:
+                    continue
+                if in_window(item.get("created_at") or created, window):
+                    key = "prs" if kind == "PullRequestEvent" else "issues"
+                    opened.setdefault(full, {"prs": set(), "issues": set()})[key].add(item.get("number") or event.get("id"))
+
+        fallback = [o for full, o in configured.items() if full.split("/")[0] in unread_owners]
+        error_repos: List[str] = []
+
+        def from_events(owner_repo: str, details: List[Dict]) -> Dict:
+            kinds = opened.get(owner_repo.lower(), {"prs": set(), "issues": set()})
+            return {
+                "repo": owner_repo.split("/")[-1],
+                "commits": len(details),
+                "prs": len(kinds["prs"]),
+                "issues": len(kinds["issues"]),
+                "commit_details": details,
+            }
+
+        def with_commits(owner_repo: str) -> Dict:
+            details: List[Dict] = []
+            self._fetch_commits_for_repo(owner_repo, owner_repo.split("/")[-1], window, set(), details)
+            return from_events(owner_repo, details)
+
+        results = [from_events(configured[full], []) for full in opened if full not in pushed]
+        tasks = {configured[full]: (lambda r=configured[full]: with_commits(r)) for full in sorted(pushed)}
+        tasks.update({r: (lambda r=r: self._fetch_repo_data(r, date_str)) for r in fallback})
+        if tasks:
+            max_workers = _get_github_fetch_max_workers(len(tasks))
+            get_transport(max_workers)
+            results.extend(result for _, result in _drain_repo_tasks(tasks, max_workers, error_repos))
+        if error_repos:
+            raise PermissionError(
+                _access_denied_message(error_repos, "Process stopped. No calendar files will be written.")
+            )
+
+        commits, prs, issues, repository_details = _summarize_repo_results(results)
+        logging.info(
+            "Events collection: %s commits, %s PRs, %s issues on %s from %s feed reads; %s repos pushed to, "
+            "%s fetched per repo.",
+            commits,
+            prs,
+            issues,
+            date_str,
+            calls,
+            len(pushed),
+            len(fallback),
+        )
+        return {
+            "commits": commits,
+            "prs": prs,
+            "issues": issues,
+            "repository_details": repository_details,
+            "preflight_skipped_fanout": True,
+            "collected_via_events": True,
+            "preflight_active_repos": len(pushed) + len(fallback),
+            "repositories_configured": len(self.repositories),
+        }
+
+    def _webhook_audit_gaps(self, hooks: Dict[int, Dict], logged: set, window: Window, repos: set) -> set:
+        """
+        GITHUB_WEBHOOK_AUDIT=on: repos whose hook shows a push/pull_request/issues delivery since the window
+        began that is not in the log (failed, or sent while the tunnel was down). One deliveries page per
+        hook, more only while they reach back into the window. Unreadable hooks make their repos gaps.
+        """
+        gaps: set = set()
+        for hook_id, hook in hooks.items():
+            scope = hook["scope"] or ""
+            covered = {r for r in repos if r.split("/")[0] == scope[1:]} if scope.startswith("@") else {scope} & repos
+            if not covered:
+                continue
+            base = f"orgs/{scope[1:]}" if scope.startswith("@") else f"repos/{scope}"
+            url: Optional[str] = f"{self.api_base}/{base}/hooks/{hook_id}/deliveries"
+            params: Optional[Dict] = {"per_page": 100}
+            missing = False
+            try:
+                for _ in range(10):
+                    response = self._make_request_with_retry(url, params=params)
+                    _forbidden_or_ratelimit(response, url, "hook deliveries")
+                    if response.status_code != 200:
+                        missing = True
+                        break
+                    deliveries = response.json() or []
+                    for d in deliveries:
+                        if d.get("event") in WEBHOOK_EVENTS and utc_timestamp(d.get("delivered_at") or "") >= window[0]:
+                            missing = missing or d.get("guid") not in logged
+                    url, params = response.links.get("next", {}).get("url"), None
+                    if missing or not url or not deliveries:
+                        break
+                    if utc_timestamp(deliveries[-1].get("delivered_at") or "") < window[0]:
+                        break
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.info("Webhook audit: hook %s deliveries unreadable (%s).", hook_id, e)
+                missing = True
+            if missing:
+                gaps |= covered
+        return gaps
+
+    def _collect_via_webhooks(self, date_str: str) -> Optional[Dict]:
+        """
+        GITHUB_WEBHOOKS=on: answer from the webhook receiver's log (collectors/webhook_log.py). Repos the log
+        cannot vouch for (hook newer than the day, a push missing from the before/after chain, a forced or
+        cut-short push, a delivery the audit found missing) are fetched per repo. None = the receiver was
+        not up for the whole day so far; the caller goes on to the API path.
+        """
+        log = get_webhook_log()
+        if log is None:
+            return None
+        window = self._day_window(date_str)
+        configured = {o.lower(): o for o in self._normalized_repo_list()}
+        answer = log.answer_day(window, list(configured), _commits_all_branches_enabled())
+        if answer is None:
+            logging.info("Webhooks: receiver not up for all of %s; using the API.", date_str)
+            return None
+        from_log, gaps, hooks = answer
+        if os.getenv("GITHUB_WEBHOOK_AUDIT", "").strip().lower() in ("1", "true", "yes", "on") and hooks:
+            logged = {r.get("delivery") for r in log.records() if r.get("delivery")}
+            audit_gaps = self._webhook_audit_gaps(hooks, logged, window, set(configured) - gaps)
+            for repo in audit_gaps:
+                from_log.pop(repo, None)
+            gaps |= audit_gaps
+
+        results = [
+            {
+                "repo": configured[full].split("/")[-1],
+                "commits": len(entry["commits"]),
+                "prs": entry["prs"],
+                "issues": entry["issues"],
+                "commit_details": entry["commits"],
+            }
+            for full, entry in from_log.items()
+        ]
+        error_repos: List[str] = []
+        tasks = {configured[full]: (lambda r=configured[full]: self._fetch_repo_data(r, date_str)) for full in sorted(gaps)}
+        if tasks:
+            max_workers = _get_github_fetch_max_workers(len(tasks))
+            get_transport(max_workers)
+            results.extend(result for _, result in _drain_repo_tasks(tasks, max_workers, error_repos))
+        if error_repos:
+            raise PermissionError(
+                _access_denied_message(error_repos, "Process stopped. No calendar files will be written.")
+            )
+
+        commits, prs, issues, repository_details = _summarize_repo_results(results)
+        logging.info(
+            "Webhooks: %s commits, %s PRs, %s issues on %s from the event log; %s of %s repos fetched over the API.",
+            commits,
+            prs,
+            issues,
+            date_str,
+            len(gaps),
+            len(configured),
+        )
+        return {
+            "commits": commits,
+            "prs": prs,
+            "issues": issues,
+            "repository_details": repository_details,
+            "preflight_skipped_fanout": True,
+            "collected_via_webhooks": True,
+            "webhook_gap_repos": len(gaps),
+            "repositories_configured": len(self.repositories),
+        }
 
     def _preflight_should_skip_full_scan(self, date_str: str) -> Optional[bool]:
         """
         Return True to skip per-repo fetches (no activity in preflight scope).
         False = activity found. None = inconclusive; run full scan.
         """
-        mode = _preflight_mode()
+        return self._run_preflight(date_str)[0]
+
+    def _run_preflight(self, date_str: str) -> Tuple[Optional[bool], Optional[set]]:
+        """
+        (skip, active repos). active is the lowercase owner/name set to fan out to when the repos
+        preflight saw every hit; None means fan out to every configured repo.
+        """
+        mode = self._preflight()
         if mode is None:
-            return None
+            return None, None
 
         if mode == "repos":
             return self._preflight_repo_scoped(date_str)
         if mode == "author":
-            return self._preflight_author_scope(date_str)
+            return self._preflight_author_scope(date_str), None
         if mode == "namespace":
-            return self._preflight_namespace_scope(date_str)
-        return None
+            return self._preflight_namespace_scope(date_str), None
+        return None, None
+
+    def _preflight_repo_hits(self, path: str, q: str, label: str) -> Optional[Tuple[set, bool]]:
+        """
+        owner/name (lowercase) of every repo hit by one preflight query. Returns (repos, covered);
+        covered=False when more hits exist than were read (GITHUB_PREFLIGHT_MAX_PAGES x 100, default 2).
+        None = query rejected/failed; run full scan.
+        """
+        try:
+            max_pages = int(os.getenv("GITHUB_PREFLIGHT_MAX_PAGES", "2"))
+        except ValueError:
+            max_pages = 2
+        configured = self._configured_search_repos()
+        repos: set = set()
+        seen = 0
+        page = 1
+        while True:
+            r = self._search_request(path, {"q": q, "per_page": 100, "page": page})
+            _forbidden_or_ratelimit(r, "preflight", f"{label} search")
+            if r.status_code == 422:
+                logging.info("Preflight repos: %s search 422 (query rejected); running full scan.", label)
+                return None
+            if r.status_code != 200:
+                logging.info("Preflight repos: %s search HTTP %s; running full scan.", label, r.status_code)
+                return None
+            tc = self._search_total_count(r)
+            if tc is None:
+                return None
+            data = r.json()
+            items = data.get("items") or []
+            repos.update(name for name in map(_search_item_repo, items) if name in configured)
+            seen += len(items)
+            if seen >= tc:
+                return repos, not data.get("incomplete_results")
+            if not items or page >= max(1, max_pages):
+                return repos, False
+            page += 1
 
-    def _preflight_repo_scoped(self, date_str: str) -> Optional[bool]:
+    def _preflight_repo_scoped(self, date_str: str) -> Tuple[Optional[bool], Optional[set]]:
         """
         Personal-account friendly: search commits by committer-date (any author: you, AI, bots)
         and issues/PRs created that day, scoped to configured repos only.
+        Also returns the set of repos the hits came from (None when the hit set may be truncated).
         """
         try:
             max_queries = int(os.getenv("GITHUB_PREFLIGHT_MAX_SEARCH_QUERIES", "24"))
         except ValueError:
             max_queries = 24
 
-        commit_prefix = f"committer-date:{date_str}"
-        issue_prefix = f"created:{date_str}"
+        commit_prefix = f"committer-date:{self._search_day(date_str)}"
+        issue_prefix = f"created:{self._search_day(date_str)}"
 
         commit_qs = self._chunk_repo_search_queries(commit_prefix)
         issue_qs = self._chunk_repo_search_queries(issue_prefix)
         if not commit_qs or not issue_qs:
             logging.info("Preflight repos: no repositories; running full scan.")
-            return None
+            return None, None
 
         total_q = len(commit_qs) + len(issue_qs)
         if total_q > max_queries:
@@ -361,55 +1105,113 @@ class GitHubCollector:
                 total_q,
                 max_queries,
             )
-            return None
+            return None, None
+
+        active: set = set()
+        covered = True
+        for path, queries, label in (
+            ("/search/commits", commit_qs, "commits"),
+            ("/search/issues", issue_qs, "issues"),
+        ):
+            for q in queries:
+                hits = self._preflight_repo_hits(path, q, label)
+                if hits is None:
+                    return None, None
+                active |= hits[0]
+                covered = covered and hits[1]
+
+        if not active and covered:
+            logging.info(
+                "Preflight repos: no commits (committer-date) and no issues/PRs created on %s in configured repos; "
+                "skipping per-repo fetches.",
+                date_str,
+            )
+            return True, set()
 
-        try:
-            for q in commit_qs:
-                r = self._search_request("/search/commits", {"q": q, "per_page": 1})
-                _forbidden_or_ratelimit(r, "preflight", "commits search")
-                if r.status_code == 422:
-                    logging.info("Preflight repos: commits search 422 (query rejected); running full scan.")
-                    return None
-                if r.status_code != 200:
-                    logging.info("Preflight repos: commits search HTTP %s; running full scan.", r.status_code)
-                    return None
-                tc = self._search_total_count(r)
-                if tc is None:
-                    return None
-                if tc > 0:
-                    logging.info(
-                        "Preflight repos: commit activity in configured repos (hint total_count=%s); full scan.",
-                        tc,
-                    )
-                    return False
+        if not covered:
+            logging.info("Preflight repos: activity in configured repos, hit list truncated; full scan.")
+            return False, None
+        logging.info("Preflight repos: activity in %s configured repos; fetching only those.", len(active))
+        return False, active
+
+    def _range_search_span(self, since_date: date, until_date: date) -> str:
+        """Search date-range qualifier value for [since, until]: bare days for UTC, else exact local-day bounds."""
+        if self.day_tz is timezone.utc:
+            return f"{since_date.isoformat()}..{until_date.isoformat()}"
+        return "..".join(span_window(since_date, until_date, self.day_tz))
 
-            for q in issue_qs:
-                r = self._search_request("/search/issues", {"q": q, "per_page": 1})
-                _forbidden_or_ratelimit(r, "preflight", "issues search")
-                if r.status_code == 422:
-                    logging.info("Preflight repos: issues search 422 (query rejected); running full scan.")
+    def preflight_range(self, since_date: date, until_date: date) -> Optional[Tuple[set, Optional[set]]]:
+        """
+        Which days in [since, until] have activity, from committer-date:A..B and created:A..B searches over
+        the chunked repo queries. Hits are bucketed by local day; a query whose hits were not all read is
+        split in half by date until each day is settled, so a quiet range costs one query per chunk and kind.
+        Returns (active days as YYYY-MM-DD, configured repos with hits, or None when a busy day's hits
+        were not all read), or None when a search fails, preflight is off
+        (GITHUB_PREFLIGHT=off), all-branches mode is on (commit search only indexes default branches)
+        or it would take more than GITHUB_RANGE_PREFLIGHT_MAX_QUERIES (default 60).
+        """
+        if self._preflight() is None or _commits_all_branches_enabled():
+            return None
+        try:
+            max_queries = int(os.getenv("GITHUB_RANGE_PREFLIGHT_MAX_QUERIES", "60"))
+        except ValueError:
+            max_queries = 60
+        first, last = since_date.isoformat(), until_date.isoformat()
+        configured = self._configured_search_repos()
+        days: set = set()
+        repos: set = set()
+        covered = True
+        queries = 0
+        for path, field, stamp in (
+            ("/search/commits", "committer-date", lambda item: ((item.get("commit") or {}).get("committer") or {}).get("date")),
+            ("/search/issues", "created", lambda item: item.get("created_at")),
+        ):
+            full_prefix = f"{field}:{self._range_search_span(since_date, until_date)}"
+            chunks = self._chunk_repo_search_queries(full_prefix)
+            if not chunks:
+                return None
+            # Every sub-span has the same length, so a chunk's repo list still fits after swapping the dates.
+            pending = [(q[len(full_prefix) :], since_date, until_date) for q in chunks]
+            while pending:
+                scope, a, b = pending.pop()
+                queries += 1
+                if queries > max_queries:
+                    logging.info("Range preflight: more than %s search queries needed; skipping it.", max_queries)
                     return None
+                q = f"{field}:{self._range_search_span(a, b)}{scope}"
+                r = self._search_request(path, {"q": q, "per_page": 100})
+                _forbidden_or_ratelimit(r, "range preflight", f"{field} search")
                 if r.status_code != 200:
-                    logging.info("Preflight repos: issues search HTTP %s; running full scan.", r.status_code)
+                    logging.info("Range preflight: %s search HTTP %s; skipping it.", field, r.status_code)
                     return None
-                tc = self._search_total_count(r)
-                if tc is None:
-                    return None
-                if tc > 0:
-                    logging.info(
-                        "Preflight repos: issue/PR activity in configured repos (hint total_count=%s); full scan.",
-                        tc,
-                    )
-                    return False
-        except PermissionError:
-            raise
-
+                data = r.json()
+                items = data.get("items") or []
+                for item in items:
+                    day = local_day(utc_timestamp(stamp(item) or ""), self.day_tz)
+                    full_name = _search_item_repo(item)
+                    if first <= day <= last and full_name in configured:
+                        days.add(day)
+                        repos.add(full_name)
+                if int(data.get("total_count") or 0) <= len(items) and not data.get("incomplete_results"):
+                    continue
+                if a < b:
+                    mid = a + timedelta(days=(b - a).days // 2)
+                    pending.extend([(scope, a, mid), (scope, mid + timedelta(days=1), b)])
+                else:
+                    # One busy day: it is active, but not every repo behind it was seen.
+                    days.add(a.isoformat())
+                    covered = False
         logging.info(
-            "Preflight repos: no commits (committer-date) and no issues/PRs created on %s in configured repos; "
-            "skipping per-repo fetches.",
-            date_str,
+            "Range preflight: %s of %s days active between %s and %s (%s search queries).",
+            len(days),
+            (until_date - since_date).days + 1,
+            first,
+            last,
+            queries,
         )
-        return True
+        if not covered:
+            return days, None
+        return days, [r for r in self._canonical_repos() if self._owner_repo(r).lower() in repos]
 
     def _preflight_author_scope(self, date_str: str) -> Optional[bool]:
         """Author-scoped Search API: your commits + your issues/PRs created that day."""
@@ -418,8 +1220,8 @@ class GitHubCollector:
             return None
 
         u = self.username
-        q_commits = f"author-date:{date_str} author:{u}"
-        q_issues = f"created:{date_str} author:{u}"
+        q_commits = f"author-date:{self._search_day(date_str)} author:{u}"
+        q_issues = f"created:{self._search_day(date_str)} author:{u}"
 
         try:
             r1 = self._search_request("/search/commits", {"q": q_commits, "per_page": 1})
@@ -465,14 +1267,20 @@ class GitHubCollector:
             logging.info("Preflight namespace: multiple owners %s; running full scan.", owners)
             return None
         owner = next(iter(owners))
-        q_commits = f"committer-date:{date_str} org:{owner}"
-        q_issues = f"created:{date_str} org:{owner}"
+        tuner = get_preflight_tuner()
+        if tuner and tuner.capability(tuner_account(self), "namespace") is False:
+            logging.info("Preflight namespace: org:%s search known to fail for this account (cached); running full scan.", owner)
+            return None
+        q_commits = f"committer-date:{self._search_day(date_str)} org:{owner}"
+        q_issues = f"created:{self._search_day(date_str)} org:{owner}"
 
         try:
             r1 = self._search_request("/search/commits", {"q": q_commits, "per_page": 1})
             _forbidden_or_ratelimit(r1, "preflight", "commits search")
             if r1.status_code == 422:
                 logging.info("Preflight namespace: commits search not supported for this account; running full scan.")
+                if tuner:
+                    tuner.note_capability(tuner_account(self), "namespace", False, 422)
                 return None
             if r1.status_code != 200:
                 logging.info("Preflight namespace: commits search HTTP %s; running full scan.", r1.status_code)
@@ -482,6 +1290,8 @@ class GitHubCollector:
             _forbidden_or_ratelimit(r2, "preflight", "issues search")
             if r2.status_code == 422:
                 logging.info("Preflight namespace: issues search not supported; running full scan.")
+                if tuner:
+                    tuner.note_capability(tuner_account(self), "namespace", False, 422)
                 return None
             if r2.status_code != 200:
                 logging.info("Preflight namespace: issues search HTTP %s; running full scan.", r2.status_code)
@@ -489,6 +1299,8 @@ class GitHubCollector:
         except PermissionError:
             raise
 
+        if tuner:
+            tuner.note_capability(tuner_account(self), "namespace", True, 200)
         tc1 = self._search_total_count(r1)
         tc2 = self._search_total_count(r2)
         if tc1 is None or tc2 is None:
@@ -510,190 +1322,802 @@ class GitHubCollector:
         )
         return False
 
-    def _commits_list_url(self, owner_repo: str, repo: str) -> str:
-        if "/" in owner_repo:
-            return f"{self.api_base}/repos/{owner_repo}/commits"
-        return f"{self.api_base}/repos/{self.username}/{repo}/commits"
-
-    def _list_branch_names(self, owner_repo: str, repo: str) -> List[str]:
-        if "/" in owner_repo:
-            branches_url = f"{self.api_base}/repos/{owner_repo}/branches"
-        else:
-            branches_url = f"{self.api_base}/repos/{self.username}/{repo}/branches"
-        names: List[str] = []
+    def _list_repos_by_push(self, url: str, params: Dict, cutoff_iso: str, max_pages: int = 10) -> Tuple[Dict[str, Dict], bool]:
+        """
+        Walk a repo listing sorted by pushed (newest first). Returns ({owner/name lower: repo}, cut_off);
+        cut_off=True means paging stopped at a repo pushed before cutoff_iso, so every unseen repo
+        in this listing is older still.
+        """
+        seen: Dict[str, Dict] = {}
         page = 1
-        max_pages = 5
-        per_page = 100
         while page <= max_pages:
-            try:
-                response = self._make_request_with_retry(branches_url, params={"per_page": per_page, "page": page})
-            except PermissionError:
-                raise
-            except Exception as e:
-                logging.warning(f"Failed to fetch branches page {page} for {repo}: {e}")
-                break
+            response = self._make_request_with_retry(url, params=dict(params, per_page=100, page=page))
+            _forbidden_or_ratelimit(response, url, "repo listing")
             if response.status_code != 200:
-                break
+                return seen, False
             batch = response.json()
-            if not batch:
-                break
-            names.extend(b["name"] for b in batch)
-            if len(batch) < per_page:
-                break
+            for r in batch:
+                seen[(r.get("full_name") or "").lower()] = r
+            if not batch or len(batch) < 100:
+                return seen, False
+            if (batch[-1].get("pushed_at") or "") < cutoff_iso:
+                return seen, True
             page += 1
-        return names
+        return seen, False
 
-    def _process_commits_page(
-        self,
-        commits_data: List[Dict],
-        date_str: str,
+    def _prune_idle_repos(self, date_str: str, repos: Optional[List[str]] = None) -> Tuple[List[str], List[str], int]:
+        """
+        One /user/repos?sort=pushed walk (+ /orgs|/users/{owner}/repos for other owners) to learn pushed_at
+        and archived. Returns (repos to fetch in full, repos not pushed to since date_str, number whose
+        commit fetches are skipped). The second list still needs its PRs and issues: opening an issue, or a
+        PR from a fork, does not bump pushed_at. Repos archived before date_str are dropped; unknown repos
+        are kept. `repos` = a subset of the configured repos (default all). Disable with GITHUB_PUSHED_AT_PRUNE=off.
+        """
+        repos = self._canonical_repos() if repos is None else repos
+        if os.getenv("GITHUB_PUSHED_AT_PRUNE", "").strip().lower() in ("0", "false", "no", "off"):
+            return list(repos), [], 0
+        cutoff = self._day_window(date_str)[0]
+        registry = get_repo_registry()
+        wanted: Dict[str, str] = {}
+        archived = 0
+        for repo in repos:
+            if registry and registry.skip_reason(self._owner_repo(repo), cutoff) == "archived":
+                # Archived before cutoff (cached): cannot have been pushed to since.
+                archived += 1
+                continue
+            wanted[repo] = self._owner_repo(repo).lower()
+        if registry and archived:
+            registry.note_archived_skipped(archived)
+
+        try:
+            meta, cut_off = self._list_repos_by_push(f"{self.api_base}/user/repos", {"sort": "pushed"}, cutoff)
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logging.info("Repo listing failed (%s); fanning out to every repo.", e)
+            return list(wanted), [], archived
+        # /user/repos lists everything the token's user owns, so unseen own repos are older than cutoff.
+        idle_owners = {self.username.lower()} if cut_off and self.username else set()
+
+        for owner in sorted(self._unique_repo_owners()):
+            owner_l = owner.lower()
+            if owner_l in idle_owners or all(
+                full in meta for full in wanted.values() if full.split("/")[0] == owner_l
+            ):
+                continue
+            try:
+                org_meta, org_cut = self._list_repos_by_push(
+                    f"{self.api_base}/orgs/{owner}/repos", {"sort": "pushed", "type": "all"}, cutoff
+                )
+                if not org_meta and not org_cut:
+                    org_meta, org_cut = self._list_repos_by_push(
+                        f"{self.api_base}/users/{owner}/repos", {"sort": "pushed", "type": "all"}, cutoff
+                    )
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.info("Repo listing for %s failed (%s); keeping its repos.", owner, e)
+                continue
+            meta.update(org_meta)
+            if org_cut:
+                idle_owners.add(owner_l)
+
+        active: List[str] = []
+        idle: List[str] = []
+        for repo, full in wanted.items():
+            r = meta.get(full)
+            if r is not None and registry:
+                registry.note_meta(self._owner_repo(repo), r)
+            if r is None:
+                (idle if full.split("/")[0] in idle_owners else active).append(repo)
+                continue
+            pushed_at = r.get("pushed_at") or ""
+            if r.get("archived") and (r.get("updated_at") or pushed_at) < cutoff:
+                continue
+            (idle if pushed_at and pushed_at < cutoff else active).append(repo)
+
+        skipped = len(repos) - len(active)
+        if skipped:
+            logging.info(
+                "pushed_at: %s of %s repos idle or archived since %s; skipping their commit fetches.",
+                skipped,
+                len(repos),
+                date_str,
+            )
+        return active, idle, skipped
+
+    def _repo_resource_url(self, owner_repo: str, repo: str, resource: str) -> str:
+        if "/" in owner_repo:
+            return f"{self.api_base}/repos/{owner_repo}/{resource}"
+        return f"{self.api_base}/repos/{self.username}/{repo}/{resource}"
+
+    def _commits_list_url(self, owner_repo: str, repo: str) -> str:
+        return self._repo_resource_url(owner_repo, repo, "commits")
+
+    def _list_branch_heads(self, owner_repo: str, repo: str) -> List[Tuple[str, str]]:
+        """(branch name, head sha) for every branch (up to 500)."""
+        branches_url = self._repo_resource_url(owner_repo, repo, "branches")
+        heads: List[Tuple[str, str]] = []
+        page = 1
+        max_pages = 5
+        per_page = 100
+        while page <= max_pages:
+            try:
+                response = self._make_request_with_retry(branches_url, params={"per_page": per_page, "page": page})
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to fetch branches page {page} for {repo}: {e}")
+                break
+            if response.status_code != 200:
+                break
+            batch = response.json()
+            if not batch:
+                break
+            heads.extend((b["name"], (b.get("commit") or {}).get("sha", "")) for b in batch)
+            if len(batch) < per_page:
+                break
+            page += 1
+        return heads
+
+    def _process_commits_page(
+        self,
+        commits_data: List[Dict],
+        window: Window,
         seen_commits: set,
         commit_details: List[Dict],
+        walked: Optional[set] = None,
+        stop_at: Optional[set] = None,
     ) -> bool:
+        """
+        Collect the window's commits from one page; True = stop paging. `walked` gathers every sha seen
+        (the default branch's history); hitting a sha in `stop_at` ends the walk, since the rest is shared.
+        """
         for commit in commits_data:
             commit_sha = commit["sha"]
-            commit_date = commit["commit"]["committer"]["date"][:10]
-            if commit_date == date_str and commit_sha not in seen_commits:
-                seen_commits.add(commit_sha)
-                commit_msg = commit.get("commit", {}).get("message", "")
-                commit_author = commit.get("commit", {}).get("author", {}).get("name", "Unknown")
-                commit_url = commit.get("html_url", "")
-                commit_timestamp = commit.get("commit", {}).get("committer", {}).get("date", "")
-                commit_details.append(
-                    {
-                        "sha": commit_sha[:7],
-                        "message": commit_msg.split("\n")[0],
-                        "author": commit_author,
-                        "url": commit_url,
-                        "timestamp": commit_timestamp,
-                    }
-                )
-            elif commit_date < date_str:
+            if stop_at is not None and commit_sha in stop_at:
+                return True
+            if walked is not None:
+                walked.add(commit_sha)
+            committed_at = utc_timestamp(commit["commit"]["committer"]["date"])
+            if in_window(committed_at, window):
+                if commit_sha not in seen_commits:
+                    seen_commits.add(commit_sha)
+                    commit_details.append(_commit_detail(commit))
+            elif committed_at < window[0]:
                 return True
         return False
 
+    def _walk_branch_for_date(
+        self,
+        commits_url: str,
+        repo: str,
+        branch: Optional[str],
+        window: Window,
+        seen_commits: set,
+        commit_details: List[Dict],
+        walked: Optional[set] = None,
+        stop_at: Optional[set] = None,
+    ) -> Optional[List[Dict]]:
+        """
+        Page one branch's commits inside the window. Returns the first page (None if it failed).
+        The `until` bound starts the listing at the window, so an old date costs what today does.
+        """
+        first_page: Optional[List[Dict]] = None
+        page = 1
+        max_pages = 20
+        while page <= max_pages:
+            params = {
+                "since": window[0],
+                "until": window[1],
+                "per_page": 100,
+                "page": page,
+            }
+            if branch:
+                params["sha"] = branch
+            try:
+                response = self._make_request_with_retry(commits_url, params=params)
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to fetch commits for {repo} (branch={branch}, page={page}): {e}")
+                break
+            if response.status_code == 403:
+                _forbidden_or_ratelimit(response, repo, "commits")
+            if page == 1 and branch is None:
+                self._note_repo_response(self._owner_repo(repo), response)
+            if response.status_code != 200:
+                break
+            commits_data = response.json()
+            if page == 1:
+                first_page = commits_data
+            if not commits_data:
+                break
+            stop = self._process_commits_page(commits_data, window, seen_commits, commit_details, walked, stop_at)
+            if stop:
+                break
+            if len(commits_data) < 100:
+                break
+            page += 1
+        return first_page
+
     def _fetch_commits_for_repo(
-        self, owner_repo: str, repo: str, date_str: str, seen_commits: set, commit_details: List[Dict]
+        self, owner_repo: str, repo: str, window: Window, seen_commits: set, commit_details: List[Dict]
     ) -> int:
         commits_url = self._commits_list_url(owner_repo, repo)
+        heads: List[Tuple[str, str]] = []
         if _commits_all_branches_enabled():
             try:
-                branch_names = self._list_branch_names(owner_repo, repo)
-                branches: List[Optional[str]] = branch_names if branch_names else [None]
-            except PermissionError:
+                heads = self._list_branch_heads(owner_repo, repo)
+            except (PermissionError, DeadlineExceeded):
                 raise
             except Exception as e:
                 logging.warning(f"Failed to list branches for {repo}, using default: {e}")
-                branches = [None]
-        else:
-            branches = [None]
 
         initial_len = len(commit_details)
 
-        for branch in branches:
-            page = 1
-            max_pages = 20
-            while page <= max_pages:
-                params = {
-                    "since": f"{date_str}T00:00:00Z",
-                    "per_page": 100,
-                    "page": page,
-                }
-                if branch:
-                    params["sha"] = branch
-                try:
-                    response = self._make_request_with_retry(commits_url, params=params)
-                except PermissionError:
-                    raise
-                except Exception as e:
-                    logging.warning(f"Failed to fetch commits for {repo} (branch={branch}, page={page}): {e}")
-                    break
-                if response.status_code == 403:
-                    _forbidden_or_ratelimit(response, repo, "commits")
-                if response.status_code != 200:
-                    break
-                commits_data = response.json()
-                if not commits_data:
-                    break
-                stop = self._process_commits_page(commits_data, date_str, seen_commits, commit_details)
-                if stop:
-                    break
-                if len(commits_data) < 100:
-                    break
-                page += 1
+        # Default branch first: most branches share its history, which then ends their walks early.
+        default_walked: set = set()
+        self._walk_branch_for_date(commits_url, repo, None, window, seen_commits, commit_details, walked=default_walked)
+
+        cache = get_branch_head_cache() if heads else None
+        for name, sha in heads:
+            if branch_skip_reason(cache, owner_repo, name, sha, window[0], default_walked):
+                continue
+            first_page = self._walk_branch_for_date(
+                commits_url, repo, name, window, seen_commits, commit_details, stop_at=default_walked
+            )
+            if cache:
+                cache.record(owner_repo, name, sha, first_page, window)
 
         return len(commit_details) - initial_len
 
-    def _fetch_repo_data(self, repo: str, date_str: str) -> Dict:
+    def _fetch_repo_data(self, repo: str, date_str: str, mirrored: Optional[List[Dict]] = None) -> Dict:
+        """Commits, PRs and issues for one repo and day; `mirrored` = commit_details already read from a git mirror."""
         repo_commits = 0
-        repo_prs = 0
-        repo_issues = 0
         seen_commits = set()
         commit_details = []
 
         owner_repo = self._owner_repo(repo)
+        window = self._day_window(date_str)
+
+        if mirrored is not None:
+            commit_details = mirrored
+            repo_commits = len(mirrored)
+        else:
+            try:
+                repo_commits = self._fetch_commits_for_repo(owner_repo, repo, window, seen_commits, commit_details)
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to fetch commits for {repo}: {e}")
 
+        # Newest-first pages, stopping at the first page that reaches back past the window.
+        prs, _ = self._list_created_since(self._repo_resource_url(owner_repo, repo, "pulls"), repo, "PRs", window[0])
+        repo_prs = _count_created_in_window(prs, window)
+        issues, _ = self._list_created_since(
+            self._repo_resource_url(owner_repo, repo, "issues"), repo, "issues", window[0]
+        )
+        repo_issues = _count_created_in_window(issues, window)
+
+        display_name = owner_repo.split("/")[-1] if "/" in owner_repo else repo
+        return {
+            "repo": display_name,
+            "commits": repo_commits,
+            "prs": repo_prs,
+            "issues": repo_issues,
+            "commit_details": commit_details,
+        }
+
+    def _fetch_graphql_batch(self, repos: List[str], date_str: str) -> List[Dict]:
+        """One aliased GraphQL query for `repos`; repos whose lists overflow are re-fetched over REST."""
+        owner_repos = [self._owner_repo(r) for r in repos]
+        window = self._day_window(date_str)
+        body = {
+            "query": build_batch_query(owner_repos),
+            "variables": {"since": window[0], "until": window[1]},
+        }
+        response = _github_post_with_retry(f"{self.api_base}/graphql", self.headers, body)
+        _forbidden_or_ratelimit(response, f"{len(repos)} repos", "GraphQL batch")
+        if response.status_code != 200:
+            logging.warning("GraphQL batch HTTP %s; falling back to REST for %s repos.", response.status_code, len(repos))
+            return [self._fetch_repo_data(repo, date_str) for repo in repos]
+
+        payload = response.json()
+        if graphql_rate_limited(payload):
+            error_msg = "GitHub GraphQL rate limit exceeded. Please wait for the hourly reset before retrying."
+            logging.error(error_msg)
+            raise PermissionError(error_msg)
+        not_found = {
+            (err.get("path") or [None])[0]
+            for err in payload.get("errors") or []
+            if err.get("type") == "NOT_FOUND"
+        }
+        data = payload.get("data") or {}
+
+        results: List[Dict] = []
+        for i, repo in enumerate(repos):
+            alias = f"r{i}"
+            display_name = owner_repos[i].split("/")[-1]
+            node = data.get(alias)
+            if node is None:
+                if alias in not_found:
+                    # Same outcome as a REST 404: nothing to count.
+                    results.append(
+                        {"repo": display_name, "commits": 0, "prs": 0, "issues": 0, "commit_details": []}
+                    )
+                else:
+                    results.append(self._fetch_repo_data(repo, date_str))
+                continue
+            result, overflow = parse_repo_node(node, window, display_name)
+            if overflow:
+                logging.info("GraphQL: %s has more than one page for %s; fetching over REST.", owner_repos[i], date_str)
+                result = self._fetch_repo_data(repo, date_str)
+            results.append(result)
+        return results
+
+    def _branches_to_walk(self, owner_repo: str, repo: str) -> List[Tuple[Optional[str], Optional[str]]]:
+        """[(None, None)] for the default branch, then (name, head sha) per branch in all-branches mode."""
+        if not _commits_all_branches_enabled():
+            return [(None, None)]
         try:
-            repo_commits = self._fetch_commits_for_repo(owner_repo, repo, date_str, seen_commits, commit_details)
-        except PermissionError:
+            return [(None, None)] + self._list_branch_heads(owner_repo, repo)
+        except (PermissionError, DeadlineExceeded):
             raise
         except Exception as e:
-            logging.warning(f"Failed to fetch commits for {repo}: {e}")
+            logging.warning(f"Failed to list branches for {repo}, using default: {e}")
+            return [(None, None)]
 
-        if "/" in owner_repo:
-            prs_url = f"{self.api_base}/repos/{owner_repo}/pulls"
-        else:
-            prs_url = f"{self.api_base}/repos/{self.username}/{repo}/pulls"
-        params = {"state": "all", "since": f"{date_str}T00:00:00Z"}
+    def _list_commits(
+        self,
+        owner_repo: str,
+        repo: str,
+        branch: Optional[str],
+        since_iso: str,
+        until_iso: Optional[str] = None,
+        max_pages: int = 50,
+        stop_at: Optional[set] = None,
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Raw commits-list items (newest first) for one branch. Returns (items, complete).
+        Listing ends (complete) at the first sha in `stop_at`: history below it is already known.
+        """
+        commits_url = self._commits_list_url(owner_repo, repo)
+        items: List[Dict] = []
+        page = 1
+        while page <= max_pages:
+            params = {"since": since_iso, "per_page": 100, "page": page}
+            if until_iso:
+                params["until"] = until_iso
+            if branch:
+                params["sha"] = branch
+            try:
+                response = self._make_request_with_retry(commits_url, params=params)
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to fetch commits for {repo} (branch={branch}, page={page}): {e}")
+                return items, False
+            if response.status_code == 403:
+                _forbidden_or_ratelimit(response, repo, "commits")
+            if page == 1 and branch is None:
+                self._note_repo_response(owner_repo, response)
+            if response.status_code == 409:
+                # Empty repository: nothing to list, and nothing will be missed.
+                return items, True
+            if response.status_code != 200:
+                return items, False
+            commits_data = response.json()
+            if stop_at:
+                for i, commit in enumerate(commits_data):
+                    if commit["sha"] in stop_at:
+                        items.extend(commits_data[:i])
+                        return items, True
+            items.extend(commits_data)
+            if len(commits_data) < 100:
+                return items, True
+            page += 1
+        logging.warning(f"Commits for {repo} (branch={branch}) exceed {max_pages} pages; list is truncated.")
+        return items, False
+
+    def _list_created_since(self, url: str, repo: str, resource: str, since_iso: str, max_pages: int = 10) -> Tuple[List[Dict], bool]:
+        """Newest-first PRs/issues; stops paging once a page ends before `since_iso`. Returns (items, complete)."""
+        items: List[Dict] = []
+        page = 1
+        while page <= max_pages:
+            params = _created_desc_params(url, since_iso, page)
+            try:
+                response = self._make_request_with_retry(url, params=params)
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to fetch {resource} for {repo} (page={page}): {e}")
+                return items, False
+            _forbidden_or_ratelimit(response, repo, resource)
+            if response.status_code != 200:
+                return items, False
+            batch = response.json()
+            items.extend(batch)
+            if len(batch) < 100 or utc_timestamp(batch[-1].get("created_at") or "") < since_iso:
+                return items, True
+            page += 1
+        return items, False
+
+    def _fetch_repo_range(
+        self, repo: str, since_str: str, until_str: str, mirrored: Optional[List[Dict]] = None
+    ) -> Dict[str, Dict]:
+        """
+        _fetch_repo_data for a whole window: {YYYY-MM-DD: per-repo result} for days with activity.
+        `mirrored` = the window's commit_details already read from a git mirror.
+        """
+        owner_repo = self._owner_repo(repo)
+        window = span_window(since_str, until_str, self.day_tz)
+        seen_commits: set = set()
+        commits_by_day: Dict[str, List[Dict]] = {}
+        for detail in mirrored or []:
+            commits_by_day.setdefault(local_day(detail["timestamp"], self.day_tz), []).append(detail)
+        default_walked: set = set()
+        cache = get_branch_head_cache() if _commits_all_branches_enabled() else None
+        branches = self._branches_to_walk(owner_repo, repo) if mirrored is None else []
+        for branch, head in branches:
+            if branch and branch_skip_reason(cache, owner_repo, branch, head, window[0], default_walked):
+                continue
+            commits, ok = self._list_commits(
+                owner_repo,
+                repo,
+                branch,
+                window[0],
+                window[1],
+                stop_at=default_walked if branch else None,
+            )
+            if branch is None:
+                default_walked.update(c["sha"] for c in commits)
+            elif cache and ok and not commits:
+                cache.record(owner_repo, branch, head, [], window)
+            for commit in commits:
+                committed_at = commit["commit"]["committer"]["date"]
+                if in_window(committed_at, window) and commit["sha"] not in seen_commits:
+                    seen_commits.add(commit["sha"])
+                    day = local_day(committed_at, self.day_tz)
+                    commits_by_day.setdefault(day, []).append(_commit_detail(commit))
+
+        prs, _ = self._list_created_since(self._repo_resource_url(owner_repo, repo, "pulls"), repo, "PRs", window[0])
+        issues, _ = self._list_created_since(
+            self._repo_resource_url(owner_repo, repo, "issues"), repo, "issues", window[0]
+        )
+        prs_by_day = _count_by_created_day(prs, window, self.day_tz)
+        issues_by_day = _count_by_created_day([i for i in issues if "pull_request" not in i], window, self.day_tz)
+
+        display_name = owner_repo.split("/")[-1] if "/" in owner_repo else repo
+        out: Dict[str, Dict] = {}
+        for day in set(commits_by_day) | set(prs_by_day) | set(issues_by_day):
+            details = commits_by_day.get(day, [])
+            out[day] = {
+                "repo": display_name,
+                "commits": len(details),
+                "prs": prs_by_day.get(day, 0),
+                "issues": issues_by_day.get(day, 0),
+                "commit_details": details,
+            }
+        return out
 
+    def _default_head(self, owner_repo: str, repo: str) -> Optional[str]:
+        """Head sha of the default branch ("" for an empty repo), or None when it could not be read."""
         try:
-            response = self._make_request_with_retry(prs_url, params=params)
-            _forbidden_or_ratelimit(response, repo, "PRs")
-            if response.status_code == 200:
-                prs_data = response.json()
-                repo_prs = len([pr for pr in prs_data if pr["created_at"].startswith(date_str)])
-        except PermissionError:
+            response = self._make_request_with_retry(self._commits_list_url(owner_repo, repo), params={"per_page": 1})
+        except (PermissionError, DeadlineExceeded):
             raise
         except Exception as e:
-            logging.warning(f"Failed to fetch PRs for {repo}: {e}")
+            logging.warning(f"Failed to read the head of {repo}: {e}")
+            return None
+        if response.status_code == 403:
+            _forbidden_or_ratelimit(response, repo, "commits")
+        self._note_repo_response(owner_repo, response)
+        if response.status_code == 409:
+            return ""
+        if response.status_code != 200:
+            return None
+        items = response.json()
+        return items[0]["sha"] if items else ""
 
-        if "/" in owner_repo:
-            issues_url = f"{self.api_base}/repos/{owner_repo}/issues"
+    def _compare_commits(
+        self, owner_repo: str, repo: str, base: str, head: str, max_pages: int = 10
+    ) -> Optional[Tuple[str, List[Dict]]]:
+        """
+        (status, commits reachable from `head` but not from `base`) from the compare API; status is
+        "ahead", "behind", "diverged", "identical", or "missing" when `base` no longer exists. None when
+        the comparison could not be read in full.
+        """
+        url = f"{self._repo_resource_url(owner_repo, repo, 'compare')}/{base}...{head}"
+        commits: List[Dict] = []
+        page = 1
+        while page <= max_pages:
+            try:
+                response = self._make_request_with_retry(url, params={"per_page": 100, "page": page})
+            except (PermissionError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to compare {base[:7]}...{head[:7]} for {repo}: {e}")
+                return None
+            _forbidden_or_ratelimit(response, repo, "compare")
+            if response.status_code == 404:
+                return "missing", []
+            if response.status_code != 200:
+                return None
+            data = response.json()
+            batch = data.get("commits") or []
+            commits.extend(batch)
+            if len(commits) >= data.get("total_commits", 0) or not batch:
+                return data.get("status", ""), commits
+            page += 1
+        return None
+
+    def _current_heads(self, owner_repo: str, repo: str) -> Optional[Dict[str, str]]:
+        """{"" (default branch) or branch name: head sha} right now, or None when the default head could not be read."""
+        head = self._default_head(owner_repo, repo)
+        if head is None:
+            return None
+        heads = {"": head}
+        if _commits_all_branches_enabled():
+            heads.update(self._list_branch_heads(owner_repo, repo))
+        return heads
+
+    def _verify_store_heads(self, store: ActivityStore, repo: str, window: Optional[Window] = None) -> bool:
+        """
+        Catch what the date-bounded listings cannot see: commits dated inside the covered span but pushed
+        after it was synced. Compares each branch's head with the one stored at the last check and upserts
+        the commits in between; a branch whose old head is no longer an ancestor (force push, rebase) drops
+        the repo's coverage. Once per repo per run, and not at all for a `window` the store has settled
+        (store.head_check_due). False when the heads or a compare could not be read: the store is not
+        trusted for this repo this run, and is left as it is.
+        """
+        owner_repo = self._owner_repo(repo)
+        if window is not None and not store.head_check_due(owner_repo, window):
+            return True
+        with self._store_heads_lock:
+            if owner_repo in self._store_heads:
+                return self._store_heads[owner_repo] is not None
+        heads = self._current_heads(owner_repo, repo)
+        if heads is not None and store.coverage(owner_repo) is not None:
+            marks = store.watermarks(owner_repo)
+            late: List[Dict] = []
+            rewritten = False
+            for branch, head in heads.items():
+                old = (marks.get(branch) or {}).get("head_sha")
+                if not head or head == old:
+                    continue
+                # A branch new since the last check: what it has beyond the default branch.
+                base = old or (heads[""] if branch else None)
+                if not base:
+                    # No default-branch head on record: nothing to check the span against.
+                    rewritten = True
+                    break
+                found = self._compare_commits(owner_repo, repo, base, head)
+                if found is None:
+                    # Compare failed or ran past its page cap: no verdict either way.
+                    heads = None
+                    break
+                if old and found[0] not in ("ahead", "identical"):
+                    rewritten = True
+                    break
+                late.extend(found[1])
+            if heads is None:
+                logging.info("Activity store: could not compare %s heads; not using the store for it this run.", owner_repo)
+            elif rewritten:
+                logging.info("Activity store: %s history changed since its last sync; dropping its coverage.", owner_repo)
+                store.forget(owner_repo)
+            else:
+                store.record(owner_repo, late, [], [], watermarks={b: {"head_sha": h} for b, h in heads.items()})
+                store.note_late_commits(len(late))
+        with self._store_heads_lock:
+            self._store_heads[owner_repo] = heads
+        return heads is not None
+
+    def _sync_repo_to_store(self, store: ActivityStore, repo: str, window: Window) -> None:
+        """
+        Extend the store's covered span of `repo` over `window`. Only what lies outside the span is
+        listed, bounded by since/until: [window start, covered_since) below it and (synced_at, window
+        end] above it, the end clipped to now. Walking dates one at a time so costs one day per date.
+        A listing cut off at its page cap still covers down to its oldest item, and the next sync goes
+        on from there. Call _verify_store_heads first.
+        """
+        owner_repo = self._owner_repo(repo)
+        upper = min(window[1], datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+        cov = store.coverage(owner_repo)
+        if cov is None:
+            legs = [(window[0], upper)]
         else:
-            issues_url = f"{self.api_base}/repos/{self.username}/{repo}/issues"
-        params = {"state": "all", "since": f"{date_str}T00:00:00Z"}
+            legs = []
+            if window[0] < cov["covered_since"]:
+                legs.append((window[0], cov["covered_since"]))
+            if upper > cov["synced_at"]:
+                legs.append((cov["synced_at"], upper))
+        with self._store_heads_lock:
+            heads = self._store_heads.get(owner_repo) or {"": ""}
+
+        for since_iso, until_iso in legs:
+            commits: List[Dict] = []
+            floors: List[Optional[str]] = []
+            default_walked: set = set()
+            for branch, head in heads.items():
+                if branch and head in default_walked:
+                    continue
+                items, ok = self._list_commits(
+                    owner_repo,
+                    repo,
+                    branch or None,
+                    since_iso,
+                    until_iso,
+                    max_pages=_STORE_SYNC_MAX_PAGES,
+                    stop_at=default_walked if branch else None,
+                )
+                if not branch:
+                    default_walked.update(c["sha"] for c in items)
+                commits.extend(items)
+                floors.append(
+                    _listing_floor(items, ok, since_iso, _STORE_SYNC_MAX_PAGES, lambda c: c["commit"]["committer"]["date"])
+                )
+            listed = {}
+            for resource, label in (("pulls", "PRs"), ("issues", "issues")):
+                items, ok = self._list_created_since(
+                    self._repo_resource_url(owner_repo, repo, resource), repo, label, since_iso
+                )
+                listed[resource] = items
+                floors.append(_listing_floor(items, ok, since_iso, 10, lambda i: i.get("created_at") or ""))
+
+            floor = None if None in floors else max(floors)
+            if cov is not None and since_iso == cov["synced_at"] and floor != since_iso:
+                # A hole between the span and what was listed: keep the rows, not the coverage.
+                floor = None
+            covered = floor is not None and floor <= until_iso
+            store.record(
+                owner_repo,
+                commits,
+                listed["pulls"],
+                listed["issues"],
+                watermarks={b: {"head_sha": h} for b, h in heads.items()} if cov is None and covered else None,
+                covered_since=floor if covered else None,
+                synced_at=until_iso if covered else None,
+            )
 
-        try:
-            response = self._make_request_with_retry(issues_url, params=params)
-            _forbidden_or_ratelimit(response, repo, "issues")
-            if response.status_code == 200:
-                issues_data = response.json()
-                repo_issues = len([issue for issue in issues_data if issue["created_at"].startswith(date_str)])
-        except PermissionError:
-            raise
-        except Exception as e:
-            logging.warning(f"Failed to fetch issues for {repo}: {e}")
+    def _fetch_repo_range_via_store(self, store: ActivityStore, repo: str, since_str: str, until_str: str) -> Dict[str, Dict]:
+        """Same shape as _fetch_repo_range; network only for the part of the window the store does not cover yet."""
+        owner_repo = self._owner_repo(repo)
+        window = span_window(since_str, until_str, self.day_tz)
+        if not self._verify_store_heads(store, repo, window):
+            return self._fetch_repo_range(repo, since_str, until_str)
+        if store.covers(owner_repo, window):
+            store.note_answered(1)
+        else:
+            self._sync_repo_to_store(store, repo, window)
+            if not store.covers(owner_repo, window):
+                # Listings failed or stopped at their page cap: answer this window directly.
+                return self._fetch_repo_range(repo, since_str, until_str)
+        display_name = owner_repo.split("/")[-1] if "/" in owner_repo else repo
+        return store.day_results(owner_repo, display_name, window, self.day_tz)
 
+    def _fetch_repo_data_via_store(self, store: ActivityStore, repo: str, date_str: str) -> Dict:
+        owner_repo = self._owner_repo(repo)
         display_name = owner_repo.split("/")[-1] if "/" in owner_repo else repo
-        return {
-            "repo": display_name,
-            "commits": repo_commits,
-            "prs": repo_prs,
-            "issues": repo_issues,
-            "commit_details": commit_details,
-        }
+        day = self._fetch_repo_range_via_store(store, repo, date_str, date_str).get(date_str)
+        return day or {"repo": display_name, "commits": 0, "prs": 0, "issues": 0, "commit_details": []}
 
-    def collect_data_for_date(self, target_date: date) -> Dict:
-        commits = 0
-        prs = 0
-        issues = 0
-        repository_details = {}
-        has_403_error = False
-        error_repos = []
+    def collect_data_for_range(
+        self, since_date: date, until_date: date, repos: Optional[List[str]] = None
+    ) -> Dict[date, Dict]:
+        """
+        One fetch per repo for the whole window, bucketed per day. `repos` = a subset of the configured
+        repos (one planner batch); default all.
+        Returns {date: collect_data_for_date-shaped dict} for every day in [since, until], including empty days.
+        """
+        if since_date > until_date:
+            raise ValueError(f"since {since_date} is after until {until_date}")
+        since_str = since_date.strftime("%Y-%m-%d")
+        until_str = until_date.strftime("%Y-%m-%d")
+
+        store = get_activity_store()
+        # Repos last pushed before `since` have no commits in the window; only their PRs and issues are listed.
+        repos, idle, pushed_at_skipped = self._prune_idle_repos(since_str, repos)
+        per_day: Dict[str, List[Dict]] = {}
+        error_repos: List[str] = []
+        max_workers = _get_github_fetch_max_workers(len(repos) + len(idle))
+        get_transport(max_workers)
+        if _collector_backend(self.backend) == "git":
+            mirrored = self._mirror_commits(repos, span_window(since_str, until_str, self.day_tz))
+            tasks = {
+                repo: (lambda r=repo: self._fetch_repo_range(r, since_str, until_str, mirrored[self._owner_repo(r)]))
+                for repo in repos
+            }
+        elif store:
+            tasks = {
+                repo: (lambda r=repo: self._fetch_repo_range_via_store(store, r, since_str, until_str)) for repo in repos
+            }
+        else:
+            tasks = {repo: (lambda r=repo: self._fetch_repo_range(r, since_str, until_str)) for repo in repos}
+        tasks.update({repo: (lambda r=repo: self._fetch_repo_range(r, since_str, until_str, [])) for repo in idle})
+        for _, result in _drain_repo_tasks(tasks, max_workers, error_repos):
+            for day, day_result in result.items():
+                per_day.setdefault(day, []).append(day_result)
+
+        if error_repos:
+            raise PermissionError(
+                _access_denied_message(error_repos, "Process stopped. No calendar files will be written.")
+            )
+
+        out: Dict[date, Dict] = {}
+        day = since_date
+        while day <= until_date:
+            commits, prs, issues, repository_details = _summarize_repo_results(per_day.get(day.isoformat(), []))
+            out[day] = {
+                "commits": commits,
+                "prs": prs,
+                "issues": issues,
+                "repository_details": repository_details,
+                "preflight_skipped_fanout": False,
+                "pushed_at_skipped_repos": pushed_at_skipped,
+                "repositories_configured": len(self.repositories),
+            }
+            day += timedelta(days=1)
+        return out
+
+    def _store_covers_day(self, store: ActivityStore, repos: List[str], date_str: str) -> bool:
+        """Every repo's coverage spans the day and still holds after its head check, where one is due."""
+        window = self._day_window(date_str)
+        if not all(store.covers(self._owner_repo(r), window) for r in repos):
+            return False
+        due = [r for r in repos if store.head_check_due(self._owner_repo(r), window)]
+        tasks = {repo: (lambda r=repo: self._verify_store_heads(store, r, window)) for repo in due}
+        error_repos: List[str] = []
+        checked = _drain_repo_tasks(tasks, _get_github_fetch_max_workers(len(due)), error_repos)
+        if error_repos:
+            raise PermissionError(
+                _access_denied_message(error_repos, "Process stopped. No calendar files will be written.")
+            )
+        if deadline_exceeded():
+            raise DeadlineExceeded("run deadline reached (activity store head checks)")
+        verified = len(checked) == len(tasks) and all(ok for _, ok in checked)
+        return verified and all(store.covers(self._owner_repo(r), window) for r in repos)
 
+    def collect_data_for_date(self, target_date: date) -> Dict:
         date_str = target_date.strftime("%Y-%m-%d")
 
-        skip_fanout = self._preflight_should_skip_full_scan(date_str)
+        store = get_activity_store()
+        configured = self._canonical_repos()
+        if store and self._store_covers_day(store, configured, date_str):
+            # Historical date already synced for every repo: head checks only where due (store.head_check_due).
+            results = [self._fetch_repo_data_via_store(store, r, date_str) for r in configured]
+            commits, prs, issues, repository_details = _summarize_repo_results(results)
+            logging.info("Activity store covers %s for all %s repos; only head checks.", date_str, len(configured))
+            return {
+                "commits": commits,
+                "prs": prs,
+                "issues": issues,
+                "repository_details": repository_details,
+                "preflight_skipped_fanout": False,
+                "answered_from_store": True,
+                "repositories_configured": len(self.repositories),
+            }
+
+        from_webhooks = self._collect_via_webhooks(date_str)
+        if from_webhooks is not None:
+            return from_webhooks
+
+        active = None
+        mode = self._preflight()
+        if mode == "search":
+            searched = self._collect_via_search(date_str)
+            if searched is not None:
+                return dict(searched, preflight_mode=mode)
+            skip_fanout = None
+        elif mode == "events":
+            from_events = self._collect_via_events(date_str)
+            if from_events is not None:
+                return dict(from_events, preflight_mode=mode)
+            skip_fanout = None
+        else:
+            skip_fanout, active = self._run_preflight(date_str)
+        # What the preflight said, for the tuner: None without one, "fallback" when it gave no answer.
+        verdict = None if mode is None else {True: "idle", False: "active", None: "fallback"}[skip_fanout]
         if skip_fanout is True:
             print(
                 "⚡ Preflight: no commits (any committer) and no issues/PRs created in configured repos; "
@@ -706,112 +2130,322 @@ class GitHubCollector:
                 "issues": 0,
                 "repository_details": {},
                 "preflight_skipped_fanout": True,
+                "preflight_mode": mode,
+                "preflight_verdict": verdict,
                 "repositories_configured": len(self.repositories),
             }
 
-        max_workers = _get_github_fetch_max_workers(len(self.repositories))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(self._fetch_repo_data, repo, date_str): repo for repo in self.repositories}
+        if active is not None:
+            # Preflight saw every hit: only those repos can have activity on date_str.
+            repos = [r for r in configured if self._owner_repo(r).lower() in active]
+            idle, pushed_at_skipped = [], 0
+        else:
+            repos, idle, pushed_at_skipped = self._prune_idle_repos(date_str)
 
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    repo_commits = result["commits"]
-                    repo_prs = result["prs"]
-                    repo_issues = result["issues"]
-                    repo_commit_details = result.get("commit_details", [])
-
-                    commits += repo_commits
-                    prs += repo_prs
-                    issues += repo_issues
-
-                    if repo_commits > 0 or repo_prs > 0 or repo_issues > 0:
-                        repository_details[result["repo"]] = {
-                            "commits": repo_commits,
-                            "prs": repo_prs,
-                            "issues": repo_issues,
-                            "commit_details": repo_commit_details,
-                        }
-                except PermissionError as e:
-                    repo = futures[future]
-                    has_403_error = True
-                    error_repos.append(repo)
-                    logging.error(f"403 Forbidden error for {repo}: {e}")
-                except Exception as e:
-                    repo = futures[future]
-                    logging.error(f"Error processing {repo}: {e}")
-
-        if has_403_error:
-            error_message = (
-                f"\n❌ GITHUB API ACCESS DENIED (403 Forbidden)\n"
-                f"   GitHub is not accessible. Please check:\n"
-                f"   1. Your GitHub API token is valid and not expired\n"
-                f"   2. The token has the necessary permissions\n"
-                f"   3. Your network connection is working\n"
-                f"   Affected repositories: {', '.join(error_repos[:5])}{'...' if len(error_repos) > 5 else ''}\n"
-                f"   Process stopped. No calendar files will be written.\n"
+        backend = _collector_backend(self.backend)
+        if store and backend == "rest":
+            # REST syncs into the store (full shas, PR/issue numbers); async/graphql results are not persisted.
+            backend = "store"
+        if not repos:
+            results, error_repos = [], []
+        elif backend == "async":
+            from .async_engine import collect_repos_async
+
+            results, error_repos = collect_repos_async(self, repos, date_str)
+        else:
+            results, error_repos = self._fanout_threads(repos, date_str, backend)
+        if idle:
+            idle_results, idle_errors = self._fanout_threads(idle, date_str, "prs_issues")
+            results += idle_results
+            error_repos += idle_errors
+
+        if error_repos:
+            raise PermissionError(
+                _access_denied_message(error_repos, "Process stopped. No calendar files will be written.")
             )
-            raise PermissionError(error_message)
 
+        commits, prs, issues, repository_details = _summarize_repo_results(results)
         return {
             "commits": commits,
             "prs": prs,
             "issues": issues,
             "repository_details": repository_details,
             "preflight_skipped_fanout": False,
+            "pushed_at_skipped_repos": pushed_at_skipped,
+            "preflight_active_repos": len(active) if active is not None else None,
+            "preflight_mode": mode,
+            "preflight_verdict": verdict,
             "repositories_configured": len(self.repositories),
         }
 
+    def _mirror_commits(self, repos: List[str], window: Window) -> Dict[str, Optional[List[Dict]]]:
+        """{owner/name: commit_details from its git mirror, or None to fetch commits over REST}."""
+        return mirror_commits(
+            list(dict.fromkeys(self._owner_repo(r) for r in repos)), self.token, window, _commits_all_branches_enabled()
+        )
+
+    def _fanout_threads(self, repos: List[str], date_str: str, backend: str) -> Tuple[List[Dict], List[str]]:
+        """
+        Thread-pool fan-out (REST per repo, store sync per repo, git mirrors + REST PRs/issues per repo,
+        GraphQL per batch, or "prs_issues": REST PRs/issues only, for repos with no pushes that day).
+        Returns (results, repos that hit 403).
+        Tasks that have to wait for a retry are parked rather than holding a thread (retry_scheduler.py).
+        """
+        results: List[Dict] = []
+        error_repos: List[str] = []
+        max_workers = _get_github_fetch_max_workers(len(repos))
+        get_transport(max_workers)
+        if backend == "store":
+            store = get_activity_store()
+            tasks = {repo: (lambda r=repo: [self._fetch_repo_data_via_store(store, r, date_str)]) for repo in repos}
+        elif backend == "git":
+            mirrored = self._mirror_commits(repos, self._day_window(date_str))
+            tasks = {
+                repo: (lambda r=repo: [self._fetch_repo_data(r, date_str, mirrored[self._owner_repo(r)])]) for repo in repos
+            }
+        elif backend == "graphql":
+            size = _graphql_batch_size()
+            batches = [repos[i : i + size] for i in range(0, len(repos), size)]
+            tasks = {", ".join(batch): (lambda b=batch: self._fetch_graphql_batch(b, date_str)) for batch in batches}
+        elif backend == "prs_issues":
+            tasks = {repo: (lambda r=repo: [self._fetch_repo_data(r, date_str, [])]) for repo in repos}
+        else:
+            tasks = {repo: (lambda r=repo: [self._fetch_repo_data(r, date_str)]) for repo in repos}
+
+        for _, result in _drain_repo_tasks(tasks, max_workers, error_repos):
+            results.extend(result)
+        return results, error_repos
 
-def _fetch_repo_commits(owner_repo: str, token: str, since_iso: str, until_iso: str) -> Dict:
-    api_base = "https://api.github.com"
-    headers = {
+
+def _commit_detail(commit: Dict) -> Dict:
+    """commit_details entry from a REST commits-list item."""
+    commit_obj = commit.get("commit", {})
+    return {
+        "sha": commit["sha"][:7],
+        "message": commit_obj.get("message", "").split("\n")[0],
+        "author": commit_obj.get("author", {}).get("name", "Unknown"),
+        "url": commit.get("html_url", ""),
+        "timestamp": commit_obj.get("committer", {}).get("date", ""),
+    }
+
+
+def _pack_search_terms(terms: List[str], capacity: int) -> Optional[List[List[str]]]:
+    """
+    Group search terms into "a OR b OR ..." lists of at most `capacity` chars, best-fit decreasing: longest
+    term first, each into the open group it leaves the least room in. Open groups are kept sorted by free
+    room, so placing a term is a bisect instead of a rebuild of the query. None if a term alone is too long.
+    """
+    groups: List[List[str]] = []
+    room: List[Tuple[int, int]] = []  # (free chars, group index), ascending
+    sep = len(" OR ")
+    for term in sorted(terms, key=len, reverse=True):
+        if len(term) > capacity:
+            return None
+        need = len(term) + sep
+        at = bisect.bisect_left(room, (need, -1))
+        if at < len(room):
+            free, index = room.pop(at)
+            groups[index].append(term)
+            bisect.insort(room, (free - need, index))
+        else:
+            groups.append([term])
+            bisect.insort(room, (capacity - len(term), len(groups) - 1))
+    return groups
+
+
+def _search_item_repo(item: Dict) -> str:
+    """Lowercase owner/name of a commit search item (repository.full_name) or issue item (repository_url)."""
+    full_name = (item.get("repository") or {}).get("full_name")
+    if not full_name:
+        full_name = (item.get("repository_url") or "").split("/repos/", 1)[-1]
+    return full_name.lower()
+
+
+def _created_desc_params(url: str, since_iso: str, page: int) -> Dict:
+    """Query for one newest-first page of a pulls/issues list."""
+    params = {"state": "all", "sort": "created", "direction": "desc", "per_page": 100, "page": page}
+    if url.endswith("/issues"):
+        # Issues `since` filters on updated_at: anything created in the window was updated after its start.
+        # The pulls endpoint has no such filter.
+        params["since"] = since_iso
+    return params
+
+
+def _count_created_in_window(items: List[Dict], window: Window) -> int:
+    """PRs or issues created inside the window; /issues also lists PRs, which are counted as PRs only."""
+    return len([i for i in items if "pull_request" not in i and in_window(i.get("created_at") or "", window)])
+
+
+def _count_by_created_day(items: List[Dict], window: Window, tz: DayTimezone) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for item in items:
+        created_at = item.get("created_at") or ""
+        if in_window(created_at, window):
+            day = local_day(created_at, tz)
+            counts[day] = counts.get(day, 0) + 1
+    return counts
+
+
+def _drain_repo_tasks(
+    tasks: Dict[str, Callable[[], Any]], max_workers: int, error_repos: List[str]
+) -> List[Tuple[str, Any]]:
+    """
+    Run per-repo tasks through run_parkable to the end: (key, result) for each task that finished.
+    Keys that hit a 403 go to error_repos for the caller to stop on; tasks cut short by the run
+    deadline and other failures are logged and left out.
+    """
+    done: List[Tuple[str, Any]] = []
+    for repo, result, error in run_parkable(tasks, max_workers):
+        if error is None:
+            done.append((repo, result))
+        elif isinstance(error, PermissionError):
+            error_repos.append(repo)
+            logging.error(f"403 Forbidden error for {repo}: {error}")
+        elif isinstance(error, DeadlineExceeded):
+            logging.info(f"Skipped {repo}: run deadline reached.")
+        else:
+            logging.error(f"Error processing {repo}: {error}")
+    return done
+
+
+def _summarize_repo_results(results: List[Dict]) -> Tuple[int, int, int, Dict]:
+    """Totals + repository_details (repos with any activity) from _fetch_repo_data-shaped dicts."""
+    commits = 0
+    prs = 0
+    issues = 0
+    repository_details = {}
+    for result in results:
+        repo_commits = result["commits"]
+        repo_prs = result["prs"]
+        repo_issues = result["issues"]
+
+        commits += repo_commits
+        prs += repo_prs
+        issues += repo_issues
+
+        if repo_commits > 0 or repo_prs > 0 or repo_issues > 0:
+            repository_details[result["repo"]] = {
+                "commits": repo_commits,
+                "prs": repo_prs,
+                "issues": repo_issues,
+                "commit_details": result.get("commit_details", []),
+            }
+    return commits, prs, issues, repository_details
+
+
+def _access_denied_message(error_repos: List[str], outcome: str) -> str:
+    return (
+        f"\n❌ GITHUB API ACCESS DENIED (403 Forbidden)\n"
+        f"   GitHub is not accessible. Please check:\n"
+        f"   1. Your GitHub API token is valid and not expired\n"
+        f"   2. The token has the necessary permissions\n"
+        f"   3. Your network connection is working\n"
+        f"   Affected repositories: {', '.join(error_repos[:5])}{'...' if len(error_repos) > 5 else ''}\n"
+        f"   {outcome}\n"
+    )
+
+
+def _iter_repo_commit_pages(
+    owner_repo: str, token: str, since_iso: str, until_iso: str, api_base: str = DEFAULT_API_BASE
+) -> Iterator[Dict]:
+    """
+    One _repo_commits_result dict per page of the repo's commits in the window, following the Link
+    header's rel="next" to the last page. Stops after the first error page.
+    """
+    url: Optional[str] = f"{api_base}/repos/{owner_repo}/commits"
+    params: Optional[Dict] = {"since": since_iso, "until": until_iso, "per_page": 100}
+    headers = _commits_range_headers(token)
+    while url:
+        try:
+            resp = _github_get_with_retry(url, headers, params=params, timeout=30)
+        except (PermissionError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            yield {"repository": owner_repo, "error": str(e), "commits": []}
+            return
+        page = _repo_commits_result(owner_repo, resp)
+        yield page
+        if page.get("error"):
+            return
+        # The next link already carries since/until/per_page/page.
+        url, params = _next_page_url(resp), None
+
+
+def _next_page_url(resp) -> Optional[str]:
+    """rel="next" from the Link header (requests and httpx both parse it into .links)."""
+    return ((resp.links or {}).get("next") or {}).get("url")
+
+
+def _fetch_repo_commits(
+    owner_repo: str, token: str, since_iso: str, until_iso: str, api_base: str = DEFAULT_API_BASE
+) -> Dict:
+    """Every page for one repo, aggregated (--format json). Keeps pages fetched before an error."""
+    commits: List[Dict] = []
+    for page in _iter_repo_commit_pages(owner_repo, token, since_iso, until_iso, api_base):
+        if page.get("error"):
+            return dict(page, commits=commits)
+        commits.extend(page["commits"])
+    return {"repository": owner_repo, "commits": commits}
+
+
+def _commits_range_headers(token: str) -> Dict:
+    return {
         "Authorization": f"token {token}",
         "Accept": "application/vnd.github.v3+json",
     }
-    url = f"{api_base}/repos/{owner_repo}/commits"
-    params = {"since": since_iso, "until": until_iso, "per_page": 100}
-    try:
-        resp = _github_get_with_retry(url, headers, params=params, timeout=30)
-        if resp.status_code == 403:
-            if _rate_limit_is_error(resp):
-                wait_time = _rate_limit_wait_seconds(resp) or 3600
-                error_msg = f"GitHub API rate limit exceeded for {owner_repo}. Please wait {wait_time} seconds before retrying."
-                logging.error(error_msg)
-                return {
-                    "repository": owner_repo,
-                    "error": "HTTP 403 Rate Limit",
-                    "commits": [],
-                    "is_403": True,
-                    "is_rate_limit": True,
-                }
-            error_msg = f"GitHub API returned 403 Forbidden for {owner_repo}. Access denied - token may be invalid or expired."
+
+
+def _repo_commits_result(owner_repo: str, resp) -> Dict:
+    """--commits-range record for one repo from a commits-list response (requests or httpx)."""
+    if resp.status_code == 403:
+        if _rate_limit_is_error(resp):
+            wait_time = _rate_limit_wait_seconds(resp) or 3600
+            error_msg = f"GitHub API rate limit exceeded for {owner_repo}. Please wait {wait_time} seconds before retrying."
             logging.error(error_msg)
-            return {"repository": owner_repo, "error": "HTTP 403 Forbidden", "commits": [], "is_403": True}
-        if resp.status_code != 200:
-            return {"repository": owner_repo, "error": f"HTTP {resp.status_code}", "commits": []}
-        data = resp.json()
-        commits = []
-        for c in data:
-            commit_obj = c.get("commit", {})
-            message = commit_obj.get("message", "") or ""
-            title, _, body = message.partition("\n\n")
-            commits.append(
-                {
-                    "sha": c.get("sha"),
-                    "html_url": c.get("html_url"),
-                    "title": title.strip(),
-                    "description": body.strip(),
-                    "author": (commit_obj.get("author") or {}).get("name"),
-                    "date": (commit_obj.get("author") or {}).get("date"),
-                }
-            )
-        return {"repository": owner_repo, "commits": commits}
-    except Exception as e:
-        return {"repository": owner_repo, "error": str(e), "commits": []}
+            return {
+                "repository": owner_repo,
+                "error": "HTTP 403 Rate Limit",
+                "commits": [],
+                "is_403": True,
+                "is_rate_limit": True,
+            }
+        error_msg = f"GitHub API returned 403 Forbidden for {owner_repo}. Access denied - token may be invalid or expired."
+        logging.error(error_msg)
+        return {"repository": owner_repo, "error": "HTTP 403 Forbidden", "commits": [], "is_403": True}
+    if resp.status_code != 200:
+        return {"repository": owner_repo, "error": f"HTTP {resp.status_code}", "commits": []}
+    return {"repository": owner_repo, "commits": [_commits_range_record(c) for c in resp.json()]}
 
 
-def fetch_commits_parallel_from_config(config_path: str, since_date: date, until_date: date) -> Dict:
+def _commits_range_record(c: Dict) -> Dict:
+    commit_obj = c.get("commit", {})
+    message = commit_obj.get("message", "") or ""
+    title, _, body = message.partition("\n\n")
+    return {
+        "sha": c.get("sha"),
+        "html_url": c.get("html_url"),
+        "title": title.strip(),
+        "description": body.strip(),
+        "author": (commit_obj.get("author") or {}).get("name"),
+        "date": (commit_obj.get("author") or {}).get("date"),
+    }
+
+
+def _commits_range_access_denied(res: Dict) -> bool:
+    """Non-rate-limit 403: stop the whole --commits-range run."""
+    error = res.get("error") or ""
+    if not error:
+        return False
+    if res.get("is_403", False):
+        return not res.get("is_rate_limit", False)
+    return "403" in error and "Rate Limit" not in error
+
+
+def _load_commits_range_config(config_path: str) -> Tuple[str, str, List[str], DayTimezone, str]:
+    """
+    (token, username, owner/name repos, day timezone, API base) for --commits-range, env first like
+    the main collector.
+    """
     setup_env(Path(config_path))
     if DOTENV_AVAILABLE:
         env_path = Path(config_path).parent.parent.parent / ".env"
@@ -827,41 +2461,27 @@ def fetch_commits_parallel_from_config(config_path: str, since_date: date, until
     username = os.getenv("GITHUB_USERNAME") or gh_cfg.get("username", "")
     raw_repos = gh_cfg.get("repositories", [])
     repos = [normalize_repo_identifier(r, username) for r in raw_repos]
+    return token, username, repos, resolve_day_timezone(gh_cfg.get("timezone")), _github_api_base(gh_cfg.get("api_base"))
 
-    since_iso = f"{since_date.isoformat()}T00:00:00Z"
-    until_iso = f"{until_date.isoformat()}T23:59:59Z"
 
+def _commits_range_window(since_date: date, until_date: date, tz: DayTimezone) -> Window:
+    return span_window(since_date, until_date, tz)
+
+
+def _commits_range_summary(since_date: date, until_date: date, repos: List[str], per_repo: Dict[str, Dict]) -> Dict:
     results: Dict[str, List[Dict]] = {}
     errors: Dict[str, str] = {}
     has_403_error = False
-    max_workers = _get_github_fetch_max_workers(len(repos))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {
-            executor.submit(_fetch_repo_commits, repo, token, since_iso, until_iso): repo for repo in repos
-        }
-        for fut in as_completed(future_map):
-            repo = future_map[fut]
-            res = fut.result()
-            if "error" in res and res["error"]:
-                errors[repo] = res["error"]
-                if res.get("is_403", False) and not res.get("is_rate_limit", False):
-                    has_403_error = True
-                elif "403" in res["error"] and "Rate Limit" not in res["error"]:
-                    has_403_error = True
-            results[repo] = res.get("commits", [])
+    for repo, res in per_repo.items():
+        if "error" in res and res["error"]:
+            errors[repo] = res["error"]
+            if _commits_range_access_denied(res):
+                has_403_error = True
+        results[repo] = res.get("commits", [])
 
     if has_403_error:
         error_repos = [repo for repo, error in errors.items() if "403" in error]
-        error_message = (
-            f"\n❌ GITHUB API ACCESS DENIED (403 Forbidden)\n"
-            f"   GitHub is not accessible. Please check:\n"
-            f"   1. Your GitHub API token is valid and not expired\n"
-            f"   2. The token has the necessary permissions\n"
-            f"   3. Your network connection is working\n"
-            f"   Affected repositories: {', '.join(error_repos[:5])}{'...' if len(error_repos) > 5 else ''}\n"
-            f"   Process stopped.\n"
-        )
-        raise PermissionError(error_message)
+        raise PermissionError(_access_denied_message(error_repos, "Process stopped."))
 
     return {
         "since": since_date.isoformat(),
@@ -871,3 +2491,95 @@ def fetch_commits_parallel_from_config(config_path: str, since_date: date, until
         "repositories": results,
         "errors": errors,
     }
+
+
+def fetch_commits_parallel_from_config(config_path: str, since_date: date, until_date: date) -> Dict:
+    token, _, repos, day_tz, api_base = _load_commits_range_config(config_path)
+    since_iso, until_iso = _commits_range_window(since_date, until_date, day_tz)
+
+    per_repo: Dict[str, Dict] = {}
+    max_workers = _get_github_fetch_max_workers(len(repos))
+    get_transport(max_workers)
+    tasks = {repo: (lambda r=repo: _fetch_repo_commits(r, token, since_iso, until_iso, api_base)) for repo in repos}
+    error_repos: List[str] = []
+    per_repo.update(_drain_repo_tasks(tasks, max_workers, error_repos))
+    if error_repos:
+        raise PermissionError(_access_denied_message(error_repos, "Process stopped."))
+    for repo in repos:
+        # Cut short by the run deadline or failed outright (logged).
+        per_repo.setdefault(repo, {"repository": repo, "error": "not fetched", "commits": []})
+
+    return _commits_range_summary(since_date, until_date, repos, per_repo)
+
+
+def _ndjson_line(page: Dict, record: Optional[Dict] = None) -> str:
+    """One --commits-range NDJSON line: a commit (repository + record fields) or a repo error."""
+    if record is None:
+        return json.dumps({"repository": page["repository"], "error": page["error"]}) + "\n"
+    return json.dumps(dict({"repository": page["repository"]}, **record)) + "\n"
+
+
+def stream_commits_range_from_config(config_path: str, since_date: date, until_date: date, out: TextIO) -> Dict:
+    """
+    --commits-range as NDJSON: one line per commit written as each page arrives (error lines carry
+    "error"). Workers hand pages over a bounded queue, so memory stays at a few pages however long
+    the range. Returns counts; raises PermissionError on a non-rate-limit 403 after stopping workers.
+    Past the run deadline the workers stop and the counts cover what was written.
+    """
+    token, _, repos, day_tz, api_base = _load_commits_range_config(config_path)
+    since_iso, until_iso = _commits_range_window(since_date, until_date, day_tz)
+    counts = {"repositories": len(repos), "commits": 0, "errors": 0}
+    if not repos:
+        return counts
+
+    max_workers = _get_github_fetch_max_workers(len(repos))
+    get_transport(max_workers)
+    pages: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+    denied: List[str] = []
+
+    def produce(repo: str) -> None:
+        try:
+            for page in _iter_repo_commit_pages(repo, token, since_iso, until_iso, api_base):
+                if stop.is_set():
+                    return
+                pages.put(page)
+        except PermissionError:
+            denied.append(repo)
+            stop.set()
+        except DeadlineExceeded:
+            # Every later request would fail the same way: stop all workers.
+            stop.set()
+        finally:
+            pages.put(None)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for repo in repos:
+            executor.submit(produce, repo)
+        finished = 0
+        while finished < len(repos):
+            page = pages.get()
+            if page is None:
+                finished += 1
+                continue
+            if stop.is_set():
+                continue  # keep draining so blocked workers can exit
+            try:
+                if page.get("error"):
+                    counts["errors"] += 1
+                    out.write(_ndjson_line(page))
+                    if _commits_range_access_denied(page):
+                        denied.append(page["repository"])
+                        stop.set()
+                    continue
+                for record in page["commits"]:
+                    out.write(_ndjson_line(page, record))
+                counts["commits"] += len(page["commits"])
+                out.flush()
+            except BrokenPipeError:
+                # Reader went away (e.g. `| head`); stop fetching.
+                stop.set()
+
+    if denied:
+        raise PermissionError(_access_denied_message(denied, "Process stopped."))
+    return counts
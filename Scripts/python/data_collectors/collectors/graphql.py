@@ -0,0 +1,124 @@
+"""
+GraphQL batch backend for GitHubCollector
+One aliased query fetches commits (default-branch history), PRs and issues for many repos
+"""
+
+import json
+import os
+from typing import Dict, List, Tuple
+
+from .day_window import Window, in_window, utc_timestamp
+
+# Per-repo page sizes inside one batch. Anything that overflows is re-fetched over REST.
+HISTORY_PAGE = 100
+CREATED_PAGE = 50
+
+_REPO_FRAGMENT = """
+  {alias}: repository(owner: {owner}, name: {name}) {{
+    nameWithOwner
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(first: {history_page}, since: $since, until: $until) {{
+            pageInfo {{ hasNextPage }}
+            nodes {{ oid messageHeadline url committedDate author {{ name }} }}
+          }}
+        }}
+      }}
+    }}
+    pullRequests(first: {created_page}, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      pageInfo {{ hasNextPage }}
+      nodes {{ createdAt }}
+    }}
+    issues(first: {created_page}, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      pageInfo {{ hasNextPage }}
+      nodes {{ createdAt }}
+    }}
+  }}"""
+
+
+def _graphql_batch_size() -> int:
+    """Repos per aliased query (GITHUB_GRAPHQL_BATCH_SIZE, 1-20; default 15)."""
+    try:
+        size = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "15"))
+    except ValueError:
+        size = 15
+    return max(1, min(size, 20))
+
+
+def build_batch_query(owner_repos: List[str]) -> str:
+    parts = []
+    for i, owner_repo in enumerate(owner_repos):
+        owner, _, name = owner_repo.partition("/")
+        parts.append(
+            _REPO_FRAGMENT.format(
+                alias=f"r{i}",
+                owner=json.dumps(owner),
+                name=json.dumps(name),
+                history_page=HISTORY_PAGE,
+                created_page=CREATED_PAGE,
+            )
+        )
+    return "query($since: GitTimestamp!, $until: GitTimestamp!) {" + "".join(parts) + "\n}"
+
+
+def _created_on(nodes: List[Dict], window: Window) -> int:
+    return len([n for n in nodes if in_window(n.get("createdAt") or "", window)])
+
+
+def _created_list_truncated(conn: Dict, window: Window) -> bool:
+    """Newest-first list: truncated for our day only if the last node is still inside or after it."""
+    nodes = conn.get("nodes") or []
+    if not (conn.get("pageInfo") or {}).get("hasNextPage") or not nodes:
+        return False
+    return utc_timestamp(nodes[-1].get("createdAt") or "") >= window[0]
+
+
+def parse_repo_node(node: Dict, window: Window, display_name: str) -> Tuple[Dict, bool]:
+    """
+    Map one aliased repository node to the _fetch_repo_data result shape.
+    Returns (result, overflow); overflow=True means a list was cut off and REST must fill in.
+    """
+    target = ((node.get("defaultBranchRef") or {}).get("target")) or {}
+    history = target.get("history") or {}
+    overflow = bool((history.get("pageInfo") or {}).get("hasNextPage"))
+
+    commit_details = []
+    for c in history.get("nodes") or []:
+        timestamp = c.get("committedDate") or ""
+        if not in_window(timestamp, window):
+            continue
+        commit_details.append(
+            {
+                "sha": (c.get("oid") or "")[:7],
+                "message": c.get("messageHeadline") or "",
+                "author": (c.get("author") or {}).get("name") or "Unknown",
+                "url": c.get("url") or "",
+                "timestamp": timestamp,
+            }
+        )
+
+    prs_conn = node.get("pullRequests") or {}
+    issues_conn = node.get("issues") or {}
+    overflow = overflow or _created_list_truncated(prs_conn, window) or _created_list_truncated(issues_conn, window)
+
+    prs = _created_on(prs_conn.get("nodes") or [], window)
+    issues = _created_on(issues_conn.get("nodes") or [], window)
+
+    return (
+        {
+            "repo": display_name,
+            "commits": len(commit_details),
+            "prs": prs,
+            "issues": issues,
+            "commit_details": commit_details,
+        },
+        overflow,
+    )
+
+
+def graphql_rate_limited(payload: Dict) -> bool:
+    for err in payload.get("errors") or []:
+        if err.get("type") == "RATE_LIMITED" or "rate limit" in (err.get("message") or "").lower():
+            return True
+    return False
@@ -0,0 +1,201 @@
+"""
+Disk-backed conditional-request cache for GitHub GETs
+Stores ETag / Last-Modified per URL+params and replays bodies on 304 Not Modified
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# collectors/http_cache.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_CACHE_DIR = SCRIPTS_DIR / "logs" / "http_cache"
+
+# Response headers worth keeping with the body (pagination + validators).
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+def _http_cache_enabled() -> bool:
+    return os.getenv("GITHUB_HTTP_CACHE", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _http_cache_max_bytes() -> int:
+    try:
+        max_mb = float(os.getenv("GITHUB_HTTP_CACHE_MAX_MB", "64"))
+    except ValueError:
+        max_mb = 64
+    return int(max(1, max_mb) * 1024 * 1024)
+
+
+class ConditionalRequestCache:
+    """
+    LRU cache of 200 responses that carried a validator.
+
+    One JSON file per key; file mtime is the LRU clock so recency survives across runs. Index and
+    eviction are guarded by a lock for the ThreadPoolExecutor workers; writes go through
+    os.replace so parallel backfill processes never read a half-written entry.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._counts = {"hits": 0, "misses": 0, "not_modified": 0, "stored": 0, "evictions": 0}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path.stem, st.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict], headers: Dict) -> str:
+        """URL + sorted params + Accept + token fingerprint (two tokens never share entries)."""
+        parts = [url]
+        for k in sorted(params or {}):
+            parts.append(f"{k}={params[k]}")
+        parts.append(headers.get("Accept", ""))
+        parts.append(hashlib.sha256(headers.get("Authorization", "").encode()).hexdigest()[:12])
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            known = key in self._index
+        entry = None
+        if known:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        with self._lock:
+            if entry is None:
+                self._counts["misses"] += 1
+                if known:
+                    self._total_bytes -= self._index.pop(key, 0)
+                return None
+            self._counts["hits"] += 1
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Dict) -> Dict:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def replay(self, key: str, entry: Dict, not_modified: requests.Response) -> requests.Response:
+        """Build a 200 response from the cached body, keeping the 304's fresh rate-limit headers."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry.get("url") or str(not_modified.url)
+        response.encoding = "utf-8"
+        response._content = entry.get("body", "").encode("utf-8")
+        headers = CaseInsensitiveDict(entry.get("headers") or {})
+        for name, value in not_modified.headers.items():
+            if name.lower().startswith("x-ratelimit-"):
+                headers[name] = value
+        response.headers = headers
+        response.request = not_modified.request
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._counts["not_modified"] += 1
+            if key in self._index:
+                self._index.move_to_end(key)
+        return response
+
+    def store(self, key: str, response: requests.Response) -> None:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        entry = {
+            "url": str(response.url),
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {h: response.headers[h] for h in _STORED_HEADERS if h in response.headers},
+            "body": response.text,
+            "stored_at": int(time.time()),
+        }
+        data = json.dumps(entry).encode("utf-8")
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logging.debug("HTTP cache write failed for %s: %s", response.url, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._counts["stored"] += 1
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            old_key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._counts["evictions"] += 1
+            try:
+                self._path(old_key).unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, entries=len(self._index), bytes=self._total_bytes)
+
+
+_cache: Optional[ConditionalRequestCache] = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[ConditionalRequestCache]:
+    """Process-wide cache, or None when GITHUB_HTTP_CACHE=off."""
+    global _cache, _cache_failed
+    if _cache_failed or not _http_cache_enabled():
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            cache_dir = Path(os.getenv("GITHUB_HTTP_CACHE_DIR") or DEFAULT_CACHE_DIR)
+            try:
+                _cache = ConditionalRequestCache(cache_dir, _http_cache_max_bytes())
+            except OSError as e:
+                logging.warning("HTTP cache disabled (%s): %s", cache_dir, e)
+                _cache_failed = True
+        return _cache
@@ -0,0 +1,313 @@
+"""
+Preflight mode autotuner
+Remembers, per account, what each preflight mode really cost and how often its verdict was right, which
+modes the account cannot use (namespace search answers 422 on personal accounts) and the packed repo
+search queries. The budget planner ranks strategies by these measured costs once a mode has enough runs,
+instead of by its estimates, and skips modes known not to work or not accurate enough: too many "active"
+verdicts whose fan-out found nothing, or too many runs without a verdict.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+# collectors/preflight_tuner.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_TUNER_FILE = SCRIPTS_DIR / "logs" / "preflight_tuner.json"
+
+BUDGETS = ("core", "search", "graphql")
+# Weight of the newest run in the per-mode cost averages.
+_EWMA_ALPHA = 0.3
+# Packed query lists kept per account (one per query prefix length).
+_MAX_PACKED = 8
+
+Packer = Callable[[List[str], int], Optional[List[List[str]]]]
+
+
+def _mode_key(mode: str, backend: str) -> str:
+    """History key: costs differ per fan-out backend (git log commits are free), so each keeps its own."""
+    return mode if backend == "rest" else f"{mode}@{backend}"
+
+
+def _tuner_enabled() -> bool:
+    return os.getenv("GITHUB_PREFLIGHT_TUNER", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _ttl_seconds() -> int:
+    """How long a capability verdict is trusted (GITHUB_PREFLIGHT_TUNER_TTL_DAYS, default 30)."""
+    try:
+        days = float(os.getenv("GITHUB_PREFLIGHT_TUNER_TTL_DAYS", "30"))
+    except ValueError:
+        days = 30.0
+    return int(max(0.0, days) * 86400)
+
+
+def _min_runs() -> int:
+    """Runs of a mode before its measured cost replaces the estimate (GITHUB_PREFLIGHT_TUNER_MIN_RUNS, default 3)."""
+    try:
+        return max(1, int(os.getenv("GITHUB_PREFLIGHT_TUNER_MIN_RUNS", "3")))
+    except ValueError:
+        return 3
+
+
+def _min_precision() -> float:
+    """Lowest share of "active" verdicts that found activity (GITHUB_PREFLIGHT_TUNER_MIN_PRECISION, default 0.5)."""
+    try:
+        return float(os.getenv("GITHUB_PREFLIGHT_TUNER_MIN_PRECISION", "0.5"))
+    except ValueError:
+        return 0.5
+
+
+def _max_fallback_rate() -> float:
+    """Highest share of runs without a verdict (GITHUB_PREFLIGHT_TUNER_MAX_FALLBACK_RATE, default 0.5)."""
+    try:
+        return float(os.getenv("GITHUB_PREFLIGHT_TUNER_MAX_FALLBACK_RATE", "0.5"))
+    except ValueError:
+        return 0.5
+
+
+def _accuracy_shortfall(history: Optional[Dict]) -> Optional[str]:
+    """Why a mode's record rules it out ("precision 0.2", "fallback rate 0.8"), or None; needs min runs."""
+    if not history or history["runs"] < _min_runs():
+        return None
+    if history["precision"] is not None and history["precision"] < _min_precision():
+        return f"precision {history['precision']}"
+    if history["fallback_rate"] is not None and history["fallback_rate"] > _max_fallback_rate():
+        return f"fallback rate {history['fallback_rate']}"
+    return None
+
+
+def tuner_account(collector) -> str:
+    """Cache key for a collector: token user and API host (github.com and an Enterprise host differ)."""
+    return f"{(collector.username or '-').lower()}@{urlparse(collector.api_base).netloc.lower()}"
+
+
+class PreflightTuner:
+    """
+    {account: {"capabilities": {mode: {"ok", "status", "checked_at"}},
+    "modes": {mode or mode@backend: {"runs", "core", "search", "graphql" (average calls per configured repo), "idle",
+    "active", "empty_fanouts", "fallbacks", "last_run"}}, "packed": {capacity: {"key", "groups"}}}} in one
+    JSON file.
+
+    "idle" / "active" count the preflight's verdicts; "empty_fanouts" the active verdicts whose fan-out
+    found nothing (wasted per-repo calls); "fallbacks" runs where the mode gave no verdict and the full
+    scan ran (hit list truncated, feed cut off, too many queries).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._counts = {"recorded_runs": 0, "capability_hits": 0, "packed_hits": 0}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data: Dict[str, Dict] = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def _account(self, account: str) -> Dict:
+        return self._data.setdefault(account, {"capabilities": {}, "modes": {}, "packed": {}})
+
+    def capability(self, account: str, mode: str) -> Optional[bool]:
+        """False when `mode` failed for this account within the TTL, True when it worked, None if unknown."""
+        with self._lock:
+            entry = (self._data.get(account) or {}).get("capabilities", {}).get(mode)
+            if not entry or time.time() - entry.get("checked_at", 0) >= _ttl_seconds():
+                return None
+            self._counts["capability_hits"] += 1
+            return bool(entry["ok"])
+
+    def note_capability(self, account: str, mode: str, ok: bool, status: Optional[int] = None) -> None:
+        with self._lock:
+            caps = self._account(account)["capabilities"]
+            entry = caps.get(mode)
+            if entry and entry["ok"] == ok and time.time() - entry.get("checked_at", 0) < _ttl_seconds():
+                return
+            caps[mode] = {"ok": ok, "status": status, "checked_at": int(time.time())}
+            self._dirty = True
+
+    def record_run(
+        self,
+        account: str,
+        mode: str,
+        spent: Dict[str, int],
+        repositories: int,
+        verdict: Optional[str],
+        found: bool,
+        backend: str = "rest",
+    ) -> None:
+        """
+        One day collected with `mode`: calls spent per budget, and the verdict ("idle", "active" or
+        "fallback"; None for modes that collect themselves) against whether any activity was found, under
+        the fan-out `backend`.
+        """
+        n = max(1, repositories)
+        with self._lock:
+            stats = self._account(account)["modes"].setdefault(
+                _mode_key(mode, backend), {"runs": 0, "idle": 0, "active": 0, "empty_fanouts": 0, "fallbacks": 0}
+            )
+            for budget in BUDGETS:
+                per_repo = spent.get(budget, 0) / n
+                prev = stats.get(budget)
+                stats[budget] = per_repo if prev is None else prev + _EWMA_ALPHA * (per_repo - prev)
+            stats["runs"] += 1
+            if verdict == "idle":
+                stats["idle"] += 1
+            elif verdict == "active":
+                stats["active"] += 1
+                if not found:
+                    stats["empty_fanouts"] += 1
+            elif verdict == "fallback":
+                stats["fallbacks"] += 1
+            stats["last_run"] = int(time.time())
+            self._counts["recorded_runs"] += 1
+            self._dirty = True
+
+    def measured_cost(
+        self, account: str, mode: str, repositories: int, backend: str = "rest"
+    ) -> Optional[Dict[str, int]]:
+        """Average calls per budget for `repositories` repos, once `mode` has GITHUB_PREFLIGHT_TUNER_MIN_RUNS runs."""
+        with self._lock:
+            stats = (self._data.get(account) or {}).get("modes", {}).get(_mode_key(mode, backend))
+            if not stats or stats["runs"] < _min_runs():
+                return None
+            return {budget: int(round(stats.get(budget, 0) * repositories)) for budget in BUDGETS}
+
+    def history(self, account: str, backend: str = "rest") -> Dict[str, Dict]:
+        """Per mode run under `backend`: runs, precision of its "active" verdicts and fallback share, for the run metrics."""
+        with self._lock:
+            modes = dict((self._data.get(account) or {}).get("modes", {}))
+        out = {}
+        for key, s in modes.items():
+            mode, _, tag = key.partition("@")
+            if (tag or "rest") != backend:
+                continue
+            out[mode] = {
+                "runs": s["runs"],
+                "precision": round(1 - s["empty_fanouts"] / s["active"], 3) if s["active"] else None,
+                "fallback_rate": round(s["fallbacks"] / s["runs"], 3) if s["runs"] else None,
+            }
+        return out
+
+    def packed_groups(self, account: str, terms: List[str], capacity: int, pack: Packer) -> Optional[List[List[str]]]:
+        """pack(terms, capacity), reused from the last run while the term list and capacity are unchanged."""
+        key = hashlib.sha1("\n".join(sorted(terms)).encode()).hexdigest()
+        with self._lock:
+            packed = self._account(account)["packed"]
+            entry = packed.get(str(capacity))
+            if entry and entry["key"] == key:
+                self._counts["packed_hits"] += 1
+                return [list(g) for g in entry["groups"]]
+        groups = pack(terms, capacity)
+        if groups is not None:
+            with self._lock:
+                packed = self._account(account)["packed"]
+                packed.pop(str(capacity), None)
+                packed[str(capacity)] = {"key": key, "groups": groups}
+                while len(packed) > _MAX_PACKED:
+                    packed.pop(next(iter(packed)))
+                self._dirty = True
+        return groups
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._data, indent=1, sort_keys=True)
+            self._dirty = False
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.debug("Preflight tuner write failed (%s): %s", self.path, e)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, accounts=len(self._data))
+
+
+def tune_candidates(
+    collector, candidates: Dict[str, Dict[str, int]], configured: str, repositories: int, backend: str = "rest"
+) -> Optional[Dict]:
+    """
+    The tuner's view of the planner's candidates: modes the account cannot use ("unsupported"), modes whose
+    verdicts were too often wrong or missing ({mode: reason}, "inaccurate"), measured totals for the rest
+    with enough history ("measured") and the per-mode history, all as measured under the fan-out `backend`.
+    The full scan ("off") is never ruled out.
+    None with the tuner off.
+    """
+    tuner = get_preflight_tuner()
+    if tuner is None:
+        return None
+    account = tuner_account(collector)
+    unsupported = sorted(name for name in candidates if tuner.capability(account, name) is False)
+    history = tuner.history(account, backend)
+    inaccurate = {}
+    for name in candidates:
+        reason = None if name == "off" else _accuracy_shortfall(history.get(name))
+        if reason:
+            inaccurate[name] = reason
+    measured = {}
+    for name in candidates:
+        cost = tuner.measured_cost(account, name, repositories, backend)
+        if cost is not None and name not in unsupported and name not in inaccurate:
+            measured[name] = cost
+    return {
+        "account": account,
+        "configured": configured,
+        "unsupported": unsupported,
+        "inaccurate": inaccurate,
+        "measured": measured,
+        "history": history,
+    }
+
+
+def record_day_outcome(collector, result: Dict, spent: Dict[str, int], backend: str = "rest") -> None:
+    """
+    Feed one collect_data_for_date result, what it spent and the fan-out backend it ran on into the tuner
+    (store and webhook answers: skipped).
+    """
+    tuner = get_preflight_tuner()
+    if tuner is None or not result or result.get("collection_error"):
+        return
+    if result.get("answered_from_store") or result.get("collected_via_webhooks"):
+        return
+    mode = result.get("preflight_mode") or "off"
+    verdict = result.get("preflight_verdict")
+    if result.get("collected_via_search") or result.get("collected_via_events"):
+        verdict = None
+    tuner.record_run(
+        tuner_account(collector),
+        mode,
+        spent,
+        result.get("repositories_configured") or len(collector.repositories),
+        verdict,
+        bool(result.get("repository_details")),
+        backend,
+    )
+
+
+_tuner: Optional[PreflightTuner] = None
+_tuner_lock = threading.Lock()
+
+
+def get_preflight_tuner() -> Optional[PreflightTuner]:
+    """Process-wide tuner (flushed at exit), or None when GITHUB_PREFLIGHT_TUNER=off."""
+    global _tuner
+    if not _tuner_enabled():
+        return None
+    with _tuner_lock:
+        if _tuner is None:
+            _tuner = PreflightTuner(Path(os.getenv("GITHUB_PREFLIGHT_TUNER_FILE") or DEFAULT_TUNER_FILE))
+            atexit.register(_tuner.flush)
+        return _tuner
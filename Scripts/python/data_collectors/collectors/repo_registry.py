@@ -0,0 +1,246 @@
+"""
+Canonical repository registry
+Normalizes configured repos once, remembers renames (301s) and caches dead (404) and archived repos
+with a TTL, so later runs neither fetch duplicates nor pay for repos that are gone. Complete owner
+listings are kept too, so searches can use user:/org: for owners whose every repo is configured.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.helpers import normalize_repo_identifier
+
+# collectors/repo_registry.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_REGISTRY_FILE = SCRIPTS_DIR / "logs" / "repo_registry.json"
+
+# (HTTP status, repo JSON or None) for GET /repos/{owner}/{name}, redirects followed.
+MetaFetcher = Callable[[str], Tuple[int, Optional[Dict]]]
+
+_MAX_RENAME_HOPS = 5
+# Owner listings live under this key in the registry file, next to the per-repo entries.
+_OWNERS_KEY = "@owners"
+
+
+def _registry_enabled() -> bool:
+    return os.getenv("GITHUB_REPO_REGISTRY", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _ttl_seconds() -> int:
+    """How long a 404/archived verdict is trusted (GITHUB_REPO_REGISTRY_TTL_DAYS, default 7)."""
+    try:
+        days = float(os.getenv("GITHUB_REPO_REGISTRY_TTL_DAYS", "7"))
+    except ValueError:
+        days = 7.0
+    return int(max(0.0, days) * 86400)
+
+
+class RepoRegistry:
+    """
+    {owner/name lower: {"canonical", "status" ("ok" | "missing"), "archived", "pushed_at", "checked_at",
+    "moved"}} in one JSON file, plus {"@owners": {owner lower: {"kind" ("user" | "org"), "repos",
+    "forks", "checked_at"}}} for owners whose full repo list was read.
+
+    "canonical" only differs from the key after a rename, so configured spelling (and with it the
+    calendar's project names) is kept otherwise. "moved" marks a repo whose requests were redirected;
+    its new name is looked up once, on the next resolve().
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._counts = {
+            "configured": 0,
+            "unique": 0,
+            "duplicates_dropped": 0,
+            "renamed": 0,
+            "missing_skipped": 0,
+            "archived_skipped": 0,
+            "lookups": 0,
+        }
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data: Dict[str, Dict] = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+        self._owners: Dict[str, Dict] = self._data.pop(_OWNERS_KEY, None) or {}
+
+    def _fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("checked_at", 0) < _ttl_seconds()
+
+    def _set(self, key: str, **fields) -> None:
+        with self._lock:
+            entry = self._data.setdefault(key.lower(), {"canonical": key, "status": "ok"})
+            entry.update(fields, checked_at=int(time.time()))
+            self._dirty = True
+
+    def note_meta(self, owner_repo: str, meta: Dict) -> None:
+        """Record a /repos or repo-listing item; a different full_name means the repo was renamed."""
+        full_name = meta.get("full_name") or owner_repo
+        fields = {"status": "ok", "archived": bool(meta.get("archived")), "pushed_at": meta.get("pushed_at"), "moved": False}
+        if full_name.lower() != owner_repo.lower():
+            self._set(full_name, canonical=full_name, **fields)
+            fields["canonical"] = full_name
+        self._set(owner_repo, **fields)
+
+    def note_missing(self, owner_repo: str) -> None:
+        self._set(owner_repo, status="missing", moved=False)
+
+    def note_moved(self, owner_repo: str) -> None:
+        with self._lock:
+            entry = self._data.get(owner_repo.lower())
+            if entry and entry.get("moved"):
+                return
+        self._set(owner_repo, moved=True)
+
+    def note_response(self, owner_repo: str, response) -> None:
+        """Learn from a repo-scoped response: 404/410 = gone, a followed 301 = renamed (name looked up later)."""
+        if response.status_code in (404, 410):
+            self.note_missing(owner_repo)
+        elif any(getattr(r, "status_code", None) == 301 for r in getattr(response, "history", None) or []):
+            self.note_moved(owner_repo)
+
+    def canonical(self, owner_repo: str) -> str:
+        name = owner_repo
+        for _ in range(_MAX_RENAME_HOPS):
+            with self._lock:
+                entry = self._data.get(name.lower())
+            target = (entry or {}).get("canonical") or name
+            if target.lower() == name.lower():
+                return name
+            name = target
+        return name
+
+    def skip_reason(self, owner_repo: str, cutoff_iso: Optional[str] = None) -> Optional[str]:
+        """
+        "missing" for a fresh 404, "archived" for a fresh archived repo last pushed before cutoff_iso
+        (archived repos cannot be pushed to); None = fetch it.
+        """
+        with self._lock:
+            entry = dict(self._data.get(owner_repo.lower()) or {})
+        if not entry or not self._fresh(entry):
+            return None
+        if entry.get("status") == "missing":
+            return "missing"
+        pushed_at = entry.get("pushed_at") or ""
+        if cutoff_iso and entry.get("archived") and pushed_at and pushed_at < cutoff_iso:
+            return "archived"
+        return None
+
+    def cached_meta(self, owner_repo: str) -> Optional[Dict]:
+        """Fresh cached verdict for tools (status/archived/pushed_at/canonical), or None."""
+        with self._lock:
+            entry = self._data.get(owner_repo.lower())
+        return dict(entry) if entry and self._fresh(entry) else None
+
+    def lookup(self, owner_repo: str, fetch: MetaFetcher) -> Optional[Dict]:
+        """GET /repos/{owner_repo} through `fetch` and record the outcome; returns the repo JSON or None."""
+        with self._lock:
+            self._counts["lookups"] += 1
+        status, meta = fetch(owner_repo)
+        if status == 200 and meta:
+            self.note_meta(owner_repo, meta)
+            return meta
+        if status in (404, 410):
+            self.note_missing(owner_repo)
+        return None
+
+    def resolve(self, raw_repos: List[str], username: str, fetch: Optional[MetaFetcher] = None) -> List[str]:
+        """
+        Configured entries -> canonical owner/name, deduplicated (case-insensitive, order kept), without
+        repos cached as missing. Redirected repos are looked up first when `fetch` is given.
+        """
+        out: List[str] = []
+        seen: set = set()
+        counts = {"configured": len(raw_repos), "duplicates_dropped": 0, "renamed": 0, "missing_skipped": 0}
+        for raw in raw_repos:
+            owner_repo = normalize_repo_identifier(raw, username)
+            if not owner_repo:
+                continue
+            with self._lock:
+                moved = (self._data.get(owner_repo.lower()) or {}).get("moved")
+            if moved and fetch:
+                self.lookup(owner_repo, fetch)
+            canonical = self.canonical(owner_repo)
+            if canonical.lower() != owner_repo.lower():
+                counts["renamed"] += 1
+            if self.skip_reason(canonical) == "missing":
+                counts["missing_skipped"] += 1
+                continue
+            if canonical.lower() in seen:
+                counts["duplicates_dropped"] += 1
+                continue
+            seen.add(canonical.lower())
+            out.append(canonical)
+        with self._lock:
+            self._counts.update(counts, unique=len(out))
+        if counts["renamed"] or counts["missing_skipped"] or counts["duplicates_dropped"]:
+            logging.info(
+                "Repo registry: %s configured -> %s unique (%s renamed, %s missing, %s duplicates).",
+                len(raw_repos),
+                len(out),
+                counts["renamed"],
+                counts["missing_skipped"],
+                counts["duplicates_dropped"],
+            )
+        return out
+
+    def note_owner_listing(self, owner: str, kind: str, repos: List[Dict]) -> None:
+        """Record the complete repo listing of `owner` (kind "user" or "org"): lowercase names, forks apart."""
+        names = sorted((r.get("full_name") or "").lower() for r in repos if not r.get("fork"))
+        forks = sorted((r.get("full_name") or "").lower() for r in repos if r.get("fork"))
+        with self._lock:
+            self._owners[owner.lower()] = {"kind": kind, "repos": names, "forks": forks, "checked_at": int(time.time())}
+            self._dirty = True
+
+    def owner_inventory(self, owner: str) -> Optional[Dict]:
+        """Fresh complete listing of `owner` ({"kind", "repos", "forks"}), or None."""
+        with self._lock:
+            entry = self._owners.get(owner.lower())
+        return dict(entry) if entry and self._fresh(entry) else None
+
+    def note_archived_skipped(self, n: int) -> None:
+        with self._lock:
+            self._counts["archived_skipped"] += n
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(dict(self._data, **{_OWNERS_KEY: self._owners}), indent=1, sort_keys=True)
+            self._dirty = False
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.debug("Repo registry write failed (%s): %s", self.path, e)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, known=len(self._data))
+
+
+_registry: Optional[RepoRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_repo_registry() -> Optional[RepoRegistry]:
+    """Process-wide registry (flushed at exit), or None when GITHUB_REPO_REGISTRY=off."""
+    global _registry
+    if not _registry_enabled():
+        return None
+    with _registry_lock:
+        if _registry is None:
+            _registry = RepoRegistry(Path(os.getenv("GITHUB_REPO_REGISTRY_FILE") or DEFAULT_REGISTRY_FILE))
+            atexit.register(_registry.flush)
+        return _registry
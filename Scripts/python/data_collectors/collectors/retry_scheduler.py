@@ -0,0 +1,113 @@
+"""
+Delay-queue retry scheduler for the thread-pool fan-out
+A request that has to wait (rate-limit reset, retry-after, backoff) parks its whole repo task instead
+of sleeping in a pool thread. The task is re-dispatched when the wait is over and replays the
+responses it already received, so only the failed request is sent again.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+_local = threading.local()
+_counts = {"tasks": 0, "parked": 0, "redispatched": 0, "max_parked": 0, "replayed_responses": 0}
+_counts_lock = threading.Lock()
+
+
+def parking_enabled() -> bool:
+    """GITHUB_RETRY_PARKING=off sleeps in the worker thread instead (the old behaviour)."""
+    return os.getenv("GITHUB_RETRY_PARKING", "").strip().lower() not in ("0", "false", "no", "off")
+
+
+class ParkRequest(BaseException):
+    """
+    Raised inside a parkable task: retry the task in `delay` seconds. A BaseException, so the
+    `except Exception` fallbacks around individual requests let it through to the scheduler.
+    """
+
+    def __init__(self, delay: float, reason: str):
+        super().__init__(f"parked {delay:.1f}s ({reason})")
+        self.delay = delay
+        self.reason = reason
+
+
+class TaskContext:
+    """Per-task memo of finished requests and retry attempts, kept across re-dispatches."""
+
+    def __init__(self):
+        self.responses: Dict[Hashable, Any] = {}
+        self.attempts: Dict[Hashable, int] = {}
+
+    def replay(self, key: Hashable) -> Optional[Any]:
+        response = self.responses.get(key)
+        if response is not None:
+            with _counts_lock:
+                _counts["replayed_responses"] += 1
+        return response
+
+
+def current_task() -> Optional[TaskContext]:
+    """The parkable task running on this thread, or None (plain call: retries sleep in place)."""
+    return getattr(_local, "task", None)
+
+
+def _run_in_context(ctx: TaskContext, fn: Callable[[], Any]) -> Any:
+    _local.task = ctx
+    try:
+        return fn()
+    finally:
+        _local.task = None
+
+
+def run_parkable(
+    tasks: Dict[Hashable, Callable[[], Any]], max_workers: int
+) -> Iterator[Tuple[Hashable, Optional[Any], Optional[BaseException]]]:
+    """
+    Run every task on a pool of max_workers threads; yields (key, result, exception) as tasks finish.
+    A task raising ParkRequest goes into a time-ordered delay queue and frees its thread; it runs
+    again once the delay has passed.
+    """
+    contexts = {key: TaskContext() for key in tasks}
+    delayed: list = []  # heap of (ready_at, seq, key)
+    seq = itertools.count()
+    with _counts_lock:
+        _counts["tasks"] += len(tasks)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running: Dict[Future, Hashable] = {
+            executor.submit(_run_in_context, contexts[key], fn): key for key, fn in tasks.items()
+        }
+        while running or delayed:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                _, _, key = heapq.heappop(delayed)
+                with _counts_lock:
+                    _counts["redispatched"] += 1
+                running[executor.submit(_run_in_context, contexts[key], tasks[key])] = key
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            if not running:
+                time.sleep(timeout or 0)
+                continue
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                error = future.exception()
+                if isinstance(error, ParkRequest):
+                    heapq.heappush(delayed, (time.monotonic() + error.delay, next(seq), key))
+                    with _counts_lock:
+                        _counts["parked"] += 1
+                        _counts["max_parked"] = max(_counts["max_parked"], len(delayed))
+                    logging.debug("Parked %s: %s", key, error)
+                    continue
+                contexts.pop(key, None)
+                yield key, (None if error else future.result()), error
+
+
+def retry_scheduler_stats() -> Optional[Dict]:
+    """Parking counters for this run, or None when nothing ran through the scheduler."""
+    with _counts_lock:
+        return dict(_counts) if _counts["tasks"] else None
@@ -0,0 +1,297 @@
+"""
+Local SQLite store of GitHub activity
+Commits, PRs and issues keyed by repo + sha/number, with per-repo coverage spans and per-branch head
+watermarks so historical dates are answered without touching the network.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .day_window import DayTimezone, Window, local_day
+
+# collectors/store.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_STORE_PATH = SCRIPTS_DIR / "logs" / "github_activity.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    repo TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    day TEXT NOT NULL,
+    committed_at TEXT NOT NULL,
+    message TEXT NOT NULL,
+    author TEXT NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (repo, sha)
+);
+CREATE INDEX IF NOT EXISTS commits_by_day ON commits (repo, day);
+CREATE INDEX IF NOT EXISTS commits_by_time ON commits (repo, committed_at);
+CREATE TABLE IF NOT EXISTS pulls (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (repo, number)
+);
+CREATE INDEX IF NOT EXISTS pulls_by_day ON pulls (repo, day);
+CREATE INDEX IF NOT EXISTS pulls_by_time ON pulls (repo, created_at);
+CREATE TABLE IF NOT EXISTS issues (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    is_pr INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (repo, number)
+);
+CREATE INDEX IF NOT EXISTS issues_by_day ON issues (repo, day);
+CREATE INDEX IF NOT EXISTS issues_by_time ON issues (repo, created_at);
+CREATE TABLE IF NOT EXISTS watermarks (
+    repo TEXT NOT NULL,
+    branch TEXT NOT NULL,
+    head_sha TEXT,
+    PRIMARY KEY (repo, branch)
+);
+CREATE TABLE IF NOT EXISTS repo_sync (
+    repo TEXT PRIMARY KEY,
+    covered_since TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+def _store_enabled() -> bool:
+    """GITHUB_STORE=on keeps synced history in SQLite (off by default)."""
+    return os.getenv("GITHUB_STORE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _head_check_settle_hours() -> float:
+    """
+    GITHUB_STORE_HEAD_CHECK_HOURS (default 72): windows ending this long before a repo's synced_at are
+    answered without a head check. Any later check still upserts every commit between the old and new
+    heads, whatever its date, so runs for recent days keep catching late pushes for older ones.
+    """
+    try:
+        return max(0.0, float(os.getenv("GITHUB_STORE_HEAD_CHECK_HOURS", "72")))
+    except ValueError:
+        return 72.0
+
+
+class ActivityStore:
+    """
+    One SQLite file in WAL mode, one connection per thread (readers never block the writer).
+
+    A repo is "covered" from covered_since to synced_at (both UTC timestamps; synced_at is the upper
+    end of the span, not the time of the sync): every commit (committer date), PR and issue created in
+    that span is in the store. Syncs only list what lies outside the span. The watermarks hold only
+    each branch's head sha when the span was last checked (no dates: the span is the coverage), so
+    commits dated inside the span but pushed later are found by comparing heads. `day` columns hold
+    the UTC day; reads bucket by the caller's timezone.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counts = {
+            "repo_days_from_store": 0,
+            "repos_synced": 0,
+            "commits_written": 0,
+            "late_commits": 0,
+            "coverage_dropped": 0,
+        }
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += n
+
+    def coverage(self, repo: str) -> Optional[Dict]:
+        row = self._conn().execute(
+            "SELECT covered_since, synced_at FROM repo_sync WHERE repo = ?", (repo,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def covers(self, repo: str, window: Window) -> bool:
+        """True when the whole (since, until) UTC window is complete in the store."""
+        cov = self.coverage(repo)
+        if not cov:
+            return False
+        # Rows written before timestamps were used hold a bare day, which sorts before that day's midnight.
+        return cov["covered_since"] <= window[0] and window[1] <= cov["synced_at"]
+
+    def head_check_due(self, repo: str, window: Window) -> bool:
+        """False when `window` is covered and ends well before synced_at (_head_check_settle_hours)."""
+        cov = self.coverage(repo)
+        if not cov or not (cov["covered_since"] <= window[0] and window[1] <= cov["synced_at"]):
+            return True
+        try:
+            synced = datetime.strptime(cov["synced_at"], "%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            return True
+        settled = synced - timedelta(hours=_head_check_settle_hours())
+        return window[1] > settled.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def watermarks(self, repo: str) -> Dict[str, Dict]:
+        """{branch ("" = default): {"head_sha"}} for every branch of `repo`."""
+        rows = self._conn().execute("SELECT branch, head_sha FROM watermarks WHERE repo = ?", (repo,)).fetchall()
+        return {row["branch"]: {"head_sha": row["head_sha"]} for row in rows}
+
+    def forget(self, repo: str) -> None:
+        """History was rewritten: drop coverage, watermarks and commits (some may be gone from every branch)."""
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM commits WHERE repo = ?", (repo,))
+            conn.execute("DELETE FROM repo_sync WHERE repo = ?", (repo,))
+            conn.execute("DELETE FROM watermarks WHERE repo = ?", (repo,))
+        self._bump("coverage_dropped")
+
+    def note_late_commits(self, n: int) -> None:
+        self._bump("late_commits", n)
+
+    def record(
+        self,
+        repo: str,
+        commits: List[Dict],
+        pulls: List[Dict],
+        issues: List[Dict],
+        watermarks: Optional[Dict[str, Dict]] = None,
+        covered_since: Optional[str] = None,
+        synced_at: Optional[str] = None,
+    ) -> None:
+        """
+        Upsert raw REST items in one transaction. Coverage only moves when the caller saw complete
+        listings for a span adjoining the current one (covered_since/synced_at given): the two spans are
+        merged. Partial fetches still keep their rows.
+        """
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO commits (repo, sha, day, committed_at, message, author, url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [_commit_row(repo, c) for c in commits],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO pulls (repo, number, day, created_at) VALUES (?, ?, ?, ?)",
+                [(repo, p["number"], p["created_at"][:10], p["created_at"]) for p in pulls],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO issues (repo, number, day, created_at, is_pr) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (repo, i["number"], i["created_at"][:10], i["created_at"], 1 if "pull_request" in i else 0)
+                    for i in issues
+                ],
+            )
+            for branch, mark in (watermarks or {}).items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO watermarks (repo, branch, head_sha) VALUES (?, ?, ?)",
+                    (repo, branch, mark.get("head_sha")),
+                )
+            if covered_since and synced_at:
+                prev = self.coverage(repo)
+                if prev:
+                    covered_since = min(covered_since, prev["covered_since"])
+                    synced_at = max(synced_at, prev["synced_at"])
+                conn.execute(
+                    "INSERT OR REPLACE INTO repo_sync (repo, covered_since, synced_at) VALUES (?, ?, ?)",
+                    (repo, covered_since, synced_at),
+                )
+        self._bump("commits_written", len(commits))
+        if synced_at:
+            self._bump("repos_synced")
+
+    def day_results(self, repo: str, display_name: str, window: Window, tz: DayTimezone) -> Dict[str, Dict]:
+        """{day in tz: _fetch_repo_data-shaped dict} for days in the window with any activity."""
+        conn = self._conn()
+        out: Dict[str, Dict] = {}
+
+        def entry(day: str) -> Dict:
+            if day not in out:
+                out[day] = {"repo": display_name, "commits": 0, "prs": 0, "issues": 0, "commit_details": []}
+            return out[day]
+
+        for row in conn.execute(
+            "SELECT sha, committed_at, message, author, url FROM commits "
+            "WHERE repo = ? AND committed_at BETWEEN ? AND ? ORDER BY committed_at DESC",
+            (repo, window[0], window[1]),
+        ):
+            e = entry(local_day(row["committed_at"], tz))
+            e["commits"] += 1
+            e["commit_details"].append(
+                {
+                    "sha": row["sha"][:7],
+                    "message": row["message"],
+                    "author": row["author"],
+                    "url": row["url"],
+                    "timestamp": row["committed_at"],
+                }
+            )
+        for row in conn.execute(
+            "SELECT created_at FROM pulls WHERE repo = ? AND created_at BETWEEN ? AND ?",
+            (repo, window[0], window[1]),
+        ):
+            entry(local_day(row["created_at"], tz))["prs"] += 1
+        # REST /issues also returns PRs; those are counted in pulls only.
+        for row in conn.execute(
+            "SELECT created_at FROM issues WHERE repo = ? AND is_pr = 0 AND created_at BETWEEN ? AND ?",
+            (repo, window[0], window[1]),
+        ):
+            entry(local_day(row["created_at"], tz))["issues"] += 1
+        return out
+
+    def note_answered(self, repo_days: int) -> None:
+        self._bump("repo_days_from_store", repo_days)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, path=str(self.path))
+
+
+def _commit_row(repo: str, commit: Dict) -> tuple:
+    commit_obj = commit.get("commit", {})
+    committed_at = (commit_obj.get("committer") or {}).get("date", "")
+    return (
+        repo,
+        commit["sha"],
+        committed_at[:10],
+        committed_at,
+        (commit_obj.get("message") or "").split("\n")[0],
+        (commit_obj.get("author") or {}).get("name", "Unknown"),
+        commit.get("html_url", ""),
+    )
+
+
+_store: Optional[ActivityStore] = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+
+def get_activity_store() -> Optional[ActivityStore]:
+    """Process-wide store, or None unless GITHUB_STORE=on (or when the file cannot be opened)."""
+    global _store, _store_failed
+    if _store_failed or not _store_enabled():
+        return None
+    with _store_lock:
+        if _store is None and not _store_failed:
+            path = Path(os.getenv("GITHUB_STORE_PATH") or DEFAULT_STORE_PATH)
+            try:
+                _store = ActivityStore(path)
+            except (OSError, sqlite3.Error) as e:
+                logging.warning("Activity store disabled (%s): %s", path, e)
+                _store_failed = True
+        return _store
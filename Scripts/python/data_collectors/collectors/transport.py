@@ -0,0 +1,184 @@
+"""
+Shared HTTP transport for GitHub API calls
+One pooled, keep-alive requests.Session reused by every worker thread
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+# Distinct hosts kept in the pool manager (api.github.com, plus redirects to codeload/uploads).
+POOL_HOSTS = 4
+
+
+def _budget(url: str) -> str:
+    """GitHub rate-limit budget a request is charged to."""
+    path = urlparse(url).path
+    if "/search/" in path:
+        return "search"
+    if path.endswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+def _rate_limit_is_error(response: requests.Response) -> bool:
+    """429, or a 403 for an exhausted budget or a secondary limit (told apart by the message body)."""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    remaining = response.headers.get("x-ratelimit-remaining", "")
+    if remaining == "0":
+        return True
+    try:
+        error_data = response.json()
+        if isinstance(error_data, dict):
+            message = error_data.get("message", "").lower()
+            if "rate limit" in message or "api rate limit" in message:
+                return True
+    except Exception:
+        pass
+    return False
+
+
+class GitHubTransport:
+    """
+    Thread-safe pooled session sized to the worker count.
+
+    requests.Session + HTTPAdapter keeps one urllib3 pool per host, so every worker thread reuses
+    warm TLS connections instead of paying a handshake per call. Counters are cumulative for the
+    lifetime of the transport (one process = one run).
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        self._lock = threading.Lock()
+        self.pool_size = max(1, pool_size)
+        self.session, self._adapter = self._new_session(self.pool_size)
+        self._requests = 0
+        self._errors = 0
+        self._latency_ms_total = 0.0
+        self._latency_ms_max = 0.0
+        # Answered requests per budget; 304s are free and not counted.
+        self._by_budget = {"core": 0, "search": 0, "graphql": 0}
+        # Sessions replaced by ensure_pool_size(): requests in flight may still use them, so they are
+        # only closed with the transport (and their connections still count in stats()).
+        self._retired: List[Tuple[requests.Session, HTTPAdapter]] = []
+
+    @staticmethod
+    def _new_session(pool_size: int) -> Tuple[requests.Session, HTTPAdapter]:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size, pool_block=False)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session, adapter
+
+    def ensure_pool_size(self, workers: int) -> None:
+        """
+        Grow the per-host pool so `workers` threads never open throwaway connections. Call before fanning
+        out: the larger pool comes with a new session, swapped in whole, so threads already sending
+        through the old one are not disturbed.
+        """
+        with self._lock:
+            if workers <= self.pool_size:
+                return
+            self._retired.append((self.session, self._adapter))
+            self.pool_size = workers
+            self.session, self._adapter = self._new_session(workers)
+
+    @staticmethod
+    def _pool_connections(adapter: HTTPAdapter) -> int:
+        """New connections opened by an adapter (urllib3 counts them per host pool)."""
+        pools = adapter.poolmanager.pools
+        total = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                total += getattr(pool, "num_connections", 0)
+        return total
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        t0 = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._requests += 1
+                self._errors += 1
+            raise
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        with self._lock:
+            self._requests += 1
+            if response.status_code != 304:
+                self._by_budget[_budget(url)] += 1
+            self._latency_ms_total += elapsed_ms
+            if elapsed_ms > self._latency_ms_max:
+                self._latency_ms_max = elapsed_ms
+        logging.debug("%s %s -> %s in %.0f ms", method, url, response.status_code, elapsed_ms)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def charge(self, url: str, status_code: int) -> None:
+        """Count a response answered outside this session (the async engine's httpx client) in spent()."""
+        if status_code == 304:
+            return
+        with self._lock:
+            self._by_budget[_budget(url)] += 1
+
+    def stats(self) -> Dict:
+        """Snapshot for last_run_metrics.json."""
+        with self._lock:
+            adapters = [adapter for _, adapter in self._retired] + [self._adapter]
+            new_connections = sum(self._pool_connections(adapter) for adapter in adapters)
+            completed = self._requests - self._errors
+            return {
+                "requests": self._requests,
+                "errors": self._errors,
+                "new_connections": new_connections,
+                "reused_connections": max(0, completed - new_connections),
+                "latency_ms_total": round(self._latency_ms_total, 1),
+                "latency_ms_avg": round(self._latency_ms_total / completed, 1) if completed else None,
+                "latency_ms_max": round(self._latency_ms_max, 1),
+                "pool_size": self.pool_size,
+                "by_budget": dict(self._by_budget),
+            }
+
+    def spent(self) -> Dict[str, int]:
+        """Requests charged per budget so far; diff two snapshots for one phase of a run."""
+        with self._lock:
+            return dict(self._by_budget)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = [session for session, _ in self._retired] + [self.session]
+            self._retired: List[Tuple[requests.Session, HTTPAdapter]] = []
+        for session in sessions:
+            session.close()
+
+
+_transport: Optional[GitHubTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport(pool_size: Optional[int] = None) -> GitHubTransport:
+    """Process-wide transport; pass pool_size to grow the pool before fanning out."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = GitHubTransport(pool_size or DEFAULT_POOL_SIZE)
+        elif pool_size:
+            _transport.ensure_pool_size(pool_size)
+        return _transport
@@ -0,0 +1,278 @@
+"""
+Local webhook event log
+The webhook receiver (data_collectors.webhook_receiver) appends one slim JSON line per GitHub push,
+pull_request and issues delivery, plus heartbeats while it runs. A day can then be answered from the
+log for every repo it provably covers: the receiver was up the whole time, the repo's hook predates the
+day, and its pushes chain (each push's "before" is the previous push's "after"). Other repos are gaps,
+fetched over the API.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .day_window import Window, in_window, utc_timestamp
+
+# collectors/webhook_log.py -> parents[3] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_LOG_FILE = SCRIPTS_DIR / "logs" / "webhook_events.jsonl"
+
+EVENTS = ("push", "pull_request", "issues")
+# A push payload lists at most this many commits; a full list may be cut short.
+PUSH_COMMITS_MAX = 2048
+HEARTBEAT_SECONDS = 60
+_ZERO_SHA = "0" * 40
+
+
+def _webhooks_enabled() -> bool:
+    """GITHUB_WEBHOOKS=on answers days from the receiver's log (off by default: needs the receiver running)."""
+    return os.getenv("GITHUB_WEBHOOKS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _max_gap_seconds() -> int:
+    """Longest silence (no event, no heartbeat) still counted as uptime (GITHUB_WEBHOOK_MAX_GAP_SECONDS, default 300)."""
+    try:
+        return max(HEARTBEAT_SECONDS, int(os.getenv("GITHUB_WEBHOOK_MAX_GAP_SECONDS", "300")))
+    except ValueError:
+        return 300
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _seconds(stamp: str) -> float:
+    return datetime.fromisoformat(stamp.replace("Z", "+00:00")).timestamp()
+
+
+def verify_signature(secret: str, body: bytes, header: Optional[str]) -> bool:
+    """X-Hub-Signature-256 ("sha256=<hex HMAC of the raw body>") checked in constant time."""
+    if not secret or not header or not header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header[len("sha256=") :])
+
+
+def slim_record(event: str, delivery: str, payload: Dict, received_at: Optional[str] = None) -> Optional[Dict]:
+    """
+    What the collector needs from one delivery, or None for events it does not use. Pings keep the hook
+    id and scope (a repo, or every repo of an organization) so a hook is known before its first event.
+    """
+    repo = ((payload.get("repository") or {}).get("full_name") or "").lower()
+    record = {"delivery": delivery, "event": event, "at": received_at or _now(), "repo": repo}
+    if event == "ping":
+        hook = payload.get("hook") or {}
+        org = ((payload.get("organization") or {}).get("login") or "").lower()
+        record.update(hook_id=payload.get("hook_id") or hook.get("id"), hook_type=hook.get("type"), org=org)
+        return record
+    if event == "push":
+        default_branch = (payload.get("repository") or {}).get("default_branch") or "main"
+        commits = payload.get("commits") or []
+        record.update(
+            ref=payload.get("ref"),
+            default=payload.get("ref") == f"refs/heads/{default_branch}",
+            before=payload.get("before"),
+            after=payload.get("after"),
+            forced=bool(payload.get("forced")),
+            deleted=bool(payload.get("deleted")),
+            truncated=len(commits) >= PUSH_COMMITS_MAX,
+            commits=[
+                {
+                    "sha": c.get("id") or "",
+                    "message": (c.get("message") or "").split("\n")[0],
+                    "author": (c.get("author") or {}).get("name") or "Unknown",
+                    "url": c.get("url") or "",
+                    "timestamp": c.get("timestamp") or "",
+                }
+                for c in commits
+            ],
+        )
+        return record
+    if event in ("pull_request", "issues"):
+        item = payload.get("pull_request" if event == "pull_request" else "issue") or {}
+        record.update(action=payload.get("action"), number=item.get("number"), created_at=item.get("created_at"))
+        return record
+    return None
+
+
+class WebhookLog:
+    """Append-only JSON lines; deliveries GitHub sends again (same delivery id) are read once."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict) -> None:
+        line = json.dumps(record, separators=(",", ":"), sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def mark(self, state: str) -> None:
+        """Receiver lifecycle: "start", "heartbeat" or "stop"."""
+        self.append({"event": "receiver", "state": state, "at": _now()})
+
+    def records(self) -> Iterator[Dict]:
+        seen: Set[str] = set()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut short by a crash
+                    delivery = record.get("delivery")
+                    if delivery:
+                        if delivery in seen:
+                            continue
+                        seen.add(delivery)
+                    yield record
+        except OSError:
+            return
+
+    def compact(self, keep_days: int) -> int:
+        """Drop records older than keep_days (latest push per ref kept for the chain). Returns lines dropped."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=keep_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        records = list(self.records())
+        last_push = {}
+        for i, r in enumerate(records):
+            if r.get("event") == "push":
+                last_push[(r["repo"], r.get("ref"))] = i
+        keep_index = set(last_push.values())
+        kept = [r for i, r in enumerate(records) if r.get("at", "") >= cutoff or i in keep_index or r.get("event") == "ping"]
+        with self._lock:
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for r in kept:
+                    f.write(json.dumps(r, separators=(",", ":"), sort_keys=True) + "\n")
+            os.replace(tmp, self.path)
+        return len(records) - len(kept)
+
+    def uptime_covers(self, start: str, end: str) -> bool:
+        """
+        The receiver logged something at or before `start`, never went quiet longer than the max gap until
+        `end`, and did not restart in between (deliveries sent while it was down are not retried).
+        """
+        gap = _max_gap_seconds()
+        records = sorted(((r["at"], r.get("state")) for r in self.records() if r.get("at")), key=lambda r: r[0])
+        previous = previous_state = None
+        for stamp, state in records:
+            if stamp <= start:
+                previous, previous_state = stamp, state
+                continue
+            if previous is None or previous_state == "stop" or state == "start":
+                return False
+            if _seconds(stamp) - _seconds(previous) > gap:
+                return False
+            previous, previous_state = stamp, state
+            if stamp >= end:
+                return True
+        return previous is not None and previous_state != "stop" and _seconds(end) - _seconds(previous) <= gap
+
+    def covers_window(self, window: Window) -> bool:
+        """Receiver uptime over the window, up to now for a day still in progress."""
+        return self.uptime_covers(window[0], min(window[1], _now()))
+
+    def answer_day(
+        self, window: Window, repos: List[str], all_branches: bool
+    ) -> Optional[Tuple[Dict[str, Dict], Set[str], Dict[int, Dict]]]:
+        """
+        ({repo lower: {"commits": [details], "prs": n, "issues": n}}, gap repos, {hook id: hook}) for the
+        lowercase owner/name `repos`, or None when the receiver was not up from the window's start until
+        now (or its end, if earlier). Commits are those pushed to the default branch (any branch with
+        all_branches) dated inside the window; PRs and issues those opened inside it.
+        """
+        if not self.covers_window(window):
+            return None
+        wanted = set(repos)
+        hooked: Dict[str, str] = {}  # repo or "@org" -> first record time
+        hooks: Dict[int, Dict] = {}
+        pushes: Dict[Tuple[str, str], List[Dict]] = {}
+        out: Dict[str, Dict] = {}
+        opened: Dict[str, Dict[str, set]] = {}
+        for r in self.records():
+            kind = r.get("event")
+            if kind == "ping":
+                scope = f"@{r['org']}" if r.get("hook_type") == "Organization" and r.get("org") else r.get("repo")
+                if scope:
+                    hooked.setdefault(scope, r["at"])
+                if r.get("hook_id"):
+                    hooks[int(r["hook_id"])] = {"scope": scope, "since": r["at"]}
+                continue
+            repo = r.get("repo")
+            if kind not in EVENTS or repo not in wanted:
+                continue
+            hooked.setdefault(repo, r["at"])
+            if kind == "push":
+                if r.get("default") or all_branches:
+                    pushes.setdefault((repo, r.get("ref")), []).append(r)
+            elif r.get("action") == "opened" and in_window(r.get("created_at") or r["at"], window):
+                key = "prs" if kind == "pull_request" else "issues"
+                opened.setdefault(repo, {"prs": set(), "issues": set()})[key].add(r.get("number") or r["delivery"])
+
+        gaps: Set[str] = set()
+        for repo in wanted:
+            since = min(hooked.get(repo, "~"), hooked.get("@" + repo.split("/")[0], "~"))
+            if since > window[0]:
+                gaps.add(repo)
+        seen: Dict[str, Set[str]] = {}
+        for (repo, ref), chain in pushes.items():
+            chain.sort(key=lambda r: r["at"])
+            for previous, push in zip([None] + chain[:-1], chain):
+                if push["at"] < window[0]:
+                    continue
+                broken = previous is not None and push.get("before") not in (previous.get("after"), _ZERO_SHA)
+                if broken or push.get("forced") or push.get("truncated"):
+                    gaps.add(repo)
+                    break
+                if push.get("deleted"):
+                    continue
+                for c in push.get("commits") or []:
+                    if c["sha"] in seen.setdefault(repo, set()) or not in_window(c["timestamp"], window):
+                        continue
+                    seen[repo].add(c["sha"])
+                    entry = out.setdefault(repo, {"commits": [], "prs": 0, "issues": 0})
+                    entry["commits"].append(
+                        {
+                            "sha": c["sha"][:7],
+                            "message": c["message"],
+                            "author": c["author"],
+                            "url": c["url"],
+                            "timestamp": c["timestamp"],
+                        }
+                    )
+        for repo, kinds in opened.items():
+            entry = out.setdefault(repo, {"commits": [], "prs": 0, "issues": 0})
+            entry["prs"], entry["issues"] = len(kinds["prs"]), len(kinds["issues"])
+        for entry in out.values():
+            entry["commits"].sort(key=lambda d: utc_timestamp(d["timestamp"]), reverse=True)
+        return {repo: v for repo, v in out.items() if repo not in gaps}, gaps, hooks
+
+
+_log: Optional[WebhookLog] = None
+_log_lock = threading.Lock()
+
+
+def webhook_log_path() -> Path:
+    return Path(os.getenv("GITHUB_WEBHOOK_LOG_FILE") or DEFAULT_LOG_FILE)
+
+
+def get_webhook_log() -> Optional[WebhookLog]:
+    """Process-wide log reader, or None unless GITHUB_WEBHOOKS=on."""
+    global _log
+    if not _webhooks_enabled():
+        return None
+    with _log_lock:
+        if _log is None:
+            _log = WebhookLog(webhook_log_path())
+            logging.debug("Webhook log: %s", _log.path)
+        return _log
@@ -9,11 +9,30 @@ import json
 import logging
 import time
 from pathlib import Path
-from datetime import datetime, date, timezone
-from typing import Any, Dict
+from datetime import datetime, date, timedelta, timezone
+from typing import Any, Dict, Optional
 
 from .utils.config import load_config, setup_env
-from .collectors.github import GitHubCollector
+from .collectors.github import GitHubCollector, _collector_backend, _commits_all_branches_enabled
+from .collectors.branch_heads import get_branch_head_cache
+from .collectors.budget_planner import (
+    fetch_rate_limit,
+    format_plan,
+    plan_day,
+    plan_range,
+    plan_summary,
+    planner_mode,
+    wait_for_budget,
+)
+from .collectors.concurrency import concurrency_stats
+from .collectors.deadline import DeadlineExceeded, deadline_exceeded, deadline_stats, resolve_deadline_minutes, set_run_deadline
+from .collectors.git_mirror import git_mirror_stats
+from .collectors.preflight_tuner import record_day_outcome
+from .collectors.repo_registry import get_repo_registry
+from .collectors.retry_scheduler import retry_scheduler_stats
+from .collectors.http_cache import get_http_cache
+from .collectors.store import get_activity_store
+from .collectors.transport import get_transport
 from .obsidian_calendar.updater import CalendarUpdater
 
 # Configure logging — Scripts/python/data_collectors/main.py -> parents[2] == Scripts/
@@ -41,6 +60,7 @@ def _default_run_metrics(target_date: date, started_at: str) -> Dict[str, Any]:
         "finished_at": None,
         "target_date": target_date.isoformat(),
         "success": False,
+        "partial": False,
         "duration_ms": 0,
         "metrics": {
             "github_enabled": False,
@@ -51,6 +71,24 @@ def _default_run_metrics(target_date: date, started_at: str) -> Dict[str, Any]:
             "repositories_with_activity": None,
             "repositories_configured": None,
             "preflight_skipped_fanout": None,
+            "pushed_at_skipped_repos": None,
+            "preflight_active_repos": None,
+            "answered_from_store": None,
+            "collected_via_search": None,
+            "collected_via_events": None,
+            "collected_via_webhooks": None,
+            "webhook_gap_repos": None,
+            "http": None,
+            "http_cache": None,
+            "concurrency": None,
+            "store": None,
+            "branch_heads": None,
+            "git_mirror": None,
+            "repo_registry": None,
+            "deadline": None,
+            "retry_scheduler": None,
+            "plan": None,
+            "preflight_tuner": None,
         },
         "errors": {
             "fatal": None,
@@ -59,6 +97,7 @@ def _default_run_metrics(target_date: date, started_at: str) -> Dict[str, Any]:
             "calendar_update_failed": False,
             "github_collection_failed": False,
             "github_collection_error": None,
+            "deadline_exceeded": False,
         },
     }
 
@@ -76,11 +115,58 @@ def _merge_github_metrics(payload: Dict[str, Any], github_data: Dict) -> None:
         m["repositories_configured"] = github_data.get("repositories_configured")
     if github_data.get("preflight_skipped_fanout") is not None:
         m["preflight_skipped_fanout"] = github_data.get("preflight_skipped_fanout")
+    if github_data.get("preflight_active_repos") is not None:
+        m["preflight_active_repos"] = github_data.get("preflight_active_repos")
+    if github_data.get("pushed_at_skipped_repos") is not None:
+        m["pushed_at_skipped_repos"] = github_data.get("pushed_at_skipped_repos")
+    m["answered_from_store"] = bool(github_data.get("answered_from_store"))
+    m["collected_via_search"] = bool(github_data.get("collected_via_search"))
+    m["collected_via_events"] = bool(github_data.get("collected_via_events"))
+    m["collected_via_webhooks"] = bool(github_data.get("collected_via_webhooks"))
+    if github_data.get("webhook_gap_repos") is not None:
+        m["webhook_gap_repos"] = github_data.get("webhook_gap_repos")
     if github_data.get("collection_error"):
         payload["errors"]["github_collection_failed"] = True
         payload["errors"]["github_collection_error"] = str(github_data["collection_error"])[:500]
 
 
+def _previous_activity_fraction() -> Optional[float]:
+    """Share of configured repos that had activity in the last single-day run (the planner's prior)."""
+    try:
+        with open(LAST_RUN_METRICS_FILE, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return None
+    m = previous.get("metrics") or {}
+    if previous.get("range") or not m.get("repositories_configured") or m.get("repositories_with_activity") is None:
+        return None
+    return m["repositories_with_activity"] / m["repositories_configured"]
+
+
+def _merge_range_batch(per_day: Dict[date, Dict], batch: Dict[date, Dict]) -> None:
+    """Add one planner batch of collect_data_for_range output into the per-day totals."""
+    for day, data in batch.items():
+        acc = per_day.get(day)
+        if acc is None:
+            per_day[day] = dict(data, repository_details=dict(data.get("repository_details") or {}))
+            continue
+        for key in ("commits", "prs", "issues", "pushed_at_skipped_repos"):
+            acc[key] = (acc.get(key) or 0) + (data.get(key) or 0)
+        acc["repository_details"].update(data.get("repository_details") or {})
+
+
+def _no_activity_entry(repositories_configured: int) -> Dict:
+    """Calendar data for a day the range preflight found no activity on (no per-repo calls made)."""
+    return {
+        "commits": 0,
+        "prs": 0,
+        "issues": 0,
+        "repository_details": {},
+        "preflight_skipped_fanout": True,
+        "repositories_configured": repositories_configured,
+    }
+
+
 def write_last_run_metrics(payload: Dict[str, Any]) -> None:
     """Machine-readable snapshot for dashboards, alerts, and jq."""
     try:
@@ -93,7 +179,7 @@ def write_last_run_metrics(payload: Dict[str, Any]) -> None:
 class UnifiedDataCollector:
     """Main orchestrator for unified data collection"""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, deadline_minutes: Optional[float] = None):
         # Setup environment
         setup_env(Path(config_path))
         
@@ -110,6 +196,8 @@ class UnifiedDataCollector:
         self.github_config = self.config.get('github', {})
         self.github_token = os.getenv('GITHUB_API_TOKEN') or os.getenv('GITHUB_TOKEN') or self.github_config.get('api_token', '')
         self.github_username = os.getenv('GITHUB_USERNAME') or self.github_config.get('username', '')
+        # Whole-run budget (--deadline-minutes > GITHUB_RUN_DEADLINE_MINUTES > github.run_deadline_minutes)
+        self.deadline_minutes = resolve_deadline_minutes(deadline_minutes, self.github_config.get('run_deadline_minutes'))
         
         # Obsidian vault path can also come from env
         obsidian_vault_path = os.getenv('OBSIDIAN_VAULT_PATH')
@@ -142,7 +230,10 @@ class UnifiedDataCollector:
                 self.github_collector = GitHubCollector(
                     self.github_token, 
                     self.github_username, 
-                    repo_names
+                    repo_names,
+                    backend=self.github_config.get('backend'),
+                    day_timezone=self.github_config.get('timezone'),
+                    api_base=self.github_config.get('api_base'),
                 )
                 print("✅ GitHub collector initialized")
             
@@ -175,6 +266,15 @@ class UnifiedDataCollector:
                 "issues": result.get("issues", 0),
                 "repository_details": result.get("repository_details", {}),
                 "preflight_skipped_fanout": result.get("preflight_skipped_fanout"),
+                "pushed_at_skipped_repos": result.get("pushed_at_skipped_repos"),
+                "preflight_active_repos": result.get("preflight_active_repos"),
+                "answered_from_store": result.get("answered_from_store", False),
+                "collected_via_search": result.get("collected_via_search", False),
+                "collected_via_events": result.get("collected_via_events", False),
+                "collected_via_webhooks": result.get("collected_via_webhooks", False),
+                "webhook_gap_repos": result.get("webhook_gap_repos"),
+                "preflight_mode": result.get("preflight_mode"),
+                "preflight_verdict": result.get("preflight_verdict"),
                 "repositories_configured": result.get("repositories_configured")
                 if result.get("repositories_configured") is not None
                 else len(self.github_collector.repositories),
@@ -207,12 +307,54 @@ class UnifiedDataCollector:
             github_data
         )
     
+    def plan_collection(
+        self, since_date: date, until_date: Optional[date] = None, repos: Optional[list] = None
+    ) -> Optional[Dict]:
+        """
+        Budget plan for one day (until_date None) or a range over `repos` (default all; budget_planner.py),
+        from the free /rate_limit. For a day, the planner's strategy is applied to the collector.
+        None when GitHub is not set up.
+        """
+        if not self.github_collector:
+            return None
+        rate = fetch_rate_limit(self.github_collector)
+        if until_date is None:
+            plan = plan_day(self.github_collector, since_date, rate, _previous_activity_fraction())
+            if plan["strategy"] != plan["configured"]:
+                self.github_collector.preflight = plan["strategy"]
+        else:
+            plan = plan_range(
+                self.github_collector, since_date, until_date, rate, _previous_activity_fraction(), repos=repos
+            )
+        return plan
+
+    def print_plan(self, since_date: date, until_date: Optional[date] = None) -> bool:
+        """--plan: print the predicted calls per phase and exit; nothing is collected or written."""
+        if not self.initialize_collectors():
+            return False
+        plan = self.plan_collection(since_date, until_date)
+        if plan is None:
+            print("GitHub collection is disabled; nothing to plan.")
+            return True
+        print(format_plan(plan))
+        return True
+
+    def _start_deadline(self) -> None:
+        set_run_deadline(self.deadline_minutes * 60 if self.deadline_minutes else None)
+        if self.deadline_minutes:
+            print(f"⏱️  Run deadline: {self.deadline_minutes:g} minutes")
+
     def run_data_collection(self, target_date: date):
-        """Run complete data collection for target date. Always writes last_run_metrics.json."""
+        """
+        Run complete data collection for target date. Always writes last_run_metrics.json.
+        Past the run deadline, what was collected is written only if the day has no entry yet
+        (never over a complete one); the run is then reported as partial and unsuccessful.
+        """
         t0 = time.perf_counter()
         started_at = datetime.now(timezone.utc).isoformat()
         payload = _default_run_metrics(target_date, started_at)
         success = False
+        self._start_deadline()
         try:
             payload["metrics"]["github_enabled"] = self.config.get("github", {}).get("enabled", False)
             print(f"🚀 Starting unified data collection for {target_date}")
@@ -227,8 +369,24 @@ class UnifiedDataCollector:
 
             github_data: Dict = {}
             try:
+                if payload["metrics"]["github_enabled"] and planner_mode() != "off":
+                    plan = self.plan_collection(target_date)
+                    payload["metrics"]["plan"] = plan_summary(plan)
+                    payload["metrics"]["preflight_tuner"] = plan.get("tuning") if plan else None
+                    if plan and plan["strategy"] != plan["configured"]:
+                        print(f"📋 Planner: {plan['strategy']} instead of {plan['configured']} ({plan['estimated']['core']} core calls)")
+                    if plan and not plan["fits"]:
+                        budget = "graphql" if plan["estimated"]["graphql"] else "core"
+                        wait_for_budget(self.github_collector, budget, plan["estimated"][budget])
                 if payload["metrics"]["github_enabled"]:
+                    spent_before = get_transport().spent()
                     github_data = self.collect_github_data(target_date)
+                    if self.github_collector and not deadline_exceeded():
+                        spent_after = get_transport().spent()
+                        spent = {budget: spent_after[budget] - spent_before.get(budget, 0) for budget in spent_after}
+                        record_day_outcome(
+                            self.github_collector, github_data, spent, _collector_backend(self.github_collector.backend)
+                        )
             except PermissionError as e:
                 print(str(e))
                 print("\n🛑 Process stopped due to GitHub API access issues.")
@@ -239,11 +397,21 @@ class UnifiedDataCollector:
 
             _merge_github_metrics(payload, github_data)
 
+            if deadline_exceeded():
+                payload["partial"] = True
+                payload["errors"]["deadline_exceeded"] = True
+                if github_data.get("collection_error") or self.calendar_updater.entry_exists(target_date):
+                    print("⏱️  Run deadline reached; partial GitHub data not written over the calendar.")
+                    return False
+                print("⏱️  Run deadline reached; writing the partial GitHub data collected so far.")
+
             ok = self.update_calendar_entry(target_date, github_data)
             if not ok:
                 print("❌ Calendar update failed")
                 payload["errors"]["calendar_update_failed"] = True
                 return False
+            if payload["partial"]:
+                return False
 
             success = True
             if github_data:
@@ -262,18 +430,157 @@ class UnifiedDataCollector:
         except Exception as e:
             print(f"❌ Data collection failed: {e}")
             payload["errors"]["fatal"] = str(e)[:2000]
+            if deadline_exceeded():
+                payload["partial"] = True
+                payload["errors"]["deadline_exceeded"] = True
             return False
         finally:
-            payload["success"] = success
-            payload["finished_at"] = datetime.now(timezone.utc).isoformat()
-            payload["duration_ms"] = int((time.perf_counter() - t0) * 1000)
-            write_last_run_metrics(payload)
+            _finish_run_metrics(payload, t0, success)
+
+    def run_range_collection(self, since_date: date, until_date: date):
+        """
+        Backfill [since, until]: one GitHub fetch for the window, then one calendar entry per day.
+        A range preflight (search by date range) first narrows the fetch to the active days' span and
+        repos; days it finds no activity on get a "no activity" entry without per-repo calls.
+        Nothing is written if GitHub access fails. Past the run deadline only days without an entry
+        are written. Always writes last_run_metrics.json.
+        """
+        t0 = time.perf_counter()
+        started_at = datetime.now(timezone.utc).isoformat()
+        payload = _default_run_metrics(since_date, started_at)
+        payload["range"] = {"since": since_date.isoformat(), "until": until_date.isoformat(), "days_written": 0}
+        success = False
+        self._start_deadline()
+        try:
+            payload["metrics"]["github_enabled"] = self.config.get("github", {}).get("enabled", False)
+            print(f"🚀 Starting unified data collection for {since_date} .. {until_date}")
+            print("=" * 60)
+
+            if not self.initialize_collectors():
+                print("❌ Failed to initialize collectors")
+                payload["errors"]["initialization_failed"] = True
+                return False
+
+            payload["metrics"]["github_initialized"] = bool(self.github_collector)
+
+            per_day: Dict[date, Dict] = {}
+            active = None
+            if payload["metrics"]["github_enabled"] and self.github_collector:
+                active = self.github_collector.preflight_range(since_date, until_date)
+                fetch_since, fetch_until, fetch_repos = since_date, until_date, None
+                if active is not None:
+                    active_days, fetch_repos = active
+                    payload["range"]["active_days"] = len(active_days)
+                    print(
+                        f"🔎 Range preflight: {len(active_days)} of {(until_date - since_date).days + 1} days active"
+                    )
+                    if active_days:
+                        fetch_since = date.fromisoformat(min(active_days))
+                        fetch_until = date.fromisoformat(max(active_days))
+                if active is None or active[0]:
+                    plan = (
+                        self.plan_collection(fetch_since, fetch_until, fetch_repos) if planner_mode() != "off" else None
+                    )
+                    payload["metrics"]["plan"] = plan_summary(plan)
+                    batches = plan["repo_batches"] if plan and not plan["fits"] else None
+                    if batches and len(batches) > 1:
+                        print(f"📋 Planner: {len(batches)} repo batches {plan['batches']} over {plan['windows']} rate-limit windows")
+                    print(f"📊 Collecting GitHub data for {fetch_since} .. {fetch_until}...")
+                    for i, batch in enumerate(batches or [fetch_repos]):
+                        try:
+                            if batches:
+                                wait_for_budget(self.github_collector, plan["budget"], plan["batch_costs"][i])
+                        except DeadlineExceeded:
+                            break
+                        _merge_range_batch(
+                            per_day, self.github_collector.collect_data_for_range(fetch_since, fetch_until, batch)
+                        )
+
+            partial = deadline_exceeded()
+            if partial:
+                payload["partial"] = True
+                payload["errors"]["deadline_exceeded"] = True
+                print("⏱️  Run deadline reached; writing partial data only to days without an entry.")
+
+            totals: Dict = {"commits": 0, "prs": 0, "issues": 0, "repository_details": {}}
+            day = since_date
+            while day <= until_date:
+                github_data = per_day.get(day) or (
+                    _no_activity_entry(len(self.github_collector.repositories)) if active is not None else {}
+                )
+                if partial and self.calendar_updater.entry_exists(day):
+                    day += timedelta(days=1)
+                    continue
+                if github_data:
+                    for key in ("commits", "prs", "issues"):
+                        totals[key] += github_data.get(key, 0)
+                    totals["repository_details"].update(github_data.get("repository_details") or {})
+                    totals["repositories_configured"] = github_data.get("repositories_configured")
+                    totals["preflight_skipped_fanout"] = github_data.get("preflight_skipped_fanout")
+                    totals["pushed_at_skipped_repos"] = github_data.get("pushed_at_skipped_repos")
+                if not self.update_calendar_entry(day, github_data):
+                    print(f"❌ Calendar update failed for {day}")
+                    payload["errors"]["calendar_update_failed"] = True
+                    return False
+                payload["range"]["days_written"] += 1
+                day += timedelta(days=1)
+
+            _merge_github_metrics(payload, totals if per_day or active is not None else {})
+            if partial:
+                return False
+            success = True
+            print(
+                f"✅ {payload['range']['days_written']} calendar entries updated: {totals['commits']} commits, "
+                f"{totals['prs']} PRs, {totals['issues']} issues"
+            )
+            return True
+
+        except PermissionError as e:
+            print(str(e))
+            print("\n🛑 Process stopped due to GitHub API access issues.")
+            print("   No calendar files will be written.")
+            payload["errors"]["github_blocked"] = True
+            payload["errors"]["fatal"] = str(e)[:2000]
+            return False
+        except Exception as e:
+            print(f"❌ Data collection failed: {e}")
+            payload["errors"]["fatal"] = str(e)[:2000]
+            if deadline_exceeded():
+                payload["partial"] = True
+                payload["errors"]["deadline_exceeded"] = True
+            return False
+        finally:
+            _finish_run_metrics(payload, t0, success)
+
+
+def _finish_run_metrics(payload: Dict[str, Any], t0: float, success: bool) -> None:
+    payload["success"] = success
+    payload["finished_at"] = datetime.now(timezone.utc).isoformat()
+    payload["duration_ms"] = int((time.perf_counter() - t0) * 1000)
+    payload["metrics"]["http"] = get_transport().stats()
+    cache = get_http_cache()
+    payload["metrics"]["http_cache"] = cache.stats() if cache else None
+    payload["metrics"]["concurrency"] = concurrency_stats() or None
+    store = get_activity_store()
+    payload["metrics"]["store"] = store.stats() if store else None
+    branch_heads = get_branch_head_cache() if _commits_all_branches_enabled() else None
+    payload["metrics"]["branch_heads"] = branch_heads.stats() if branch_heads else None
+    payload["metrics"]["git_mirror"] = git_mirror_stats()
+    registry = get_repo_registry()
+    payload["metrics"]["repo_registry"] = registry.stats() if registry else None
+    payload["metrics"]["deadline"] = deadline_stats()
+    payload["metrics"]["retry_scheduler"] = retry_scheduler_stats()
+    write_last_run_metrics(payload)
 
 
 def main():
     """Main function"""
     import argparse
-    from .collectors.github import fetch_commits_parallel_from_config
+    from .collectors.github import (
+        _load_commits_range_config,
+        fetch_commits_parallel_from_config,
+        stream_commits_range_from_config,
+    )
     
     # Construct default config path relative to script location
     default_config = SCRIPTS_DIR / 'config' / 'unified_data_config.json'
@@ -282,23 +589,82 @@ def main():
     parser.add_argument('--config', default=str(default_config), help='Config file path')
     parser.add_argument('--date', type=str, help='Specific date (YYYY-MM-DD)')
     parser.add_argument('--today', action='store_true', help='Process today (default)')
+    parser.add_argument('--range', nargs=2, metavar=('SINCE', 'UNTIL'), help='Backfill calendar entries for every day between dates (YYYY-MM-DD YYYY-MM-DD), one GitHub fetch for the window')
     parser.add_argument('--commits-range', nargs=2, metavar=('SINCE','UNTIL'), help='Fetch commit titles/descriptions for all repos between dates (YYYY-MM-DD YYYY-MM-DD)')
+    parser.add_argument('--format', choices=('ndjson', 'json'), default='ndjson', help='--commits-range output: one JSON line per commit, streamed (default), or one aggregate JSON document')
+    parser.add_argument('--deadline-minutes', type=float, help='Bound the whole run; past it, outstanding GitHub work is cancelled and the result is flagged partial (overrides github.run_deadline_minutes)')
+    parser.add_argument('--plan', action='store_true', help='Dry run: read the free /rate_limit, print the predicted GitHub API calls per phase and the chosen strategy, then exit')
     
     args = parser.parse_args()
     
-    # If commits-range provided, run parallel fetch and print JSON to stdout
+    # If commits-range provided, run parallel fetch and write commits to stdout
     if args.commits_range:
         since_str, until_str = args.commits_range
         since_dt = datetime.strptime(since_str, '%Y-%m-%d').date()
         until_dt = datetime.strptime(until_str, '%Y-%m-%d').date()
+        if args.plan:
+            token, username, repos, _, api_base = _load_commits_range_config(str(args.config))
+            planner = GitHubCollector(token, username, repos, api_base=api_base)
+            rate = fetch_rate_limit(planner)
+            print(format_plan(plan_range(planner, since_dt, until_dt, rate, commits_only=True)))
+            return
+        use_async = os.getenv("GITHUB_COLLECTOR_BACKEND", "").strip().lower() == "async"
+        configured = load_config(Path(args.config)).get("github", {}).get("run_deadline_minutes")
+        minutes = resolve_deadline_minutes(args.deadline_minutes, configured)
+        set_run_deadline(minutes * 60 if minutes else None)
         try:
-            summary = fetch_commits_parallel_from_config(str(args.config), since_dt, until_dt)
-            print(json.dumps(summary, indent=2))
+            if args.format == 'json':
+                fetch_range = fetch_commits_parallel_from_config
+                if use_async:
+                    from .collectors.async_engine import fetch_commits_parallel_async as fetch_range
+                summary = fetch_range(str(args.config), since_dt, until_dt)
+                print(json.dumps(summary, indent=2))
+            else:
+                stream_range = stream_commits_range_from_config
+                if use_async:
+                    from .collectors.async_engine import stream_commits_range_async as stream_range
+                counts = stream_range(str(args.config), since_dt, until_dt, sys.stdout)
+                print(
+                    f"{counts['commits']} commits from {counts['repositories']} repositories "
+                    f"({counts['errors']} errors)",
+                    file=sys.stderr,
+                )
         except PermissionError as e:
             print(str(e), file=sys.stderr)
             sys.exit(1)
+        except DeadlineExceeded:
+            pass
+        if deadline_exceeded():
+            print("⏱️  Run deadline reached; --commits-range output is incomplete.", file=sys.stderr)
+            sys.exit(1)
         return
-    
+
+    if args.range:
+        since_dt = datetime.strptime(args.range[0], '%Y-%m-%d').date()
+        until_dt = datetime.strptime(args.range[1], '%Y-%m-%d').date()
+        if since_dt > until_dt:
+            print(f"❌ --range: {since_dt} is after {until_dt}", file=sys.stderr)
+            sys.exit(2)
+        try:
+            collector = UnifiedDataCollector(args.config, args.deadline_minutes)
+        except Exception as e:
+            p = _default_run_metrics(since_dt, datetime.now(timezone.utc).isoformat())
+            p["errors"]["fatal"] = f"init_failed: {e}"[:2000]
+            p["finished_at"] = datetime.now(timezone.utc).isoformat()
+            p["success"] = False
+            write_last_run_metrics(p)
+            print(f"❌ Failed to initialize collector: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.plan:
+            sys.exit(0 if collector.print_plan(since_dt, until_dt) else 1)
+        success = collector.run_range_collection(since_dt, until_dt)
+        label = f"{since_dt} .. {until_dt}"
+        print(f"\n{'✅' if success else '❌'} Unified data collection {'completed' if success else 'failed'} for {label}")
+        print(f"📄 Run metrics: {LAST_RUN_METRICS_FILE}")
+        if not success:
+            sys.exit(1)
+        return
+
     # Determine target date
     if args.date:
         target_date = datetime.strptime(args.date, '%Y-%m-%d').date()
@@ -307,7 +673,7 @@ def main():
     
     # Initialize collector (metrics file written inside run_data_collection on success path)
     try:
-        collector = UnifiedDataCollector(args.config)
+        collector = UnifiedDataCollector(args.config, args.deadline_minutes)
     except Exception as e:
         p = _default_run_metrics(target_date, datetime.now(timezone.utc).isoformat())
         p["errors"]["fatal"] = f"init_failed: {e}"[:2000]
@@ -318,6 +684,9 @@ def main():
         print(f"❌ Failed to initialize collector: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if args.plan:
+        sys.exit(0 if collector.print_plan(target_date) else 1)
+
     success = collector.run_data_collection(target_date)
 
     if success:
@@ -17,6 +17,14 @@ class CalendarUpdater:
         self.calendar_path = Path(calendar_path)
         self.formatter = CalendarFormatter()
     
+    def _entry_file(self, target_date: date) -> Path:
+        """Calendar/{year}/{month_name}/{dd-mm-yyyy}.md"""
+        day = target_date.strftime("%d-%m-%Y")
+        return self.calendar_path / str(target_date.year) / target_date.strftime("%B") / f"{day}.md"
+    
+    def entry_exists(self, target_date: date) -> bool:
+        return self._entry_file(target_date).exists()
+    
     def update_calendar_entry(
         self,
         target_date: date,
@@ -24,18 +32,13 @@ class CalendarUpdater:
     ) -> bool:
         """Update calendar entry with all collected data"""
         try:
-            # Create calendar file path
-            year = target_date.year
-            month = target_date.strftime("%B")
-            day = target_date.strftime("%d-%m-%Y")
-            
-            calendar_dir = self.calendar_path / str(year) / month
-            calendar_file = calendar_dir / f"{day}.md"
+            calendar_file = self._entry_file(target_date)
+            calendar_dir = calendar_file.parent
             
             # Ensure directory exists and create file with a basic header if missing
             if not calendar_file.exists():
                 calendar_dir.mkdir(parents=True, exist_ok=True)
-                header = f"# {month} {target_date.strftime('%d')}, {year}\n\n"
+                header = f"# {target_date.strftime('%B %d, %Y')}\n\n"
                 with open(calendar_file, 'w', encoding='utf-8') as f:
                     f.write(header)
                 print(f"🆕 Created calendar file: {calendar_file}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+GitHub webhook receiver - appends push, pull_request and issues deliveries to the local event log
+(collectors/webhook_log.py), so the nightly run can answer from it with GITHUB_WEBHOOKS=on.
+
+Point a repo or organization webhook (content type application/json, secret = GITHUB_WEBHOOK_SECRET or
+github.webhook_secret) at this server through a tunnel, for the push, pull_request and issues events.
+Every delivery must carry a valid X-Hub-Signature-256; others are refused with 401. Run it under launchd
+(bash/setup_automation.sh webhooks-install) or directly:
+  cd Scripts/python && python3 -m data_collectors.webhook_receiver --port 8765
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from .collectors.webhook_log import (
+    EVENTS,
+    HEARTBEAT_SECONDS,
+    WebhookLog,
+    slim_record,
+    verify_signature,
+    webhook_log_path,
+)
+from .utils.config import load_config, setup_env
+
+# Scripts/python/data_collectors/webhook_receiver.py -> parents[2] == Scripts/
+SCRIPTS_DIR = Path(__file__).resolve().parents[2]
+# GitHub caps payloads at 25 MB.
+MAX_BODY_BYTES = 25 * 1024 * 1024
+
+
+def make_handler(log: WebhookLog, secret: str):
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, message: str = "") -> None:
+            body = message.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") == "/healthz":
+                self._reply(200, "ok\n")
+            else:
+                self._reply(404)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0 or length > MAX_BODY_BYTES:
+                self._reply(413 if length else 400, "bad body length\n")
+                return
+            body = self.rfile.read(length)
+            if not verify_signature(secret, body, self.headers.get("X-Hub-Signature-256")):
+                logging.warning("Webhook: refused delivery %s (bad signature).", self.headers.get("X-GitHub-Delivery"))
+                self._reply(401, "bad signature\n")
+                return
+            event = self.headers.get("X-GitHub-Event") or ""
+            delivery = self.headers.get("X-GitHub-Delivery") or ""
+            if event not in EVENTS + ("ping",):
+                self._reply(204)
+                return
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                self._reply(400, "body is not JSON\n")
+                return
+            record = slim_record(event, delivery, payload)
+            if record is not None:
+                log.append(record)
+            self._reply(202, "logged\n")
+
+        def log_message(self, fmt: str, *args) -> None:
+            logging.debug("Webhook %s " + fmt, self.address_string(), *args)
+
+    return WebhookHandler
+
+
+def _heartbeat(log: WebhookLog, stop: threading.Event) -> None:
+    while not stop.wait(HEARTBEAT_SECONDS):
+        try:
+            log.mark("heartbeat")
+        except OSError as e:
+            logging.warning("Webhook log heartbeat failed: %s", e)
+
+
+def serve(host: str, port: int, secret: str, log: WebhookLog, keep_days: Optional[int] = None) -> None:
+    """Run until SIGTERM/SIGINT; start, heartbeat and stop records bracket the uptime in the log."""
+    if keep_days:
+        dropped = log.compact(keep_days)
+        if dropped:
+            logging.info("Webhook log: dropped %s records older than %s days.", dropped, keep_days)
+    server = ThreadingHTTPServer((host, port), make_handler(log, secret))
+    stop = threading.Event()
+    log.mark("start")
+    beat = threading.Thread(target=_heartbeat, args=(log, stop), daemon=True)
+    beat.start()
+
+    def shutdown(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    logging.info("Webhook receiver on http://%s:%s, logging to %s", host, port, log.path)
+    try:
+        server.serve_forever()
+    finally:
+        stop.set()
+        server.server_close()
+        log.mark("stop")
+
+
+def main() -> int:
+    default_config = SCRIPTS_DIR / "config" / "unified_data_config.json"
+    parser = argparse.ArgumentParser(description="GitHub webhook receiver for the unified data collector")
+    parser.add_argument("--config", default=str(default_config), help="Config file path (github.webhook_secret)")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (the tunnel forwards here)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--keep-days", type=int, default=120, help="Drop log records older than this at start (0 keeps all)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    setup_env(Path(args.config))
+    secret = os.getenv("GITHUB_WEBHOOK_SECRET") or load_config(Path(args.config)).get("github", {}).get("webhook_secret")
+    if not secret:
+        print("❌ No webhook secret: set GITHUB_WEBHOOK_SECRET or github.webhook_secret", file=sys.stderr)
+        return 1
+    serve(args.host, args.port, secret, WebhookLog(webhook_log_path()), args.keep_days or None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Shared fixtures: tests run the collector against tools/github_standin.py, with every on-disk cache
+(HTTP cache, activity store, registry, tuner) off or in a temporary directory.
+
+  cd Scripts/python && python3 -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# tests/ -> parents[1] == Scripts/
+_SCRIPTS = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_SCRIPTS / "python"))
+sys.path.insert(0, str(_SCRIPTS / "tools"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(monkeypatch, tmp_path):
+    for name, value in (
+        ("GITHUB_HTTP_CACHE", "off"),
+        ("GITHUB_STORE", "off"),
+        ("GITHUB_WEBHOOKS", "off"),
+        ("GITHUB_PREFLIGHT", "off"),
+        ("GITHUB_PREFLIGHT_TUNER_FILE", str(tmp_path / "preflight_tuner.json")),
+        ("GITHUB_REPO_REGISTRY_FILE", str(tmp_path / "repo_registry.json")),
+        ("GITHUB_BRANCH_HEAD_CACHE", "off"),
+    ):
+        monkeypatch.setenv(name, value)
+    from data_collectors.collectors import preflight_tuner, repo_registry
+
+    monkeypatch.setattr(preflight_tuner, "_tuner", None)
+    monkeypatch.setattr(repo_registry, "_registry", None)
+    yield
+
+
+@pytest.fixture
+def standin():
+    """Start a stand-in API for a dataset: standin(dataset, **StandInServer kwargs) -> server."""
+    from github_standin import StandInServer
+
+    servers = []
+
+    def start(dataset, **kwargs):
+        server = StandInServer(dataset, **kwargs)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
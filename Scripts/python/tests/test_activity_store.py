@@ -0,0 +1,81 @@
+"""Activity store: stored dates cost no requests once settled; a failed head compare keeps the history."""
+
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from data_collectors.collectors import deadline, store as store_module
+from data_collectors.collectors.deadline import DeadlineExceeded
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+TODAY = date.today()
+REPOS = ["bench/repo-0", "bench/repo-1"]
+
+
+def _synced(monkeypatch, standin, tmp_path):
+    monkeypatch.setenv("GITHUB_STORE", "on")
+    monkeypatch.setenv("GITHUB_STORE_PATH", str(tmp_path / "activity.sqlite3"))
+    monkeypatch.setattr(store_module, "_store", None)
+    server = standin(synthetic_dataset(len(REPOS), TODAY, commits_per_day=2, days=10))
+    collector = GitHubCollector("test-token", "bench", REPOS, api_base=server.api_base)
+    collector.collect_data_for_range(TODAY - timedelta(days=9), TODAY)
+    server.reset_stats()
+    return server, collector, store_module.get_activity_store()
+
+
+def _fresh(collector):
+    """Same config, new run: no per-run head memo."""
+    return GitHubCollector("test-token", "bench", REPOS, api_base=collector.api_base)
+
+
+def test_settled_day_is_answered_without_requests(monkeypatch, standin, tmp_path):
+    server, collector, _ = _synced(monkeypatch, standin, tmp_path)
+    data = _fresh(collector).collect_data_for_date(TODAY - timedelta(days=8))
+    assert data["answered_from_store"]
+    assert data["commits"] == 4
+    assert server.stats()["requests"] == 0
+
+
+def test_recent_day_still_gets_a_head_check(monkeypatch, standin, tmp_path):
+    server, collector, _ = _synced(monkeypatch, standin, tmp_path)
+    data = _fresh(collector).collect_data_for_date(TODAY - timedelta(days=1))
+    assert data["answered_from_store"]
+    assert server.stats()["requests"] > 0
+
+
+def test_failed_compare_keeps_the_store(monkeypatch, standin, tmp_path):
+    server, collector, store = _synced(monkeypatch, standin, tmp_path)
+    branch = server.repos["bench/repo-0"]["branches"]["main"]
+    late = dict(branch[0], sha="f" * 40)
+    branch.insert(0, late)
+    collector = _fresh(collector)
+    monkeypatch.setattr(collector, "_compare_commits", lambda *args: None)
+
+    window = collector._day_window((TODAY - timedelta(days=1)).isoformat())
+    assert not collector._verify_store_heads(store, "bench/repo-0", window)
+    assert store.covers("bench/repo-0", window)
+    assert store.watermarks("bench/repo-0")[""]["head_sha"] != late["sha"]
+
+
+def test_rewritten_history_drops_the_coverage(monkeypatch, standin, tmp_path):
+    server, collector, store = _synced(monkeypatch, standin, tmp_path)
+    branch = server.repos["bench/repo-0"]["branches"]["main"]
+    branch[0] = dict(branch[0], sha="e" * 40)  # force-pushed tip: the stored head is gone
+
+    window = collector._day_window((TODAY - timedelta(days=1)).isoformat())
+    assert _fresh(collector)._verify_store_heads(store, "bench/repo-0", window)
+    assert store.coverage("bench/repo-0") is None
+
+
+def test_head_checks_stop_at_the_deadline(monkeypatch, standin, tmp_path):
+    server, collector, store = _synced(monkeypatch, standin, tmp_path)
+    deadline.set_run_deadline(0.001)
+    time.sleep(0.01)
+    try:
+        with pytest.raises(DeadlineExceeded):
+            _fresh(collector)._store_covers_day(store, REPOS, (TODAY - timedelta(days=1)).isoformat())
+    finally:
+        deadline.set_run_deadline(None)
+    assert server.stats()["requests"] == 0
@@ -0,0 +1,35 @@
+"""Budget planner: which strategies a day's plan may switch to."""
+
+from datetime import date
+
+from data_collectors.collectors.budget_planner import plan_day
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+REPOS = [f"bench/repo-{i}" for i in range(40)]
+
+
+def _plan(monkeypatch, standin, plan_mode=None):
+    monkeypatch.setenv("GITHUB_PREFLIGHT", "repos")
+    monkeypatch.setenv("GITHUB_PREFLIGHT_TUNER", "off")
+    if plan_mode:
+        monkeypatch.setenv("GITHUB_PLAN", plan_mode)
+    server = standin(synthetic_dataset(len(REPOS), date.today()))
+    collector = GitHubCollector("test-token", "bench", REPOS, api_base=server.api_base)
+    return plan_day(collector, date.today(), rate=None)
+
+
+def test_default_keeps_to_equivalent_strategies(monkeypatch, standin):
+    plan = _plan(monkeypatch, standin)
+    # search and events are cheaper on paper, but can miss activity.
+    assert {"search", "events"} <= set(plan["candidates"])
+    assert plan["strategy"] in ("repos", "off")
+
+
+def test_auto_may_switch_to_any_strategy(monkeypatch, standin):
+    plan = _plan(monkeypatch, standin, "auto")
+    assert plan["strategy"] in ("search", "events")
+
+
+def test_check_keeps_the_configured_strategy(monkeypatch, standin):
+    assert _plan(monkeypatch, standin, "check")["strategy"] == "repos"
@@ -0,0 +1,48 @@
+"""--commits-range: every page is followed through the Link header and streamed as NDJSON."""
+
+import io
+import json
+from datetime import date, timedelta
+
+from data_collectors.collectors.github import fetch_commits_parallel_from_config, stream_commits_range_from_config
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 4)
+REPOS = ["bench/repo-0", "bench/repo-1"]
+
+
+def _config(tmp_path, server):
+    path = tmp_path / "config.json"
+    github = {"api_token": "test-token", "username": "bench", "repositories": REPOS, "api_base": server.api_base}
+    path.write_text(json.dumps({"github": github}))
+    return str(path)
+
+
+def test_stream_follows_every_page(standin, tmp_path):
+    # 2 repos x 50 commits x 5 days: 250 commits per repo, three pages of 100.
+    server = standin(synthetic_dataset(len(REPOS), DAY, commits_per_day=50, days=5))
+    out = io.StringIO()
+    counts = stream_commits_range_from_config(_config(tmp_path, server), DAY - timedelta(days=4), DAY, out)
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert counts == {"repositories": 2, "commits": 500, "errors": 0}
+    assert len(lines) == 500
+    assert len({line["sha"] for line in lines}) == 500
+    assert {line["repository"] for line in lines} == set(REPOS)
+    assert server.stats()["by_endpoint"]["repo_commits"] == 6
+
+
+def test_window_bounds_the_pages(standin, tmp_path):
+    server = standin(synthetic_dataset(len(REPOS), DAY, commits_per_day=50, days=5))
+    out = io.StringIO()
+    counts = stream_commits_range_from_config(_config(tmp_path, server), DAY, DAY, out)
+    assert counts["commits"] == 100
+    assert server.stats()["by_endpoint"]["repo_commits"] == 2
+
+
+def test_json_summary_matches_the_stream(standin, tmp_path):
+    server = standin(synthetic_dataset(len(REPOS), DAY, commits_per_day=50, days=5))
+    summary = fetch_commits_parallel_from_config(_config(tmp_path, server), DAY - timedelta(days=4), DAY)
+    assert summary["total_commits"] == 500
+    assert summary["errors"] == {}
+    assert {repo: len(commits) for repo, commits in summary["repositories"].items()} == {r: 250 for r in REPOS}
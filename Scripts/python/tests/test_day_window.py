@@ -0,0 +1,41 @@
+"""Day windows: a calendar day is local midnight to midnight, and fetches are bounded to it."""
+
+from datetime import date, timedelta, timezone
+
+from data_collectors.collectors.day_window import day_window, local_day, resolve_day_timezone, span_window
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 4)
+
+
+def test_window_bounds_in_utc_and_local_zones(monkeypatch):
+    assert day_window(DAY, timezone.utc) == ("2026-04-04T00:00:00Z", "2026-04-04T23:59:59Z")
+    kolkata = resolve_day_timezone("Asia/Kolkata")
+    assert day_window(DAY, kolkata) == ("2026-04-03T18:30:00Z", "2026-04-04T18:29:59Z")
+    assert span_window(DAY, DAY + timedelta(days=2), kolkata) == ("2026-04-03T18:30:00Z", "2026-04-06T18:29:59Z")
+    assert local_day("2026-04-04T19:00:00Z", kolkata) == "2026-04-05"
+    monkeypatch.setenv("GITHUB_DAY_TIMEZONE", "utc")
+    assert resolve_day_timezone("Asia/Kolkata") is timezone.utc
+
+
+def _collector(standin, tz):
+    # Commits at 10:00, 13:00, 16:00 and 19:00 UTC on each of two days.
+    server = standin(synthetic_dataset(1, DAY, commits_per_day=4, days=2))
+    return GitHubCollector("test-token", "bench", ["bench/repo-0"], api_base=server.api_base, day_timezone=tz)
+
+
+def test_day_fetch_counts_only_the_local_day(standin):
+    utc = _collector(standin, "UTC")._fetch_repo_data("bench/repo-0", DAY.isoformat())
+    assert utc["commits"] == 4
+    # In Kolkata (UTC+5:30) DAY's 19:00 UTC commit falls on the next day; the day before's takes its place.
+    kolkata = _collector(standin, "Asia/Kolkata")._fetch_repo_data("bench/repo-0", DAY.isoformat())
+    assert kolkata["commits"] == 4
+    assert sorted(c["timestamp"] for c in kolkata["commit_details"])[0] == f"{DAY - timedelta(days=1)}T19:00:00Z"
+    assert kolkata["prs"] == 1
+
+
+def test_range_buckets_by_local_day(standin):
+    collector = _collector(standin, "Asia/Kolkata")
+    days = collector.collect_data_for_range(DAY - timedelta(days=1), DAY + timedelta(days=1))
+    assert [days[DAY + timedelta(days=d)]["commits"] for d in (-1, 0, 1)] == [3, 4, 1]
@@ -0,0 +1,105 @@
+"""Run deadline: an expired deadline skips repos instead of reporting them as idle."""
+
+import io
+import json
+import os
+import time
+from datetime import date
+
+import pytest
+
+from data_collectors.collectors import deadline, git_mirror
+from data_collectors.collectors.deadline import DeadlineExceeded
+from data_collectors.collectors.github import (
+    GitHubCollector,
+    fetch_commits_parallel_from_config,
+    stream_commits_range_from_config,
+)
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 4)
+
+
+@pytest.fixture
+def expired_deadline():
+    deadline.set_run_deadline(0.001)
+    time.sleep(0.01)
+    yield
+    deadline.set_run_deadline(None)
+
+
+def _collector(server):
+    return GitHubCollector("test-token", "bench", ["bench/repo-0", "bench/repo-1"], api_base=server.api_base)
+
+
+def test_fetch_repo_data_raises_past_the_deadline(standin, expired_deadline):
+    server = standin(synthetic_dataset(2, DAY, commits_per_day=3))
+    with pytest.raises(DeadlineExceeded):
+        _collector(server)._fetch_repo_data("bench/repo-0", DAY.isoformat())
+
+
+def test_fanout_skips_repos_cut_short_by_the_deadline(standin, expired_deadline):
+    server = standin(synthetic_dataset(2, DAY, commits_per_day=3))
+    results, error_repos = _collector(server)._fanout_threads(["bench/repo-0", "bench/repo-1"], DAY.isoformat(), "rest")
+    # No zero-count entries that would be written as "no activity".
+    assert results == []
+    assert error_repos == []
+    assert deadline.deadline_exceeded()
+
+
+def test_fanout_collects_before_the_deadline(standin):
+    server = standin(synthetic_dataset(2, DAY, commits_per_day=3))
+    deadline.set_run_deadline(60)
+    try:
+        results, _ = _collector(server)._fanout_threads(["bench/repo-0", "bench/repo-1"], DAY.isoformat(), "rest")
+    finally:
+        deadline.set_run_deadline(None)
+    assert sorted(r["commits"] for r in results) == [3, 3]
+
+
+def test_commits_range_stream_stops_at_the_deadline(standin, expired_deadline, tmp_path):
+    server = standin(synthetic_dataset(2, DAY, commits_per_day=3))
+    config = tmp_path / "config.json"
+    github = {"api_token": "test-token", "username": "bench", "repositories": ["bench/repo-0", "bench/repo-1"]}
+    config.write_text(json.dumps({"github": dict(github, api_base=server.api_base)}))
+    out = io.StringIO()
+    counts = stream_commits_range_from_config(str(config), DAY, DAY, out)
+    # No per-repo error lines standing in for the repos the deadline stopped.
+    assert out.getvalue() == ""
+    assert counts["errors"] == 0
+    assert server.stats()["requests"] == 0
+
+
+def test_commits_range_summary_matches_across_engines_at_the_deadline(standin, expired_deadline, tmp_path):
+    pytest.importorskip("httpx")
+    from data_collectors.collectors.async_engine import fetch_commits_parallel_async
+
+    server = standin(synthetic_dataset(2, DAY, commits_per_day=3))
+    config = tmp_path / "config.json"
+    github = {"api_token": "test-token", "username": "bench", "repositories": ["bench/repo-0", "bench/repo-1"]}
+    config.write_text(json.dumps({"github": dict(github, api_base=server.api_base)}))
+    threaded = fetch_commits_parallel_from_config(str(config), DAY, DAY)
+    assert fetch_commits_parallel_async(str(config), DAY, DAY) == threaded
+    assert "not fetched" in json.dumps(threaded)
+
+
+def test_git_mirrors_stop_at_the_deadline(monkeypatch, tmp_path):
+    # A git that hangs: only the deadline can end the sync.
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "git").write_text("#!/bin/sh\nsleep 30\n")
+    (bin_dir / "git").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("GITHUB_GIT_MIRROR_DIR", str(tmp_path / "mirrors"))
+    monkeypatch.setenv("GITHUB_GIT_MIRROR_WORKERS", "1")
+    repos = ["bench/repo-0", "bench/repo-1", "bench/repo-2"]
+    cut_before = (git_mirror.git_mirror_stats() or {}).get("deadline", 0)
+    deadline.set_run_deadline(1)
+    try:
+        t0 = time.monotonic()
+        out = git_mirror.mirror_commits(repos, "test-token", ("2026-04-04T00:00:00Z", "2026-04-04T23:59:59Z"), False)
+        assert time.monotonic() - t0 < 10
+    finally:
+        deadline.set_run_deadline(None)
+    assert out == {repo: None for repo in repos}
+    assert git_mirror.git_mirror_stats()["deadline"] - cut_before == len(repos)
@@ -0,0 +1,53 @@
+"""Conditional-request cache: a 304 is replayed as the cached 200 and costs no rate limit."""
+
+from datetime import date
+
+import pytest
+import requests
+
+from data_collectors.collectors import http_cache
+from data_collectors.collectors.github import _github_get_with_retry
+from github_standin import synthetic_dataset
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("GITHUB_HTTP_CACHE", "on")
+    monkeypatch.setenv("GITHUB_HTTP_CACHE_DIR", str(tmp_path / "http_cache"))
+    monkeypatch.setattr(http_cache, "_cache", None)
+    return http_cache.get_http_cache()
+
+
+def test_not_modified_is_replayed_from_the_cache(standin, cache):
+    server = standin(synthetic_dataset(1, date(2026, 4, 4), commits_per_day=3))
+    url = f"{server.api_base}/repos/bench/repo-0/commits"
+    first = _github_get_with_retry(url, {}, params={"per_page": 100})
+    second = _github_get_with_retry(url, {}, params={"per_page": 100})
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert server.stats()["not_modified"] == 1
+    # The 304 was free, and its fresh rate-limit headers replace the stored ones.
+    assert second.headers["x-ratelimit-remaining"] == first.headers["x-ratelimit-remaining"]
+    assert cache.stats()["not_modified"] == 1
+
+
+def test_changed_resource_is_fetched_again(standin, cache):
+    server = standin(synthetic_dataset(1, date(2026, 4, 4), commits_per_day=3))
+    url = f"{server.api_base}/repos/bench/repo-0/commits"
+    _github_get_with_retry(url, {})
+    server.repos["bench/repo-0"]["branches"]["main"].pop()
+    again = _github_get_with_retry(url, {})
+    assert len(again.json()) == 2
+    assert server.stats()["not_modified"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(standin, tmp_path):
+    server = standin(synthetic_dataset(3, date(2026, 4, 4)))
+    small = http_cache.ConditionalRequestCache(tmp_path / "small", max_bytes=1)
+    for i in range(3):
+        url = f"{server.api_base}/repos/bench/repo-{i}"
+        small.store(small.key(url, None, {}), requests.get(url))
+    assert small.stats()["entries"] == 1
+    assert small.stats()["evictions"] == 2
+    assert small.lookup(small.key(f"{server.api_base}/repos/bench/repo-2", None, {})) is not None
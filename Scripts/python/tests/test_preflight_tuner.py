@@ -0,0 +1,69 @@
+"""Preflight tuner: strategies are ranked by measured cost, but only among accurate ones."""
+
+from datetime import date
+
+from data_collectors.collectors import preflight_tuner
+from data_collectors.collectors.budget_planner import plan_day
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+REPOS = [f"bench/repo-{i}" for i in range(20)]
+
+
+def _collector(monkeypatch, standin):
+    monkeypatch.setenv("GITHUB_PREFLIGHT", "repos")
+    monkeypatch.setenv("GITHUB_PREFLIGHT_TUNER", "on")
+    server = standin(synthetic_dataset(len(REPOS), date.today()))
+    return GitHubCollector("test-token", "bench", REPOS, api_base=server.api_base)
+
+
+def _seed(collector, repos_found_activity: bool):
+    """Three runs each: "repos" cheap, "off" (full scan) dear."""
+    tuner = preflight_tuner.get_preflight_tuner()
+    account = preflight_tuner.tuner_account(collector)
+    for _ in range(3):
+        tuner.record_run(account, "repos", {"core": 2, "search": 2}, len(REPOS), "active", repos_found_activity)
+        tuner.record_run(account, "off", {"core": 60}, len(REPOS), None, True)
+
+
+def test_cheaper_but_inaccurate_strategy_loses(monkeypatch, standin):
+    collector = _collector(monkeypatch, standin)
+    _seed(collector, repos_found_activity=False)
+    plan = plan_day(collector, date.today(), rate=None)
+    assert plan["tuning"]["inaccurate"] == {"repos": "precision 0.0"}
+    assert "repos" not in plan["candidates"]
+    assert plan["strategy"] == "off"
+
+
+def test_cheaper_accurate_strategy_wins(monkeypatch, standin):
+    collector = _collector(monkeypatch, standin)
+    _seed(collector, repos_found_activity=True)
+    plan = plan_day(collector, date.today(), rate=None)
+    assert plan["tuning"]["inaccurate"] == {}
+    assert plan["strategy"] == "repos"
+    assert plan["tuning"]["basis"] == "measured"
+
+
+def test_frequent_fallbacks_rule_a_strategy_out(monkeypatch, standin):
+    collector = _collector(monkeypatch, standin)
+    tuner = preflight_tuner.get_preflight_tuner()
+    account = preflight_tuner.tuner_account(collector)
+    for verdict in ("fallback", "fallback", "idle"):
+        tuner.record_run(account, "repos", {"core": 1, "search": 2}, len(REPOS), verdict, False)
+    plan = plan_day(collector, date.today(), rate=None)
+    assert plan["tuning"]["inaccurate"] == {"repos": "fallback rate 0.667"}
+    assert plan["strategy"] == "off"
+
+
+def test_costs_are_kept_per_backend(monkeypatch, standin):
+    collector = _collector(monkeypatch, standin)
+    tuner = preflight_tuner.get_preflight_tuner()
+    account = preflight_tuner.tuner_account(collector)
+    for _ in range(3):
+        tuner.record_run(account, "repos", {"core": 2, "search": 2}, len(REPOS), "active", True)
+        # Under the git backend commits come from local mirrors: the full scan looks nearly free.
+        tuner.record_run(account, "off", {"core": 2}, len(REPOS), None, True, backend="git")
+    plan = plan_day(collector, date.today(), rate=None)
+    assert "off" not in plan["tuning"]["measured"]
+    assert plan["strategy"] == "repos"
+    assert tuner.measured_cost(account, "off", len(REPOS), backend="git") == {"core": 2, "search": 0, "graphql": 0}
@@ -0,0 +1,39 @@
+"""pushed_at pruning: repos not pushed to skip their commit fetches, but their PRs and issues still count."""
+
+from datetime import date, timedelta
+
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 4)
+
+
+def _collector(standin):
+    dataset = synthetic_dataset(2, DAY, pr_every=0)
+    quiet = dataset["repos"]["bench/repo-1"]
+    # Last push a week earlier; an issue and a fork PR opened on DAY do not move pushed_at.
+    quiet["pushed_at"] = f"{DAY - timedelta(days=7)}T12:00:00Z"
+    quiet["branches"]["main"] = []
+    created = f"{DAY}T09:00:00Z"
+    quiet["pulls"] = [{"number": 3, "created_at": created, "updated_at": created}]
+    quiet["issues"] = [
+        {"number": 4, "created_at": created, "updated_at": created},
+        {"number": 3, "created_at": created, "updated_at": created, "pull_request": {}},
+    ]
+    server = standin(dataset)
+    return server, GitHubCollector("test-token", "bench", ["bench/repo-0", "bench/repo-1"], api_base=server.api_base)
+
+
+def test_idle_repo_keeps_its_prs_and_issues(standin):
+    server, collector = _collector(standin)
+    data = collector.collect_data_for_date(DAY)
+    assert data["pushed_at_skipped_repos"] == 1
+    assert (data["commits"], data["prs"], data["issues"]) == (1, 1, 1)
+    # No commit listing for the repo nobody pushed to.
+    assert server.stats()["by_endpoint"]["repo_commits"] == 1
+
+
+def test_range_keeps_prs_and_issues_of_idle_repos(standin):
+    _, collector = _collector(standin)
+    day = collector.collect_data_for_range(DAY - timedelta(days=1), DAY)[DAY]
+    assert (day["commits"], day["prs"], day["issues"]) == (1, 1, 1)
@@ -0,0 +1,52 @@
+"""Range preflight: search hits bucketed into active days, busy spans split until every day is settled."""
+
+from datetime import date, timedelta
+
+from data_collectors.collectors.github import GitHubCollector
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 10)
+SINCE = DAY - timedelta(days=9)
+
+
+def _collector(monkeypatch, standin, dataset, repos):
+    monkeypatch.setenv("GITHUB_PREFLIGHT", "repos")
+    server = standin(dataset)
+    return server, GitHubCollector("test-token", "bench", repos, api_base=server.api_base)
+
+
+def _search_queries(server):
+    return server.stats()["by_endpoint"].get("search", 0)
+
+
+def test_quiet_range_costs_one_query_per_kind(monkeypatch, standin):
+    dataset = synthetic_dataset(4, DAY, days=3, pr_every=0)
+    server, collector = _collector(monkeypatch, standin, dataset, sorted(dataset["repos"]))
+    days, repos = collector.preflight_range(SINCE, DAY)
+    assert days == {(DAY - timedelta(days=d)).isoformat() for d in range(3)}
+    assert len(repos) == 4
+    assert _search_queries(server) == 2
+
+
+def test_busy_span_is_split_by_date(monkeypatch, standin):
+    # 2 repos x 40 commits x 3 days: more hits than one page, so the span is halved until each part fits.
+    dataset = synthetic_dataset(2, DAY, commits_per_day=40, days=3, pr_every=0)
+    server, collector = _collector(monkeypatch, standin, dataset, sorted(dataset["repos"]))
+    days, repos = collector.preflight_range(SINCE, DAY)
+    assert days == {(DAY - timedelta(days=d)).isoformat() for d in range(3)}
+    assert len(repos) == 2
+    assert _search_queries(server) > 2
+
+
+def test_one_busy_day_is_active_but_not_covered(monkeypatch, standin):
+    dataset = synthetic_dataset(1, DAY, commits_per_day=150, pr_every=0)
+    _, collector = _collector(monkeypatch, standin, dataset, sorted(dataset["repos"]))
+    assert collector.preflight_range(SINCE, DAY) == ({DAY.isoformat()}, None)
+
+
+def test_all_branches_mode_skips_the_range_preflight(monkeypatch, standin):
+    monkeypatch.setenv("GITHUB_COMMITS_ALL_BRANCHES", "1")
+    dataset = synthetic_dataset(2, DAY, pr_every=0)
+    server, collector = _collector(monkeypatch, standin, dataset, sorted(dataset["repos"]))
+    assert collector.preflight_range(SINCE, DAY) is None
+    assert _search_queries(server) == 0
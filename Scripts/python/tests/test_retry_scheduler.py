@@ -0,0 +1,35 @@
+"""Retry parking: a parked task is re-dispatched and replays what it already received."""
+
+from datetime import date
+
+from data_collectors.collectors.github import _github_get_with_retry
+from data_collectors.collectors.retry_scheduler import retry_scheduler_stats, run_parkable
+from github_standin import synthetic_dataset
+
+
+def test_parked_task_resends_only_the_failed_request(standin):
+    server = standin(synthetic_dataset(1, date(2026, 4, 4)), retry_after=1)
+    repo_url = f"{server.api_base}/repos/bench/repo-0"
+    dispatches = []
+
+    def task():
+        dispatches.append(1)
+        if len(dispatches) > 1:
+            server.faults = {}
+        repo = _github_get_with_retry(repo_url, {})
+        if len(dispatches) == 1:
+            server.faults = {429: 1.0}  # the second request is throttled on the first dispatch only
+        commits = _github_get_with_retry(f"{repo_url}/commits", {})
+        return repo.status_code, commits.status_code
+
+    before = retry_scheduler_stats() or {"parked": 0, "replayed_responses": 0}
+    outcomes = list(run_parkable({"repo-0": task}, 1))
+    after = retry_scheduler_stats()
+
+    assert outcomes == [("repo-0", (200, 200), None)]
+    assert len(dispatches) == 2
+    assert after["parked"] - before["parked"] == 1
+    assert after["replayed_responses"] - before["replayed_responses"] == 1
+    by_endpoint = server.stats()["by_endpoint"]
+    assert by_endpoint["repo"] == 1
+    assert by_endpoint["repo_commits"] == 2  # the 429, then the retry
@@ -0,0 +1,45 @@
+"""Search query builder: repo terms bin-packed under the q length limit, fully configured owners folded."""
+
+from datetime import date
+
+from data_collectors.collectors.github import GitHubCollector, _pack_search_terms
+from github_standin import synthetic_dataset
+
+DAY = date(2026, 4, 4)
+
+
+def test_packing_keeps_every_term_and_fits_capacity():
+    terms = [f"repo:owner-{i % 7}/{'x' * (i % 23)}-{i}" for i in range(200)]
+    capacity = 200
+    groups = _pack_search_terms(terms, capacity)
+    assert sorted(t for g in groups for t in g) == sorted(terms)
+    assert all(len(" OR ".join(g)) <= capacity for g in groups)
+    # Within one bin of the lower bound (total length over capacity).
+    lower = -(-sum(len(t) + len(" OR ") for t in terms) // (capacity + len(" OR ")))
+    assert len(groups) <= lower + 1
+
+
+def test_a_term_longer_than_capacity_cannot_be_packed():
+    assert _pack_search_terms(["repo:a/" + "b" * 50], 40) is None
+
+
+def test_queries_stay_under_the_limit(monkeypatch):
+    monkeypatch.setenv("GITHUB_REPO_REGISTRY", "off")
+    repos = [f"someone-{i % 5}/project-{i}" for i in range(120)]
+    collector = GitHubCollector("test-token", "someone-0", repos, api_base="http://127.0.0.1:9")
+    prefix = "committer-date:2026-04-04"
+    queries = collector._chunk_repo_search_queries(prefix)
+    assert all(len(q) <= 240 and q.startswith(prefix) for q in queries)
+    named = {t.split(":", 1)[1] for q in queries for t in q[len(prefix) :].strip(" ()").split(" OR ")}
+    assert named == set(repos)
+
+
+def test_fully_configured_owner_is_one_term(monkeypatch, standin):
+    monkeypatch.setenv("GITHUB_PREFLIGHT", "repos")
+    monkeypatch.setenv("GITHUB_OWNER_QUALIFIER_MIN_REPOS", "1")
+    dataset = synthetic_dataset(30, DAY)
+    server = standin(dataset)
+    collector = GitHubCollector("test-token", "bench", sorted(dataset["repos"]), api_base=server.api_base)
+    assert collector._chunk_repo_search_queries("committer-date:2026-04-04") == ["committer-date:2026-04-04 user:bench"]
+    # The folded query still finds exactly the configured repos' activity.
+    assert collector._run_preflight(DAY.isoformat()) == (False, {r.lower() for r in dataset["repos"]})
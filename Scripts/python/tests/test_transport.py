@@ -0,0 +1,54 @@
+"""Shared transport: growing the pool leaves requests in flight on the old session alone; async requests are charged too."""
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from data_collectors.collectors import transport as transport_module
+from data_collectors.collectors.github import GitHubCollector
+from data_collectors.collectors.transport import GitHubTransport, get_transport
+from github_standin import synthetic_dataset
+
+
+def test_growing_the_pool_mid_flight(standin):
+    server = standin(synthetic_dataset(1, date(2026, 4, 4)), latency_ms=200)
+    transport = GitHubTransport(pool_size=2)
+    old_session = transport.session
+    statuses = []
+    url = f"{server.api_base}/repos/bench/repo-0"
+    worker = threading.Thread(target=lambda: statuses.append(transport.get(url).status_code))
+    worker.start()
+    pools = old_session.get_adapter(url).poolmanager.pools
+    for _ in range(100):  # until the request holds a connection from the old pool
+        if len(pools):
+            break
+        time.sleep(0.01)
+    transport.ensure_pool_size(16)
+    worker.join()
+    try:
+        assert statuses == [200]
+        assert transport.session is not old_session
+        # The old session still holds its pool: not closed under the request.
+        assert len(pools)
+        assert transport.get(url).status_code == 200
+        stats = transport.stats()
+        assert stats["pool_size"] == 16
+        assert stats["new_connections"] == 2
+    finally:
+        transport.close()
+
+
+def test_async_engine_requests_count_as_spent(monkeypatch, standin):
+    pytest.importorskip("httpx")
+    from data_collectors.collectors.async_engine import collect_repos_async
+
+    monkeypatch.setattr(transport_module, "_transport", None)
+    day = date(2026, 4, 4)
+    server = standin(synthetic_dataset(3, day))
+    repos = sorted(server.repos)
+    collector = GitHubCollector("test-token", "bench", repos, api_base=server.api_base)
+    results, errors = collect_repos_async(collector, repos, day.isoformat())
+    assert len(results) == 3 and not errors
+    assert get_transport().spent()["core"] == server.stats()["requests"] > 0
@@ -0,0 +1,151 @@
+"""Webhook log: a day the receiver saw in full costs no requests; signed deliveries only, broken chains refetched."""
+
+import hashlib
+import hmac
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import date, datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from data_collectors.collectors import webhook_log
+from data_collectors.collectors.github import GitHubCollector
+from data_collectors.webhook_receiver import make_handler
+from github_standin import synthetic_dataset
+
+DAY = date.today() - timedelta(days=1)
+SECRET = "test-secret"
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _deliveries(dataset: dict) -> list:
+    """(event, payload): one push per repo chained onto a logged base push, plus the PRs and issues opened."""
+    out = []
+    for full, r in sorted(dataset["repos"].items()):
+        repository = {"full_name": full, "default_branch": "main"}
+        todays = [c for c in r["branches"]["main"] if c["commit"]["committer"]["date"].startswith(DAY.isoformat())]
+        todays.reverse()
+        out.append(
+            (
+                "push",
+                {
+                    "ref": "refs/heads/main",
+                    "before": hashlib.sha1(f"{full}/base".encode()).hexdigest(),
+                    "after": todays[-1]["sha"],
+                    "forced": False,
+                    "deleted": False,
+                    "repository": repository,
+                    "commits": [
+                        {
+                            "id": c["sha"],
+                            "message": c["commit"]["message"],
+                            "timestamp": c["commit"]["committer"]["date"],
+                            "url": c["html_url"],
+                            "author": {"name": c["commit"]["author"]["name"]},
+                        }
+                        for c in todays
+                    ],
+                },
+            )
+        )
+        for pr in r["pulls"]:
+            out.append(("pull_request", {"action": "opened", "pull_request": pr, "repository": repository}))
+        for issue in r["issues"]:
+            if "pull_request" not in issue:
+                out.append(("issues", {"action": "opened", "issue": issue, "repository": repository}))
+    return out
+
+
+def _post(url: str, event: str, payload: dict, secret: str = SECRET) -> int:
+    body = json.dumps(payload).encode()
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": event,
+            "X-GitHub-Delivery": hashlib.sha1(body).hexdigest(),
+            "X-Hub-Signature-256": "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest(),
+        },
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+@pytest.fixture
+def hooked(monkeypatch, standin, tmp_path):
+    """(server, log, repos, post): hooks pinged and receiver heartbeats through DAY, deliveries POSTed via `post`."""
+    monkeypatch.setenv("GITHUB_WEBHOOK_LOG_FILE", str(tmp_path / "webhook_events.jsonl"))
+    monkeypatch.setattr(webhook_log, "_log", None)
+    dataset = synthetic_dataset(4, DAY, commits_per_day=2, days=2, pr_every=2)
+    server = standin(dataset)
+    repos = sorted(dataset["repos"])
+
+    log = webhook_log.WebhookLog(webhook_log.webhook_log_path())
+    start = datetime(DAY.year, DAY.month, DAY.day, tzinfo=timezone.utc) - timedelta(hours=1)
+    log.append({"event": "receiver", "state": "start", "at": _stamp(start)})
+    for i, full in enumerate(repos):
+        log.append({"delivery": f"ping-{i}", "event": "ping", "at": _stamp(start), "repo": full, "hook_id": i + 1, "hook_type": "Repository", "org": ""})
+        base = {"repository": {"full_name": full}, "ref": "refs/heads/main", "commits": [], "after": hashlib.sha1(f"{full}/base".encode()).hexdigest()}
+        log.append(webhook_log.slim_record("push", f"base-{i}", base, _stamp(start)))
+    t = start
+    while t < start + timedelta(hours=26):
+        t += timedelta(seconds=webhook_log.HEARTBEAT_SECONDS * 4)
+        log.append({"event": "receiver", "state": "heartbeat", "at": _stamp(t)})
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(log, SECRET))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/github"
+    yield server, log, repos, dataset, lambda event, payload, secret=SECRET: _post(url, event, payload, secret)
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _collect(server, repos, webhooks: bool, monkeypatch):
+    monkeypatch.setenv("GITHUB_WEBHOOKS", "on" if webhooks else "off")
+    monkeypatch.setattr(webhook_log, "_log", None)
+    server.reset_stats()
+    return GitHubCollector("test-token", "bench", repos, api_base=server.api_base).collect_data_for_date(DAY)
+
+
+def test_logged_day_matches_the_api_without_requests(hooked, monkeypatch):
+    server, _, repos, dataset, post = hooked
+    reference = _collect(server, repos, False, monkeypatch)
+    assert {post(event, payload) for event, payload in _deliveries(dataset)} == {202}
+
+    data = _collect(server, repos, True, monkeypatch)
+    assert data["collected_via_webhooks"]
+    assert data["webhook_gap_repos"] == 0
+    assert server.stats()["requests"] == 0
+    assert (data["commits"], data["prs"], data["issues"]) == (reference["commits"], reference["prs"], reference["issues"])
+    assert data["commits"] == 8 and data["prs"] == 2 and data["issues"] == 2
+
+
+def test_wrong_signature_is_refused_and_not_logged(hooked):
+    _, log, _, dataset, post = hooked
+    before = len(list(log.records()))
+    assert post(*_deliveries(dataset)[0], secret="wrong") == 401
+    assert len(list(log.records())) == before
+
+
+def test_broken_push_chain_refetches_only_that_repo(hooked, monkeypatch):
+    server, _, repos, dataset, post = hooked
+    for event, payload in _deliveries(dataset):
+        if event == "push" and payload["repository"]["full_name"] == repos[0]:
+            payload = dict(payload, before="0123456789abcdef0123456789abcdef01234567")
+        assert post(event, payload) == 202
+
+    data = _collect(server, repos, True, monkeypatch)
+    assert data["collected_via_webhooks"]
+    assert data["webhook_gap_repos"] == 1
+    assert data["commits"] == 8
+    assert server.stats()["by_endpoint"] == {"repo_commits": 1, "repo_pulls": 1, "repo_issues": 1}
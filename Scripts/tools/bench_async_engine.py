@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asyncio engine against the thread-pool fan-out on a local stand-in API.
+
+Starts github_standin.py with synthetic data and a fixed per-request latency, then runs
+GitHubCollector.collect_data_for_date with the "rest" (thread pool) and "async" backends at 50, 500
+and 2,000 repos. Both runs must return identical dicts.
+
+  python3 Scripts/tools/bench_async_engine.py --latency-ms 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# tools/ -> parents[1] == Scripts/
+_SCRIPTS = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_SCRIPTS / "python"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_collectors.collectors.github import GitHubCollector  # noqa: E402
+from github_standin import StandInServer, synthetic_dataset  # noqa: E402
+
+TARGET = date(2026, 4, 4)
+
+
+def _run(backend: str, server: StandInServer, repos: list) -> tuple:
+    os.environ["GITHUB_COLLECTOR_BACKEND"] = backend
+    collector = GitHubCollector("bench-token", "bench", repos, api_base=server.api_base)
+    server.reset_stats()
+    t0 = time.perf_counter()
+    result = collector.collect_data_for_date(TARGET)
+    return time.perf_counter() - t0, server.stats()["requests"], result
+
+
+def _canonical(result: dict) -> str:
+    return json.dumps(result, sort_keys=True)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--latency-ms", type=float, default=25.0, help="Per-request server latency")
+    p.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000], help="Repo counts to run")
+    args = p.parse_args()
+
+    os.environ["GITHUB_PREFLIGHT"] = "off"
+    os.environ["GITHUB_HTTP_CACHE"] = "off"
+    server = StandInServer(synthetic_dataset(max(args.sizes), TARGET), latency_ms=args.latency_ms)
+    server.start()
+
+    print(f"Stand-in API {server.api_base}, latency {args.latency_ms:.0f} ms/request")
+    print(f"{'repos':>6}  {'threads s':>10}  {'async s':>8}  {'speedup':>7}  {'requests':>8}  identical")
+    for n in args.sizes:
+        repos = [f"bench/repo-{i}" for i in range(n)]
+        t_threads, hits, r_threads = _run("rest", server, repos)
+        t_async, _, r_async = _run("async", server, repos)
+        same = _canonical(r_threads) == _canonical(r_async)
+        print(f"{n:>6}  {t_threads:>10.2f}  {t_async:>8.2f}  {t_threads / t_async:>6.1f}x  {hits:>8}  {same}")
+
+    server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
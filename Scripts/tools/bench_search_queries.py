@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Search API query builder on large repo lists.
+
+Compares the old greedy builder (string concatenation, one open query at a time) with
+GitHubCollector._chunk_repo_search_queries (best-fit-decreasing packing, fully configured owners
+folded into user:/org:) at 10, 100, 1,000 and 5,000 repos: build time and query count. Repo names have
+mixed lengths and are spread over a few owners; --configured-share of the owners have every repo
+configured (their listings are seeded into a temporary repo registry), the rest only some.
+
+With --standin, also runs the day preflight on a local stand-in API with and without owner qualifiers
+and checks both find the same active repos.
+
+  python3 Scripts/tools/bench_search_queries.py --sizes 100 1000 5000 --standin
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+# tools/ -> parents[1] == Scripts/
+_SCRIPTS = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_SCRIPTS / "python"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_collectors.collectors import repo_registry  # noqa: E402
+from data_collectors.collectors.github import GitHubCollector  # noqa: E402
+from github_standin import StandInServer, synthetic_dataset  # noqa: E402
+
+PREFIX = "committer-date:2026-04-04"
+TARGET = date(2026, 4, 4)
+
+
+def _legacy_chunks(prefix: str, repos: list, max_len: int = 240) -> list:
+    """The builder before bin packing: grow one query a repo at a time, re-joining it on every trial."""
+    queries = []
+    start = 0
+    while start < len(repos):
+        chunk: list = []
+        j = start
+        while j < len(repos):
+            trial = chunk + [repos[j]]
+            if len(trial) == 1:
+                q = f"{prefix} repo:{trial[0]}"
+            else:
+                q = f"{prefix} ({' OR '.join(f'repo:{r}' for r in trial)})"
+            if len(q) > max_len:
+                break
+            chunk = trial
+            j += 1
+        if len(chunk) == 1:
+            queries.append(f"{prefix} repo:{chunk[0]}")
+        else:
+            queries.append(f"{prefix} ({' OR '.join(f'repo:{r}' for r in chunk)})")
+        start = j
+    return queries
+
+
+def _repo_list(n: int, owners: int, rng: random.Random) -> list:
+    names = []
+    for i in range(n):
+        owner = f"owner-{i % owners}"
+        names.append(f"{owner}/{'x' * rng.randint(3, 40)}-{i}")
+    return names
+
+
+def _seed_registry(repos: list, owners: int, share: float) -> None:
+    """Fresh registry holding complete listings: `share` of owners fully configured, the rest with extra repos."""
+    registry = repo_registry.RepoRegistry(Path(os.environ["GITHUB_REPO_REGISTRY_FILE"]))
+    repo_registry._registry = registry
+    by_owner: dict = {}
+    for r in repos:
+        by_owner.setdefault(r.split("/")[0], []).append({"full_name": r})
+    for i, (owner, listing) in enumerate(sorted(by_owner.items())):
+        if i >= int(owners * share):
+            listing = listing + [{"full_name": f"{owner}/not-configured"}]
+        registry.note_owner_listing(owner, "user", listing)
+
+
+def _timed(fn, rounds: int) -> tuple:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        out = fn()
+    return (time.perf_counter() - t0) / rounds * 1000, out
+
+
+def _standin_check(n: int) -> None:
+    dataset = synthetic_dataset(n, TARGET, owner="bench", pr_every=30)
+    for i, r in enumerate(dataset["repos"].values()):
+        if i % 15:
+            r["branches"]["main"] = []
+    server = StandInServer(dataset, latency_ms=0, search_limit=1000)
+    server.start()
+    repos = [f"bench/repo-{i}" for i in range(n)]
+    # Let the repo: variant run however many queries it needs, so both answers can be compared.
+    os.environ["GITHUB_PREFLIGHT_MAX_SEARCH_QUERIES"] = "1000"
+    found = {}
+    for label, min_repos in (("repo: terms", "1000000"), ("user:bench", "1")):
+        os.environ["GITHUB_OWNER_QUALIFIER_MIN_REPOS"] = min_repos
+        registry = repo_registry.RepoRegistry(Path(os.environ["GITHUB_REPO_REGISTRY_FILE"]))
+        repo_registry._registry = registry
+        collector = GitHubCollector("bench-token", "bench", repos, api_base=server.api_base)
+        server.reset_stats()
+        skip, active = collector._run_preflight(TARGET.isoformat())
+        found[label] = sorted(active or []) if not skip else []
+        print(f"  stand-in {label:<12} {len(found[label]):>5} active repos  {server.stats()['requests']:>4} requests")
+    print(f"  identical active repos: {len(set(map(tuple, found.values()))) == 1}")
+    server.stop()
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000], help="Repo counts to run")
+    p.add_argument("--owners", type=int, default=8, help="Owners the repos are spread over")
+    p.add_argument("--configured-share", type=float, default=0.5, help="Share of owners with every repo configured")
+    p.add_argument("--rounds", type=int, default=5, help="Builds per measurement")
+    p.add_argument("--standin", type=int, nargs="?", const=300, default=None, help="Also check preflight on N repos")
+    args = p.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["GITHUB_REPO_REGISTRY_FILE"] = str(Path(tmp.name) / "repo_registry.json")
+    os.environ["GITHUB_HTTP_CACHE"] = "off"
+    os.environ["GITHUB_PREFLIGHT"] = "repos"
+    rng = random.Random(7)
+
+    print(f"{'repos':>6}  {'legacy ms':>9}  {'q':>5}  {'packed ms':>9}  {'q':>5}  {'+owners ms':>10}  {'q':>5}")
+    for n in args.sizes:
+        repos = _repo_list(n, min(args.owners, n), rng)
+
+        def build(share: float) -> list:
+            _seed_registry(repos, min(args.owners, n), share)
+            collector = GitHubCollector("bench-token", "bench", repos, api_base="http://127.0.0.1:9")
+            collector._normalized_repo_list()
+
+            def chunks() -> list:
+                collector._owner_qualifiers = None
+                return collector._chunk_repo_search_queries(PREFIX)
+
+            legacy = _timed(lambda: _legacy_chunks(PREFIX, collector._normalized_repo_list()), args.rounds)
+            return legacy, _timed(chunks, args.rounds)
+
+        (t_legacy, legacy), (t_packed, packed) = build(0.0)
+        _, (t_owners, owners) = build(args.configured_share)
+        assert all(len(q) <= 240 for q in packed + owners)
+        print(
+            f"{n:>6}  {t_legacy:>9.2f}  {len(legacy):>5}  {t_packed:>9.2f}  {len(packed):>5}  "
+            f"{t_owners:>10.2f}  {len(owners):>5}"
+        )
+
+    if args.standin:
+        _standin_check(args.standin)
+    tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Local GitHub REST API stand-in for measuring and testing the collector without network access.
+
+Serves /repos/{o}/{r} (+ /commits, /pulls, /issues, /branches, /compare/{base}...{head}), /user/repos, /orgs|users/{o}/repos,
+/search/commits, /search/issues, event feeds (/users/{u}/events, /received_events, /events/orgs/{o},
+/orgs/{o}/events) and /rate_limit from a synthetic or recorded dataset, with:
+
+  - fixed latency plus jitter per request
+  - page/per_page pagination with GitHub-style Link headers (rel="next"/"last")
+  - ETags and 304s for If-None-Match (304s do not spend budget, like GitHub)
+  - x-ratelimit-* headers per budget (core/search), 403 once a budget is spent
+  - injected faults: secondary-limit 403s, 429s and 5xx at a given rate (seeded, reproducible)
+
+Point the collector at it with GITHUB_API_BASE (or github.api_base / GitHubCollector(api_base=...)):
+
+  python3 Scripts/tools/github_standin.py --repos 50 --latency-ms 20 --fault-rate 0.05 --port 8765
+  GITHUB_API_BASE=http://127.0.0.1:8765 python3 -m data_collectors.main --date 2026-04-04
+
+A recorded dataset is JSON: {"repos": {"owner/name": {"default_branch": "main", "pushed_at": "...",
+"branches": {"main": [commit items, newest first]}, "pulls": [...], "issues": [...]}}}, items in REST
+shape. /issues lists PRs too (items with a "pull_request" key), as on GitHub. An optional
+"renamed": {"old/name": "new/name"} answers 301 for the old name's repo endpoints. Event feeds are
+derived from the repos (a PushEvent per default-branch commit, "opened" PR/issue events) unless the
+dataset has its own "events" list; a feed shows the events on repos of its owner, 300 at most.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# tools/ -> parents[1] == Scripts/
+_SCRIPTS = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_SCRIPTS / "python"))
+from data_collectors.collectors.day_window import utc_timestamp  # noqa: E402
+
+SEARCH_MAX_RESULTS = 1000
+EVENTS_MAX = 300
+
+
+def synthetic_dataset(
+    num_repos: int, day: date, owner: str = "bench", commits_per_day: int = 1, days: int = 1, pr_every: int = 5
+) -> Dict:
+    """
+    `num_repos` repos named {owner}/repo-{i}, each with commits_per_day commits on each of the `days`
+    days ending at `day`; every pr_every-th repo also gets one PR and one issue on `day`.
+    """
+    repos: Dict[str, Dict] = {}
+    for i in range(num_repos):
+        name = f"repo-{i}"
+        full = f"{owner}/{name}"
+        commits = []
+        for d in range(days):
+            current = day - timedelta(days=d)
+            for k in range(commits_per_day):
+                stamp = f"{current}T{10 + (commits_per_day - 1 - k) * 12 // max(1, commits_per_day):02d}:00:00Z"
+                sha = hashlib.sha1(f"{full}/{current}/{k}".encode()).hexdigest()
+                commits.append(
+                    {
+                        "sha": sha,
+                        "html_url": f"https://github.com/{full}/commit/{sha}",
+                        "commit": {
+                            "message": f"Work on {name}\n\nDetails",
+                            "author": {"name": "Bench", "date": stamp},
+                            "committer": {"name": "Bench", "date": stamp},
+                        },
+                    }
+                )
+        pulls, issues = [], []
+        if pr_every and i % pr_every == 0:
+            created = f"{day}T09:00:00Z"
+            pulls.append({"number": 1, "created_at": created, "updated_at": created})
+            issues.append({"number": 2, "created_at": created, "updated_at": created})
+            issues.append({"number": 1, "created_at": created, "updated_at": created, "pull_request": {}})
+        pushed_at = commits[0]["commit"]["committer"]["date"] if commits else f"{day - timedelta(days=days)}T00:00:00Z"
+        repos[full] = {
+            "default_branch": "main",
+            "pushed_at": pushed_at,
+            "archived": False,
+            "branches": {"main": commits},
+            "pulls": pulls,
+            "issues": issues,
+        }
+    return {"repos": repos}
+
+
+def _date_bounds(spec: str) -> Tuple[str, str]:
+    """Search date qualifier value (D, A..B, >=D, <D, timestamps) as inclusive UTC bounds."""
+    if ".." in spec:
+        lo, hi = spec.split("..", 1)
+    elif spec.startswith(">="):
+        lo, hi = spec[2:], "*"
+    elif spec.startswith(">"):
+        lo, hi = spec[1:], "*"
+    elif spec.startswith("<="):
+        lo, hi = "*", spec[2:]
+    elif spec.startswith("<"):
+        lo, hi = "*", spec[1:]
+    else:
+        lo = hi = spec
+    lo = "" if lo in ("", "*") else (f"{lo}T00:00:00Z" if len(lo) == 10 else utc_timestamp(lo))
+    hi = "9999" if hi in ("", "*") else (f"{hi}T23:59:59Z" if len(hi) == 10 else utc_timestamp(hi))
+    return lo, hi
+
+
+def _parse_search_q(q: str) -> Tuple[set, Dict[str, Tuple[str, str]], set]:
+    """(repo full names, {date qualifier: bounds}, owners from org:/user:) from a search q string."""
+    repos, dates, owners = set(), {}, set()
+    for token in q.replace("(", " ").replace(")", " ").split():
+        key, _, value = token.partition(":")
+        if key == "repo":
+            repos.add(value.lower())
+        elif key in ("org", "user"):
+            owners.add(value.lower())
+        elif key in ("committer-date", "author-date", "created"):
+            dates[key] = _date_bounds(value)
+    return repos, dates, owners
+
+
+class StandInServer:
+    """
+    Threaded stand-in on 127.0.0.1. `faults` maps status -> probability per request, e.g.
+    {403: 0.02, 429: 0.01, 502: 0.02}; decisions come from one seeded RNG so runs are reproducible.
+    """
+
+    def __init__(
+        self,
+        dataset: Dict,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        faults: Optional[Dict[int, float]] = None,
+        seed: int = 0,
+        core_limit: int = 5000,
+        search_limit: int = 30,
+        reset_s: int = 3600,
+        retry_after: int = 1,
+        port: int = 0,
+    ):
+        self.repos = {k.lower(): v for k, v in dataset.get("repos", {}).items()}
+        # {"old-owner/old-name": "new-owner/new-name"}: repo-scoped requests answer 301, like a rename.
+        self.renamed = {k.lower(): v for k, v in dataset.get("renamed", {}).items()}
+        self._events = dataset.get("events") or _derive_events(self.repos)
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.faults = dict(faults or {})
+        self.retry_after = retry_after
+        self.limits = {"core": core_limit, "search": search_limit}
+        self.reset_s = reset_s
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._budget: Dict[str, Dict] = {}
+        self._stats: Dict = {}
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self.api_base = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.api_base
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {"requests": 0, "not_modified": 0, "faults": 0, "by_status": {}, "by_endpoint": {}}
+            now = int(time.time())
+            self._budget = {
+                name: {"remaining": limit, "reset": now + self.reset_s} for name, limit in self.limits.items()
+            }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    # -- request bookkeeping (called from handler threads) --
+
+    def _note(self, endpoint: str, status: int) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["by_status"][str(status)] = self._stats["by_status"].get(str(status), 0) + 1
+            self._stats["by_endpoint"][endpoint] = self._stats["by_endpoint"].get(endpoint, 0) + 1
+            if status == 304:
+                self._stats["not_modified"] += 1
+
+    def _roll_fault(self) -> Optional[int]:
+        with self._lock:
+            for status, rate in sorted(self.faults.items()):
+                if self._rng.random() < rate:
+                    self._stats["faults"] += 1
+                    return status
+        return None
+
+    def _spend(self, budget: str, spend: bool) -> Dict[str, str]:
+        """Rate-limit headers for one request; spend=False for 304s and /rate_limit."""
+        with self._lock:
+            b = self._budget[budget]
+            now = int(time.time())
+            if now >= b["reset"]:
+                b["remaining"], b["reset"] = self.limits[budget], now + self.reset_s
+            if spend and b["remaining"] > 0:
+                b["remaining"] -= 1
+            return {
+                "x-ratelimit-limit": str(self.limits[budget]),
+                "x-ratelimit-remaining": str(b["remaining"]),
+                "x-ratelimit-reset": str(b["reset"]),
+                "x-ratelimit-used": str(self.limits[budget] - b["remaining"]),
+                "x-ratelimit-resource": budget,
+            }
+
+    def _exhausted(self, budget: str) -> bool:
+        with self._lock:
+            b = self._budget[budget]
+            return b["remaining"] <= 0 and int(time.time()) < b["reset"]
+
+    def rate_limit_payload(self) -> Dict:
+        with self._lock:
+            resources = {
+                name: {
+                    "limit": self.limits[name],
+                    "remaining": b["remaining"],
+                    "reset": b["reset"],
+                    "used": self.limits[name] - b["remaining"],
+                }
+                for name, b in self._budget.items()
+            }
+        return {"resources": resources, "rate": resources["core"]}
+
+    # -- data --
+
+    def repo(self, owner: str, name: str) -> Optional[Dict]:
+        return self.repos.get(f"{owner}/{name}".lower())
+
+    def events(self, owner: str) -> List[Dict]:
+        """Events on `owner`'s repos, newest first."""
+        out = [e for e in self._events if e["repo"]["name"].split("/")[0].lower() == owner.lower()]
+        out.sort(key=lambda e: e["created_at"], reverse=True)
+        return out
+
+    def repo_listing(self, owner: Optional[str]) -> List[Dict]:
+        out = []
+        for full, r in self.repos.items():
+            if owner and full.split("/")[0] != owner.lower():
+                continue
+            out.append(_repo_meta(full, r))
+        out.sort(key=lambda m: m["pushed_at"] or "", reverse=True)
+        return out
+
+
+def _derive_events(repos: Dict[str, Dict]) -> List[Dict]:
+    events = []
+    for full, r in repos.items():
+        for c in (r.get("branches") or {}).get(r.get("default_branch", "main"), []):
+            events.append(
+                {
+                    "type": "PushEvent",
+                    "repo": {"name": full},
+                    "created_at": _commit_at(c),
+                    "payload": {"ref": f"refs/heads/{r.get('default_branch', 'main')}", "head": c["sha"]},
+                }
+            )
+        for kind, key, items in (("PullRequestEvent", "pull_request", r.get("pulls")), ("IssuesEvent", "issue", r.get("issues"))):
+            for item in items or []:
+                if kind == "IssuesEvent" and "pull_request" in item:
+                    continue
+                events.append(
+                    {
+                        "type": kind,
+                        "repo": {"name": full},
+                        "created_at": item["created_at"],
+                        "payload": {"action": "opened", key: {"number": item["number"], "created_at": item["created_at"]}},
+                    }
+                )
+    for e in events:
+        e.setdefault("id", hashlib.sha1(json.dumps(e, sort_keys=True).encode()).hexdigest()[:12])
+    return events
+
+
+def _history(branches: Dict[str, List[Dict]], ref: str) -> Optional[List[Dict]]:
+    """Commits reachable from a branch name or sha, newest first (a branch list is one linear history)."""
+    if ref in branches:
+        return branches[ref]
+    for items in branches.values():
+        for i, c in enumerate(items):
+            if c["sha"] == ref:
+                return items[i:]
+    return None
+
+
+def _repo_meta(full: str, r: Dict) -> Dict:
+    return {
+        "full_name": full,
+        "name": full.split("/")[-1],
+        "owner": {"login": full.split("/")[0]},
+        "default_branch": r.get("default_branch", "main"),
+        "pushed_at": r.get("pushed_at"),
+        "updated_at": r.get("updated_at") or r.get("pushed_at"),
+        "archived": bool(r.get("archived")),
+    }
+
+
+def _commit_at(item: Dict) -> str:
+    return utc_timestamp(((item.get("commit") or {}).get("committer") or {}).get("date", ""))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        s: StandInServer = self.server.standin
+        if s.latency or s.jitter:
+            time.sleep(s.latency + (random.random() * s.jitter if s.jitter else 0.0))
+        parsed = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        parts = [p for p in parsed.path.split("/") if p]
+        endpoint, budget = _classify(parts)
+
+        if endpoint == "rate_limit":
+            return self._send(s, endpoint, 200, s.rate_limit_payload(), s._spend("core", False))
+
+        fault = s._roll_fault()
+        if fault is not None:
+            return self._send_fault(s, endpoint, budget, fault)
+        if s._exhausted(budget):
+            headers = s._spend(budget, False)
+            return self._send(
+                s, endpoint, 403, {"message": "API rate limit exceeded for user ID 1."}, headers
+            )
+
+        moved = s.renamed.get("/".join(parts[1:3]).lower()) if endpoint.startswith("repo") else None
+        if moved:
+            location = "/" + "/".join(["repos", *moved.split("/"), *parts[3:]])
+            if parsed.query:
+                location += "?" + parsed.query
+            headers = dict(s._spend(budget, True), Location=f"http://{self.headers.get('Host')}{location}")
+            return self._send(s, endpoint, 301, {"message": "Moved Permanently", "url": location}, headers)
+
+        status, body, link_total = self._route(s, endpoint, parts, query)
+        payload = json.dumps(body, sort_keys=True).encode()
+        etag = f'W/"{hashlib.sha1(payload).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            return self._send(s, endpoint, 304, None, dict(s._spend(budget, False), ETag=etag))
+        headers = dict(s._spend(budget, True), ETag=etag)
+        if link_total is not None:
+            headers.update(self._link_header(parsed.path, query, link_total))
+        return self._send(s, endpoint, status, body, headers, payload)
+
+    def _route(self, s: StandInServer, endpoint: str, parts: List[str], query: Dict) -> Tuple[int, object, Optional[int]]:
+        """(status, body, total items for Link pagination or None)."""
+        not_found = (404, {"message": "Not Found"}, None)
+        if endpoint in ("user_repos", "owner_repos"):
+            items = s.repo_listing(parts[1] if endpoint == "owner_repos" else None)
+            return self._page(items, query)
+        if endpoint == "search":
+            return self._search(s, parts[1], query)
+        if endpoint == "events":
+            # /users/{u}/events[/orgs/{o}], /users/{u}/received_events, /orgs/{o}/events
+            owner = parts[4] if len(parts) == 5 else parts[1]
+            status, page, total = self._page(s.events(owner)[:EVENTS_MAX], query)
+            per_page = max(1, min(100, int(query.get("per_page", 30))))
+            if (max(1, int(query.get("page", 1))) - 1) * per_page >= EVENTS_MAX:
+                return 422, {"message": "In order to keep the API fast for everyone, pagination is limited for this resource."}, None
+            return status, page, total
+        if not endpoint.startswith("repo"):
+            return not_found
+        r = s.repo(parts[1], parts[2])
+        if r is None:
+            return not_found
+        if endpoint == "repo":
+            return 200, _repo_meta(f"{parts[1]}/{parts[2]}", r), None
+        branches = r.get("branches") or {}
+        if endpoint == "repo_commits":
+            branch = query.get("sha") or r.get("default_branch", "main")
+            if not any(branches.values()):
+                return 409, {"message": "Git Repository is empty."}, None
+            items = branches.get(branch)
+            if items is None:
+                return 404, {"message": "No commit found for SHA: " + branch}, None
+            lo, hi = query.get("since"), query.get("until")
+            items = [
+                c for c in items if (not lo or _commit_at(c) >= utc_timestamp(lo)) and (not hi or _commit_at(c) <= utc_timestamp(hi))
+            ]
+            return self._page(items, query)
+        if endpoint == "repo_branches":
+            items = [{"name": n, "commit": {"sha": c[0]["sha"] if c else ""}} for n, c in branches.items()]
+            return self._page(items, query)
+        if endpoint == "repo_compare":
+            base, _, head = parts[4].partition("...")
+            head_history, base_history = _history(branches, head), _history(branches, base)
+            if head_history is None or base_history is None:
+                return 404, {"message": "Not Found"}, None
+            base_shas = {c["sha"] for c in base_history}
+            head_shas = {c["sha"] for c in head_history}
+            ahead = [c for c in head_history if c["sha"] not in base_shas]
+            behind = sum(1 for c in base_history if c["sha"] not in head_shas)
+            status = {(False, False): "identical", (True, False): "ahead", (False, True): "behind"}.get(
+                (bool(ahead), bool(behind)), "diverged"
+            )
+            _, page, _ = self._page(list(reversed(ahead)), query)
+            body = {"status": status, "ahead_by": len(ahead), "behind_by": behind, "total_commits": len(ahead), "commits": page}
+            return 200, body, None
+        if endpoint in ("repo_pulls", "repo_issues"):
+            items = list(r.get("pulls" if endpoint == "repo_pulls" else "issues") or [])
+            if endpoint == "repo_issues" and query.get("since"):
+                since = utc_timestamp(query["since"])
+                items = [i for i in items if utc_timestamp(i.get("updated_at") or i.get("created_at", "")) >= since]
+            key = "updated_at" if query.get("sort") == "updated" else "created_at"
+            items.sort(key=lambda i: i.get(key) or "", reverse=query.get("direction", "desc") != "asc")
+            return self._page(items, query)
+        return not_found
+
+    def _search(self, s: StandInServer, kind: str, query: Dict) -> Tuple[int, object, Optional[int]]:
+        q = query.get("q", "")
+        repos, dates, owners = _parse_search_q(q)
+        if not repos and not owners:
+            return 422, {"message": "Validation Failed", "errors": [{"message": "q needs repo:, org: or user:"}]}, None
+        hits: List[Dict] = []
+        for full, r in sorted(s.repos.items()):
+            if (repos and full not in repos) or (owners and full.split("/")[0] not in owners):
+                continue
+            if kind == "commits":
+                bounds = dates.get("committer-date") or dates.get("author-date")
+                for c in (r.get("branches") or {}).get(r.get("default_branch", "main"), []):
+                    if bounds and not bounds[0] <= _commit_at(c) <= bounds[1]:
+                        continue
+                    hits.append(dict(c, repository={"full_name": full}))
+            elif kind == "issues":
+                bounds = dates.get("created")
+                for i in r.get("issues") or []:
+                    if bounds and not bounds[0] <= utc_timestamp(i.get("created_at", "")) <= bounds[1]:
+                        continue
+                    hits.append(dict(i, repository_url=f"{s.api_base}/repos/{full}"))
+            else:
+                return 404, {"message": "Not Found"}, None
+        total = len(hits)
+        status, page, _ = self._page(hits[:SEARCH_MAX_RESULTS], query)
+        return status, {"total_count": total, "incomplete_results": False, "items": page}, min(total, SEARCH_MAX_RESULTS)
+
+    @staticmethod
+    def _page(items: List, query: Dict) -> Tuple[int, List, int]:
+        per_page = max(1, min(100, int(query.get("per_page", 30))))
+        page = max(1, int(query.get("page", 1)))
+        return 200, items[(page - 1) * per_page : page * per_page], len(items)
+
+    def _link_header(self, path: str, query: Dict, total: int) -> Dict[str, str]:
+        per_page = max(1, min(100, int(query.get("per_page", 30))))
+        page = max(1, int(query.get("page", 1)))
+        last = max(1, -(-total // per_page))
+        base = f"http://{self.headers.get('Host')}{path}"
+        links = []
+        if page < last:
+            links.append(f'<{base}?{urlencode(dict(query, page=page + 1))}>; rel="next"')
+            links.append(f'<{base}?{urlencode(dict(query, page=last))}>; rel="last"')
+        if page > 1:
+            links.append(f'<{base}?{urlencode(dict(query, page=1))}>; rel="first"')
+            links.append(f'<{base}?{urlencode(dict(query, page=page - 1))}>; rel="prev"')
+        return {"Link": ", ".join(links)} if links else {}
+
+    def _send_fault(self, s: StandInServer, endpoint: str, budget: str, status: int) -> None:
+        headers = s._spend(budget, False)
+        if status == 403:
+            body = {"message": "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."}
+            headers["retry-after"] = str(s.retry_after)
+        elif status == 429:
+            body = {"message": "Too Many Requests"}
+            headers["retry-after"] = str(s.retry_after)
+        else:
+            body = {"message": "Server Error"}
+        self._send(s, endpoint, status, body, headers)
+
+    def _send(
+        self, s: StandInServer, endpoint: str, status: int, body, headers: Dict[str, str], payload: Optional[bytes] = None
+    ) -> None:
+        data = b"" if status == 304 else (payload if payload is not None else json.dumps(body).encode())
+        # Counted before the reply goes out, so stats() read right after a response already include it.
+        s._note(endpoint, status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+def _classify(parts: List[str]) -> Tuple[str, str]:
+    """(endpoint name for stats, rate-limit budget)."""
+    if parts == ["rate_limit"]:
+        return "rate_limit", "core"
+    if parts[:1] in (["users"], ["orgs"]) and len(parts) >= 3 and parts[2] in ("events", "received_events"):
+        return "events", "core"
+    if parts[:1] == ["search"] and len(parts) == 2:
+        return "search", "search"
+    if parts == ["user", "repos"]:
+        return "user_repos", "core"
+    if len(parts) == 3 and parts[0] in ("orgs", "users") and parts[2] == "repos":
+        return "owner_repos", "core"
+    if parts[:1] == ["repos"] and len(parts) == 3:
+        return "repo", "core"
+    if parts[:1] == ["repos"] and len(parts) == 4:
+        return f"repo_{parts[3]}", "core"
+    if parts[:1] == ["repos"] and len(parts) == 5 and parts[3] == "compare":
+        return "repo_compare", "core"
+    return "other", "core"
+
+
+def _parse_faults(specs: List[str], rate: float) -> Dict[int, float]:
+    """--fault 403=0.02 --fault 502=0.01; --fault-rate spreads one rate over 403/429/502."""
+    faults: Dict[int, float] = {}
+    if rate:
+        faults = {403: rate / 3, 429: rate / 3, 502: rate / 3}
+    for spec in specs:
+        status, _, p = spec.partition("=")
+        faults[int(status)] = float(p)
+    return faults
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--fixture", help="Recorded dataset JSON (default: synthetic)")
+    p.add_argument("--repos", type=int, default=50, help="Synthetic repo count")
+    p.add_argument("--date", default=date.today().isoformat(), help="Synthetic activity day (YYYY-MM-DD)")
+    p.add_argument("--days", type=int, default=1, help="Synthetic days of history ending at --date")
+    p.add_argument("--commits-per-day", type=int, default=1)
+    p.add_argument("--owner", default="bench")
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--jitter-ms", type=float, default=0.0)
+    p.add_argument("--fault", action="append", default=[], metavar="STATUS=P", help="Inject STATUS with probability P")
+    p.add_argument("--fault-rate", type=float, default=0.0, help="Total fault probability over 403/429/502")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--core-limit", type=int, default=5000)
+    p.add_argument("--search-limit", type=int, default=30)
+    p.add_argument("--retry-after", type=int, default=1)
+    args = p.parse_args()
+
+    if args.fixture:
+        with open(args.fixture, "r", encoding="utf-8") as f:
+            dataset = json.load(f)
+    else:
+        dataset = synthetic_dataset(
+            args.repos, date.fromisoformat(args.date), args.owner, args.commits_per_day, args.days
+        )
+    server = StandInServer(
+        dataset,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        faults=_parse_faults(args.fault, args.fault_rate),
+        seed=args.seed,
+        core_limit=args.core_limit,
+        search_limit=args.search_limit,
+        retry_after=args.retry_after,
+        port=args.port,
+    )
+    print(f"GitHub stand-in on {server.api_base} ({len(server.repos)} repos); Ctrl-C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(server.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
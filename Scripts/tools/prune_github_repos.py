@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """
 Trim github.repositories in unified_data_config.json to repos that still exist on GitHub
-and had a push within the last N days (default 365). Skips archived repos.
+and had a push within the last N days (default 365). Skips archived repos. Renamed repos are
+written under their new name.
+
+Verdicts are shared with the collector's repo registry (logs/repo_registry.json), so repos looked up
+within GITHUB_REPO_REGISTRY_TTL_DAYS are not fetched again; --refresh ignores it.
 
 Auth: GITHUB_TOKEN or GITHUB_API_TOKEN, or `gh auth token` if available.
 """
@@ -17,11 +21,12 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
 
-import requests
-
 # tools/ -> parents[1] == Scripts/
 _SCRIPTS = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_SCRIPTS / "python"))
+from data_collectors.collectors.github import _github_api_base  # noqa: E402
+from data_collectors.collectors.repo_registry import get_repo_registry  # noqa: E402
+from data_collectors.collectors.transport import GitHubTransport, get_transport  # noqa: E402
 from data_collectors.utils.helpers import normalize_repo_identifier  # noqa: E402
 
 
@@ -35,11 +40,28 @@ def _token() -> str:
         return ""
 
 
-def fetch_repo_meta(session: requests.Session, owner_repo: str) -> Optional[dict]:
-    r = session.get(f"https://api.github.com/repos/{owner_repo}", timeout=30)
+def fetch_repo_meta(transport: GitHubTransport, headers: dict, api_base: str, owner_repo: str) -> tuple[int, Optional[dict]]:
+    r = transport.get(f"{api_base}/repos/{owner_repo}", headers=headers, timeout=30)
     if r.status_code != 200:
-        return None
-    return r.json()
+        return r.status_code, None
+    return 200, r.json()
+
+
+def repo_meta(registry, fetch, owner_repo: str, refresh: bool) -> Optional[dict]:
+    """Repo JSON (full_name/pushed_at/archived), from the registry when it has a fresh verdict."""
+    if registry is None:
+        return fetch(owner_repo)[1]
+    cached = None if refresh else registry.cached_meta(owner_repo)
+    if cached and not cached.get("moved"):
+        if cached.get("status") == "missing":
+            return None
+        if cached.get("pushed_at"):
+            return {
+                "full_name": registry.canonical(owner_repo),
+                "pushed_at": cached["pushed_at"],
+                "archived": cached.get("archived", False),
+            }
+    return registry.lookup(owner_repo, fetch)
 
 
 def main() -> int:
@@ -52,6 +74,7 @@ def main() -> int:
     )
     p.add_argument("--days", type=int, default=365, help="Keep repos pushed within this many days")
     p.add_argument("--dry-run", action="store_true", help="Print plan only; do not write")
+    p.add_argument("--refresh", action="store_true", help="Look up every repo, ignoring cached registry verdicts")
     args = p.parse_args()
 
     token = _token()
@@ -75,20 +98,24 @@ def main() -> int:
         seen.add(n)
         repos.append(n)
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-    )
+    transport = get_transport()
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    api_base = _github_api_base(gh.get("api_base"))
+    registry = get_repo_registry()
+
+    def fetch(owner_repo: str) -> tuple[int, Optional[dict]]:
+        return fetch_repo_meta(transport, headers, api_base, owner_repo)
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
     kept: list[tuple[str, datetime]] = []
     dropped: list[tuple[str, str]] = []
+    kept_names: set[str] = set()
 
     for owner_repo in repos:
-        data = fetch_repo_meta(session, owner_repo)
+        data = repo_meta(registry, fetch, owner_repo, args.refresh)
         if not data:
             dropped.append((owner_repo, "not found or API error"))
             continue
@@ -103,6 +130,10 @@ def main() -> int:
         if pushed_dt < cutoff:
             dropped.append((owner_repo, f"last push {pushed_dt.date()} (before cutoff)"))
             continue
+        if data["full_name"].lower() in kept_names:
+            dropped.append((owner_repo, f"same repository as {data['full_name']}"))
+            continue
+        kept_names.add(data["full_name"].lower())
         kept.append((data["full_name"], pushed_dt))
 
     kept.sort(key=lambda x: x[1], reverse=True)
@@ -114,6 +145,14 @@ def main() -> int:
     print(f"Dropping: {len(dropped)}")
     for repo, reason in dropped:
         print(f"  - {repo}: {reason}")
+    http = transport.stats()
+    print(
+        f"HTTP: {http['requests']} requests, {http['reused_connections']} on reused connections, "
+        f"avg {http['latency_ms_avg']} ms"
+    )
+
+    if registry:
+        registry.flush()
 
     if args.dry_run:
         print("\nDry run; not writing.")
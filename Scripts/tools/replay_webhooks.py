@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Replay GitHub webhook deliveries through the receiver and check the webhook path against the API path.
+
+Builds push, pull_request and issues payloads from a synthetic stand-in dataset for today, signs them and
+POSTs them to data_collectors.webhook_receiver running in-process. Receiver uptime and the hooks' ping
+records (both from before today) are written straight into the log. Then GitHubCollector.collect_data_for_date
+runs against github_standin.py:
+
+  api          GITHUB_WEBHOOKS off, full scan: the reference result
+  webhooks     every delivery logged: same result, no API calls
+  dropped      one push missing from a repo's before/after chain: that repo alone is fetched
+  down         the receiver went quiet for 10 minutes today: the whole day goes to the API
+  bad secret   a delivery signed with the wrong secret is refused (401) and not logged
+
+  python3 Scripts/tools/replay_webhooks.py --repos 200 --latency-ms 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+# tools/ -> parents[1] == Scripts/
+_SCRIPTS = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_SCRIPTS / "python"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_collectors.collectors import webhook_log  # noqa: E402
+from data_collectors.collectors.github import GitHubCollector  # noqa: E402
+from data_collectors.webhook_receiver import make_handler  # noqa: E402
+from github_standin import StandInServer, synthetic_dataset  # noqa: E402
+
+SECRET = "replay-secret"
+OWNER = "bench"
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _deliveries(dataset: dict, day: date) -> list:
+    """(event, payload) per push (two per repo: the day's commits split in halves), PR and issue opened today."""
+    out = []
+    for full, r in sorted(dataset["repos"].items()):
+        repository = {"full_name": full, "default_branch": r.get("default_branch", "main")}
+        todays = [c for c in r["branches"]["main"] if c["commit"]["committer"]["date"].startswith(day.isoformat())]
+        todays.reverse()  # webhook pushes list commits oldest first
+        before = hashlib.sha1(f"{full}/base".encode()).hexdigest()
+        for half in (todays[: len(todays) // 2], todays[len(todays) // 2 :]):
+            if not half:
+                continue
+            payload = {
+                "ref": f"refs/heads/{repository['default_branch']}",
+                "before": before,
+                "after": half[-1]["sha"],
+                "forced": False,
+                "deleted": False,
+                "repository": repository,
+                "commits": [
+                    {
+                        "id": c["sha"],
+                        "message": c["commit"]["message"],
+                        "timestamp": c["commit"]["committer"]["date"],
+                        "url": c["html_url"],
+                        "author": {"name": c["commit"]["author"]["name"]},
+                    }
+                    for c in half
+                ],
+            }
+            out.append(("push", payload))
+            before = half[-1]["sha"]
+        for pr in r.get("pulls") or []:
+            out.append(("pull_request", {"action": "opened", "pull_request": pr, "repository": repository}))
+        for issue in r.get("issues") or []:
+            if "pull_request" not in issue:
+                out.append(("issues", {"action": "opened", "issue": issue, "repository": repository}))
+    return out
+
+
+def _post(url: str, event: str, payload: dict, secret: str = SECRET) -> int:
+    body = json.dumps(payload).encode()
+    signature = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": event,
+            "X-GitHub-Delivery": str(uuid.uuid4()),
+            "X-Hub-Signature-256": signature,
+        },
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def _prepare_log(path: Path, repos: list, since: datetime, quiet: tuple = ()) -> webhook_log.WebhookLog:
+    """
+    Fresh log: repo hooks pinged, each default branch's last push before today (the chain's first link) and
+    receiver heartbeats from `since` until now, except inside `quiet`.
+    """
+    if path.exists():
+        path.unlink()
+    log = webhook_log.WebhookLog(path)
+    log.append({"event": "receiver", "state": "start", "at": _stamp(since)})
+    for i, full in enumerate(repos):
+        log.append(
+            {"delivery": f"ping-{i}", "event": "ping", "at": _stamp(since), "repo": full.lower(), "hook_id": i + 1, "hook_type": "Repository", "org": ""}
+        )
+        base = {"ref": "refs/heads/main", "after": hashlib.sha1(f"{full}/base".encode()).hexdigest(), "commits": []}
+        log.append(webhook_log.slim_record("push", f"base-{i}", {"repository": {"full_name": full}, **base}, _stamp(since)))
+    t = since
+    now = datetime.now(timezone.utc)
+    while t < now:
+        t += timedelta(seconds=webhook_log.HEARTBEAT_SECONDS)
+        if not (quiet and quiet[0] <= t <= quiet[1]):
+            log.append({"event": "receiver", "state": "heartbeat", "at": _stamp(min(t, now))})
+    return log
+
+
+def _collect(server: StandInServer, repos: list, day: date, webhooks: bool) -> tuple:
+    os.environ["GITHUB_WEBHOOKS"] = "on" if webhooks else "off"
+    webhook_log._log = None
+    collector = GitHubCollector("replay-token", OWNER, repos, api_base=server.api_base)
+    server.reset_stats()
+    t0 = time.perf_counter()
+    result = collector.collect_data_for_date(day)
+    return (time.perf_counter() - t0) * 1000, server.stats()["requests"], result
+
+
+def _same(a: dict, b: dict) -> bool:
+    def canonical(r: dict) -> str:
+        details = {
+            name: dict(d, commit_details=sorted(d["commit_details"], key=lambda c: c["sha"]))
+            for name, d in r["repository_details"].items()
+        }
+        return json.dumps([r["commits"], r["prs"], r["issues"], details], sort_keys=True)
+
+    return canonical(a) == canonical(b)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--repos", type=int, default=200, help="Configured repos")
+    p.add_argument("--latency-ms", type=float, default=25.0, help="Per-request stand-in API latency")
+    args = p.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    for name, value in (
+        ("GITHUB_PREFLIGHT", "off"),
+        ("GITHUB_HTTP_CACHE", "off"),
+        ("GITHUB_STORE", "off"),
+        ("GITHUB_PREFLIGHT_TUNER", "off"),
+        ("GITHUB_REPO_REGISTRY_FILE", str(Path(tmp.name) / "repo_registry.json")),
+        ("GITHUB_WEBHOOK_LOG_FILE", str(Path(tmp.name) / "webhook_events.jsonl")),
+    ):
+        os.environ[name] = value
+    log_path = webhook_log.webhook_log_path()
+
+    now = datetime.now(timezone.utc)
+    day = now.date()
+    dataset = synthetic_dataset(args.repos, day, owner=OWNER, commits_per_day=4, days=3, pr_every=7)
+    for i, r in enumerate(dataset["repos"].values()):
+        if i % 3:
+            r["branches"]["main"] = [c for c in r["branches"]["main"] if not c["commit"]["committer"]["date"].startswith(day.isoformat())]
+    server = StandInServer(dataset, latency_ms=args.latency_ms)
+    server.start()
+    repos = sorted(dataset["repos"])
+    deliveries = _deliveries(dataset, day)
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+    def receive(log: webhook_log.WebhookLog, skip: int = -1) -> str:
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(log, SECRET))
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/github"
+        statuses = {_post(url, event, payload) for i, (event, payload) in enumerate(deliveries) if i != skip}
+        bad = _post(url, "push", deliveries[0][1], secret="wrong")
+        httpd.shutdown()
+        httpd.server_close()
+        return f"delivered {sorted(statuses)}, wrong secret -> {bad}"
+
+    print(f"Stand-in API {server.api_base}, {args.repos} repos, {len(deliveries)} deliveries for {day}")
+    t_api, hits_api, reference = _collect(server, repos, day, webhooks=False)
+    print(f"  {'api':<10} {t_api:>9.1f} ms  {hits_api:>5} requests  {reference['commits']} commits, {reference['prs']} PRs, {reference['issues']} issues")
+
+    log = _prepare_log(log_path, repos, midnight - timedelta(hours=1))
+    print(f"  receiver   {receive(log)}")
+    logged = sum(1 for r in log.records() if r.get("event") in webhook_log.EVENTS)
+    ms, hits, result = _collect(server, repos, day, webhooks=True)
+    print(f"  {'webhooks':<10} {ms:>9.1f} ms  {hits:>5} requests  identical={_same(result, reference)}  logged={logged}")
+
+    first_push = next(i for i, (event, _) in enumerate(deliveries) if event == "push")
+    log = _prepare_log(log_path, repos, midnight - timedelta(hours=1))
+    receive(log, skip=first_push)
+    # A later push on the same ref shows the gap; without one only GITHUB_WEBHOOK_AUDIT=on would.
+    ms, hits, result = _collect(server, repos, day, webhooks=True)
+    print(
+        f"  {'dropped':<10} {ms:>9.1f} ms  {hits:>5} requests  identical={_same(result, reference)}  "
+        f"gap repos={result.get('webhook_gap_repos')}"
+    )
+
+    quiet = (midnight + timedelta(minutes=5), midnight + timedelta(minutes=15))
+    log = _prepare_log(log_path, repos, midnight - timedelta(hours=1), quiet=quiet)
+    receive(log)
+    ms, hits, result = _collect(server, repos, day, webhooks=True)
+    print(
+        f"  {'down':<10} {ms:>9.1f} ms  {hits:>5} requests  identical={_same(result, reference)}  "
+        f"from log={bool(result.get('collected_via_webhooks'))}"
+    )
+
+    server.stop()
+    tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())